@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Awaitable, Literal, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from app.core.metrics import metrics
+from app.exceptions.node_exception import DeadlineExceededException
+
+TIMEOUT_EVENTS = "deadline.timeout_events"
+
+DeadlineScope = Literal["node", "agent", "run"]
+ResultLike = TypeVar("ResultLike")
+
+_current_deadline: ContextVar[Optional[float]] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+class TimeoutEvent(BaseModel):
+    scope: DeadlineScope = Field(description="The level that timed out")
+    name: str = Field(description="The node or agent that timed out")
+    timeout: float = Field(description="The time budget in seconds")
+    elapsed: float = Field(description="The elapsed time in seconds")
+    inherited: bool = Field(
+        description="Whether the budget came from an enclosing deadline"
+    )
+    occurred_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+def remaining_time() -> Optional[float]:
+    """가장 안쪽 데드라인까지 남은 시간, 데드라인이 없으면 None"""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def min_timeout(*timeouts: Optional[float]) -> Optional[float]:
+    values = [timeout for timeout in timeouts if timeout is not None]
+    return min(values) if values else None
+
+
+async def run_with_deadline(
+    awaitable: Awaitable[ResultLike],
+    timeout: Optional[float],
+    scope: DeadlineScope,
+    name: str,
+) -> ResultLike:
+    """
+    timeout 과 바깥 데드라인 중 더 이른 시각까지 awaitable 을 실행한다.
+    시간이 지나면 실행 중인 태스크를 취소하고, 타임아웃 이벤트를 기록한 뒤 DeadlineExceededException 을 던진다.
+    중첩된 에이전트는 컨텍스트 변수로 데드라인을 물려받는다.
+    """
+    started = time.monotonic()
+    parent_deadline = _current_deadline.get()
+    own_deadline = started + timeout if timeout is not None else None
+    deadline = min_timeout(parent_deadline, own_deadline)
+    if deadline is None:
+        return await awaitable
+
+    token = _current_deadline.set(deadline)
+    try:
+        return await asyncio.wait_for(awaitable, timeout=max(0.0, deadline - started))
+    except asyncio.TimeoutError as e:
+        elapsed = time.monotonic() - started
+        event = TimeoutEvent(
+            scope=scope,
+            name=name,
+            timeout=deadline - started,
+            elapsed=elapsed,
+            inherited=own_deadline is None or deadline < own_deadline,
+        )
+        metrics.record_event(TIMEOUT_EVENTS, event)
+        metrics.increment(f"deadline.{scope}.timeout")
+        logging.error("제한 시간 초과: %s %s (%.1f초)", scope, name, elapsed)
+        raise DeadlineExceededException(
+            f"{scope} '{name}' exceeded its deadline after {elapsed:.1f}s"
+        ) from e
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,280 @@
+import logging
+import os
+import posixpath
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+from app.core.metrics import metrics
+from app.core.setting import test_locator_settings
+
+TEST_LOCATOR_HIT = "test_locator.hit"
+TEST_LOCATOR_MISS = "test_locator.miss"
+TEST_LOCATOR_PARSED = "test_locator.parsed_test_files"
+TEST_LOCATOR_SCANNED = "test_locator.scanned_directories"
+
+_TEST_FILE_PATTERN = re.compile(r"\.(?:test|spec)\.[cm]?[jt]sx?$")
+# 상대 경로 import, 동적 import, require 의 모듈 경로 (vi.mock 은 import 가 아니다)
+_IMPORT_PATTERN = re.compile(
+    r"""(?:\bfrom\s+|\bimport\s+|\b(?:import|require)\s*\(\s*)['"](\.{1,2}/[^'"]+)['"]"""
+)
+_SOURCE_EXTENSIONS = (".tsx", ".ts", ".jsx", ".js", ".mts", ".mjs")
+
+
+class DirectoryEntry(BaseModel):
+    mtime_ns: int = Field(description="The directory mtime when it was scanned")
+    subdirectories: List[str] = Field(description="The names of the subdirectories")
+    test_files: List[str] = Field(description="The names of the test files")
+
+
+class TestFileEntry(BaseModel):
+    mtime_ns: int = Field(description="The test file mtime when it was parsed")
+    imports: List[str] = Field(description="The source files the test file imports")
+
+
+class TestLocatorCache(BaseModel):
+    root: str = Field(description="The indexed root directory")
+    directories: Dict[str, DirectoryEntry] = Field(default={})
+    test_files: Dict[str, TestFileEntry] = Field(default={})
+
+
+class TestLocatorIndex:
+    """
+    명명 규칙과 테스트 파일의 import 그래프로 소스 파일의 테스트 파일을 찾는 디스크 인덱스.
+    디렉터리와 테스트 파일의 mtime 이 바뀐 부분만 다시 읽는다.
+    """
+
+    def __init__(
+        self,
+        root: str = ".",
+        index_path: Optional[str] = test_locator_settings.TEST_LOCATOR_INDEX_PATH,
+        patterns: List[str] = test_locator_settings.TEST_LOCATOR_PATTERNS,
+        excluded_dirs: List[str] = test_locator_settings.TEST_LOCATOR_EXCLUDED_DIRS,
+        refresh_interval: float = test_locator_settings.TEST_LOCATOR_REFRESH_INTERVAL,
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.index_path = Path(index_path) if index_path else None
+        self.patterns = patterns
+        self.excluded_dirs = set(excluded_dirs)
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._cache = self._load_cache()
+        self._importers: Dict[str, List[str]] = {}
+        self._refreshed_at: Optional[float] = None
+
+    def locate(self, source_path: str) -> Optional[str]:
+        """
+        명명 규칙 후보를 먼저 확인하고, 없으면 소스 파일을 import 하는 테스트 파일을 찾는다.
+        소스 경로가 상대 경로면 현재 디렉터리 기준 상대 경로를, 절대 경로면 절대 경로를 돌려준다.
+        """
+        source = self._relative_path(source_path)
+        if source is None:
+            metrics.increment(TEST_LOCATOR_MISS)
+            return None
+
+        test_file = next(
+            (
+                candidate
+                for candidate in self._convention_candidates(source)
+                if (self.root / candidate).is_file()
+            ),
+            None,
+        )
+        strategy = "convention"
+        if test_file is None:
+            with self._lock:
+                if self._is_stale():
+                    self._refresh()
+                importers = self._importers.get(source, [])
+            test_file = _closest_importer(source, importers)
+            strategy = "import"
+        if test_file is None:
+            metrics.increment(TEST_LOCATOR_MISS)
+            logging.info(
+                "테스트 파일 인덱스 미스: %s (적중률 %.0f%%)",
+                source_path,
+                self.hit_rate() * 100,
+            )
+            return None
+
+        metrics.increment(TEST_LOCATOR_HIT)
+        metrics.increment(f"{TEST_LOCATOR_HIT}.{strategy}")
+        logging.info(
+            "테스트 파일 인덱스 적중(%s): %s (적중률 %.0f%%)",
+            strategy,
+            test_file,
+            self.hit_rate() * 100,
+        )
+        if Path(source_path).is_absolute():
+            return str(self.root / test_file)
+        return os.path.relpath(self.root / test_file)
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._refresh()
+
+    def hit_rate(self) -> float:
+        return metrics.hit_ratio(TEST_LOCATOR_HIT, TEST_LOCATOR_MISS)
+
+    def _convention_candidates(self, source: str) -> List[str]:
+        directory, file_name = posixpath.split(source)
+        stem, ext = posixpath.splitext(file_name)
+        return [
+            posixpath.normpath(pattern.format(dir=directory or ".", stem=stem, ext=ext))
+            for pattern in self.patterns
+        ]
+
+    def _is_stale(self) -> bool:
+        return (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= self.refresh_interval
+        )
+
+    def _refresh(self) -> None:
+        directories = self._walk()
+        test_files = {}
+        for directory, entry in directories.items():
+            for file_name in entry.test_files:
+                test_file = posixpath.normpath(posixpath.join(directory, file_name))
+                parsed = self._parse_test_file(test_file)
+                if parsed is not None:
+                    test_files[test_file] = parsed
+
+        importers: Dict[str, List[str]] = {}
+        for test_file, entry in test_files.items():
+            for source in entry.imports:
+                importers.setdefault(source, []).append(test_file)
+
+        self._cache = TestLocatorCache(
+            root=str(self.root), directories=directories, test_files=test_files
+        )
+        self._importers = importers
+        self._refreshed_at = time.monotonic()
+        self._save_cache()
+
+    def _walk(self) -> Dict[str, DirectoryEntry]:
+        """
+        mtime 이 그대로인 디렉터리는 저장된 목록을 쓰고 바뀐 디렉터리만 다시 나열한다.
+        """
+        directories = {}
+        stack = ["."]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns = os.stat(self.root / directory).st_mtime_ns
+            except OSError:
+                continue
+            entry = self._cache.directories.get(directory)
+            if entry is None or entry.mtime_ns != mtime_ns:
+                entry = self._scan_directory(directory, mtime_ns)
+            directories[directory] = entry
+            stack.extend(
+                posixpath.normpath(posixpath.join(directory, name))
+                for name in entry.subdirectories
+            )
+        return directories
+
+    def _scan_directory(self, directory: str, mtime_ns: int) -> DirectoryEntry:
+        metrics.increment(TEST_LOCATOR_SCANNED)
+        subdirectories, test_files = [], []
+        with os.scandir(self.root / directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.excluded_dirs:
+                        subdirectories.append(entry.name)
+                elif _TEST_FILE_PATTERN.search(entry.name):
+                    test_files.append(entry.name)
+        return DirectoryEntry(
+            mtime_ns=mtime_ns,
+            subdirectories=sorted(subdirectories),
+            test_files=sorted(test_files),
+        )
+
+    def _parse_test_file(self, test_file: str) -> Optional[TestFileEntry]:
+        try:
+            mtime_ns = os.stat(self.root / test_file).st_mtime_ns
+        except OSError:
+            return None
+        entry = self._cache.test_files.get(test_file)
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            return entry
+
+        metrics.increment(TEST_LOCATOR_PARSED)
+        try:
+            content = (self.root / test_file).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        directory = posixpath.dirname(test_file)
+        imports = []
+        for specifier in _IMPORT_PATTERN.findall(content):
+            source = self._resolve_import(directory, specifier)
+            if source is not None and source not in imports:
+                imports.append(source)
+        return TestFileEntry(mtime_ns=mtime_ns, imports=imports)
+
+    def _resolve_import(self, directory: str, specifier: str) -> Optional[str]:
+        base = posixpath.normpath(posixpath.join(directory, specifier))
+        candidates = [base] if base.endswith(_SOURCE_EXTENSIONS) else []
+        candidates += [base + ext for ext in _SOURCE_EXTENSIONS]
+        candidates += [
+            posixpath.join(base, "index" + ext) for ext in _SOURCE_EXTENSIONS
+        ]
+        return next(
+            (
+                candidate
+                for candidate in candidates
+                if not candidate.startswith("..") and (self.root / candidate).is_file()
+            ),
+            None,
+        )
+
+    def _relative_path(self, source_path: str) -> Optional[str]:
+        path = Path(source_path)
+        if not path.is_absolute():
+            path = Path.cwd() / path
+        try:
+            return path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def _load_cache(self) -> TestLocatorCache:
+        empty = TestLocatorCache(root=str(self.root))
+        if self.index_path is None or not self.index_path.is_file():
+            return empty
+        try:
+            cache = TestLocatorCache.model_validate_json(
+                self.index_path.read_text(encoding="utf-8")
+            )
+        except (OSError, ValidationError) as e:
+            logging.warning("테스트 파일 인덱스를 읽지 못해 새로 만듦: %r", e)
+            return empty
+        return cache if cache.root == str(self.root) else empty
+
+    def _save_cache(self) -> None:
+        if self.index_path is None:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.index_path.with_suffix(".tmp")
+        temporary_path.write_text(self._cache.model_dump_json(), encoding="utf-8")
+        temporary_path.replace(self.index_path)
+
+
+def _closest_importer(source: str, importers: List[str]) -> Optional[str]:
+    """
+    파일 이름에 소스 이름이 들어간 테스트, 경로가 가까운 테스트 순으로 고른다.
+    """
+    if not importers:
+        return None
+    stem = posixpath.splitext(posixpath.basename(source))[0]
+    return min(
+        importers,
+        key=lambda test_file: (
+            not posixpath.basename(test_file).startswith(stem + "."),
+            len(posixpath.relpath(test_file, posixpath.dirname(source) or ".")),
+            test_file,
+        ),
+    )
@@ -0,0 +1,92 @@
+import threading
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List
+
+from pydantic import BaseModel
+
+TIMING_WINDOW_SIZE = 1024
+EVENT_WINDOW_SIZE = 256
+
+
+class TimingSummary(BaseModel):
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class MetricsRegistry:
+    """
+    에이전트 실행 지표(카운터, 소요 시간)를 프로세스 단위로 수집하는 저장소
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._timings: Dict[str, TimingSummary] = defaultdict(TimingSummary)
+        self._recent_timings: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=TIMING_WINDOW_SIZE)
+        )
+        self._events: Dict[str, Deque[Any]] = defaultdict(
+            lambda: deque(maxlen=EVENT_WINDOW_SIZE)
+        )
+
+    def increment(self, name: str, value: float = 1.0) -> None:
+        with self._lock:
+            self._counters[name] += value
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            summary = self._timings[name]
+            summary.count += 1
+            summary.total += seconds
+            summary.max = max(summary.max, seconds)
+            self._recent_timings[name].append(seconds)
+
+    def record_event(self, name: str, event: Any) -> None:
+        with self._lock:
+            self._events[name].append(event)
+
+    def events(self, name: str) -> List[Any]:
+        with self._lock:
+            return list(self._events.get(name, []))
+
+    def counter(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0.0)
+
+    def timing(self, name: str) -> TimingSummary:
+        with self._lock:
+            return self._timings.get(name, TimingSummary()).model_copy()
+
+    def recent_timings(self, name: str) -> List[float]:
+        with self._lock:
+            return list(self._recent_timings.get(name, []))
+
+    def hit_ratio(self, hit_name: str, miss_name: str) -> float:
+        hits = self.counter(hit_name)
+        total = hits + self.counter(miss_name)
+        return hits / total if total else 0.0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "timings": {
+                    name: summary.model_dump()
+                    for name, summary in self._timings.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+            self._recent_timings.clear()
+            self._events.clear()
+
+
+metrics = MetricsRegistry()
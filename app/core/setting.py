@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Literal, List
+from typing import Literal, List, Optional
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
@@ -15,9 +15,69 @@ class GeminiSettings(BaseSettings):
     GEMINI_API_KEY: str = Field(default="", frozen=True)
 
 
+class RetrySettings(BaseSettings):
+    RETRY_BUDGET_PER_RUN: int = Field(default=20, frozen=True)
+    NODE_RETRY_MAX_ATTEMPTS: int = Field(default=3, frozen=True)
+    NODE_RETRY_BASE_DELAY: float = Field(default=0.5, frozen=True)
+    NODE_RETRY_MAX_DELAY: float = Field(default=8.0, frozen=True)
+    RATE_LIMIT_RETRY_MAX_ATTEMPTS: int = Field(default=5, frozen=True)
+    RATE_LIMIT_RETRY_BASE_DELAY: float = Field(default=2.0, frozen=True)
+    RATE_LIMIT_RETRY_MAX_DELAY: float = Field(default=60.0, frozen=True)
+
+
+class TimeoutSettings(BaseSettings):
+    NODE_TIMEOUT: Optional[float] = Field(default=180.0, frozen=True)
+    AGENT_TIMEOUT: Optional[float] = Field(default=600.0, frozen=True)
+    RUN_TIMEOUT: Optional[float] = Field(default=1800.0, frozen=True)
+
+
+class HedgingSettings(BaseSettings):
+    HEDGE_PERCENTILE: float = Field(default=0.95, ge=0.0, le=1.0, frozen=True)
+    HEDGE_MIN_SAMPLES: int = Field(default=20, frozen=True)
+    HEDGE_MIN_DELAY: float = Field(default=1.0, frozen=True)
+    HEDGE_BUDGET_RATIO: float = Field(default=0.1, ge=0.0, frozen=True)
+
+
+class BatchSettings(BaseSettings):
+    BATCH_CONCURRENCY: int = Field(default=8, ge=1, frozen=True)
+    BATCH_PIPELINED: bool = Field(default=False, frozen=True)
+    BATCH_PREPARE_CONCURRENCY: int = Field(default=2, ge=1, frozen=True)
+    BATCH_PIPELINE_QUEUE_SIZE: int = Field(default=2, ge=1, frozen=True)
+
+
+class CheckpointSettings(BaseSettings):
+    CHECKPOINT_PATH: str = Field(default=".checkpoints/supervisor.sqlite", frozen=True)
+    CHECKPOINT_KEEP_LAST: int = Field(default=5, ge=1, frozen=True)
+
+
+class TestLocatorSettings(BaseSettings):
+    TEST_LOCATOR_INDEX_PATH: Optional[str] = Field(
+        default=".checkpoints/test_locator.json", frozen=True
+    )
+    TEST_LOCATOR_PATTERNS: List[str] = Field(
+        default=[
+            "{dir}/__tests__/{stem}.test{ext}",
+            "{dir}/__tests__/{stem}.spec{ext}",
+            "{dir}/{stem}.test{ext}",
+            "{dir}/{stem}.spec{ext}",
+        ],
+        frozen=True,
+    )
+    TEST_LOCATOR_EXCLUDED_DIRS: List[str] = Field(
+        default=["node_modules", ".git", ".checkpoints", "dist", "build", "coverage"],
+        frozen=True,
+    )
+    TEST_LOCATOR_REFRESH_INTERVAL: float = Field(default=30.0, ge=0.0, frozen=True)
+
+
 class McpSettings(BaseSettings):
     SSE_CLIENTS: List[SseClientSchema] = Field(default=[], frozen=True)
     STDIO_CLIENTS: List[StdioClientSchema] = Field(default=[], frozen=True)
+    TOOL_CACHE_MAX_SIZE: int = Field(default=256, frozen=True)
+    TOOL_CACHE_TTL: Optional[float] = Field(default=300.0, frozen=True)
+    # 테스트 파일을 쓰고 러너를 실행하는 등 부수 효과가 있는 도구는 결과를 캐시하지 않고,
+    # 실행될 때마다 워크스페이스가 바뀌었다고 보고 캐시를 비운다
+    TOOL_CACHE_EXCLUDED_TOOLS: List[str] = Field(default=["coverage_tool"], frozen=True)
 
     class _Schema(BaseModel):
         sse_clients: List[SseClientSchema]
@@ -35,4 +95,10 @@ class McpSettings(BaseSettings):
 
 
 gemini_settings = GeminiSettings()
+retry_settings = RetrySettings()
+timeout_settings = TimeoutSettings()
+hedging_settings = HedgingSettings()
+batch_settings = BatchSettings()
+checkpoint_settings = CheckpointSettings()
+test_locator_settings = TestLocatorSettings()
 mcp_settings = McpSettings()
@@ -0,0 +1,16 @@
+import re
+from typing import Set
+
+
+def parse_lines_to_cover(lines_to_cover: str) -> Set[int]:
+    """
+    '[1, 2, 5]' 같은 lines_to_cover 문자열의 라인 번호
+    """
+    return {int(line) for line in re.findall(r"\d+", lines_to_cover)}
+
+
+def normalize_code(code: str) -> str:
+    """
+    공백 차이를 무시하고 테스트 코드를 비교하기 위한 정규화
+    """
+    return re.sub(r"\s+", " ", code).strip()
@@ -0,0 +1,272 @@
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from app.schemas.structured_output import TestFileAnalysis
+
+_TEST_CALLEES = {"test", "it"}
+_OPENING_BRACKETS = {"(": ")", "[": "]", "{": "}"}
+_CLOSING_BRACKETS = {")", "]", "}"}
+# 이 토큰 뒤의 '/' 는 나눗셈이 아니라 정규식 리터럴의 시작이다
+_REGEX_PRECEDING_PUNCTUATION = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_PRECEDING_KEYWORDS = {"return", "typeof", "case", "do", "else", "in", "of"}
+_WORD_PATTERN = re.compile(r"[A-Za-z0-9_$]+")
+
+
+class _Token(NamedTuple):
+    kind: str
+    value: str
+    line: int
+    end_line: int
+
+
+class StructuralAnalysis(BaseModel):
+    analysis: Optional[TestFileAnalysis] = Field(
+        default=None, description="The analysis found by the local scanner"
+    )
+    confident: bool = Field(
+        description="Whether the analysis can be used without the LLM"
+    )
+    reasons: List[str] = Field(
+        default=[], description="Why the scanner is not confident"
+    )
+
+
+def analyze_test_structure(test_file_content: str) -> StructuralAnalysis:
+    """
+    문자열, 주석, 템플릿 리터럴과 괄호 짝을 따라가며 최상위 import 와 test/it 호출 위치를 찾는다.
+    괄호가 맞지 않거나, 테스트가 없거나, 테스트 헤더 들여쓰기가 섞여 있으면 확신하지 않는다.
+    """
+    reasons: List[str] = []
+    tokens = _tokenize(test_file_content, reasons)
+    matches, depths = _match_brackets(tokens, reasons)
+    if reasons:
+        return StructuralAnalysis(confident=False, reasons=reasons)
+
+    lines = test_file_content.splitlines()
+    last_import_line_number = _last_import_line_number(tokens, depths)
+    tests = _test_calls(tokens, matches)
+    if not tests:
+        return StructuralAnalysis(confident=False, reasons=["no test or it call"])
+
+    indentations = set()
+    for header_line, _ in tests:
+        header = lines[header_line - 1]
+        indentation = header[: len(header) - len(header.lstrip())]
+        if "\t" in indentation:
+            reasons.append(f"tab indentation at line {header_line}")
+        indentations.add(len(indentation))
+    if len(indentations) > 1:
+        reasons.append(f"mixed test header indentation {sorted(indentations)}")
+
+    header_line, end_line = max(tests, key=lambda test: test[1])
+    last_header = lines[header_line - 1]
+    return StructuralAnalysis(
+        analysis=TestFileAnalysis(
+            test_headers_indentation=len(last_header) - len(last_header.lstrip()),
+            last_single_test_line_number=end_line,
+            last_import_line_number=last_import_line_number,
+        ),
+        confident=not reasons,
+        reasons=reasons,
+    )
+
+
+def _tokenize(source: str, reasons: List[str]) -> List[_Token]:
+    tokens: List[_Token] = []
+    # 템플릿 리터럴의 ${ 가 열린 시점의 중괄호 깊이
+    template_stack: List[int] = []
+    # 열린 템플릿 리터럴마다 (첫 토큰 위치, 시작 줄)
+    template_starts: List[Tuple[int, int]] = []
+    brace_depth = 0
+    line = 1
+    index = 0
+    length = len(source)
+
+    def scan_template(position: int) -> int:
+        nonlocal line
+        while position < length:
+            char = source[position]
+            if char == "\\":
+                position += 2
+                continue
+            if char == "\n":
+                line += 1
+            elif char == "`":
+                # ${...} 안의 토큰까지 템플릿 전체를 문자열 토큰 하나로 합친다
+                start, start_line = template_starts.pop()
+                del tokens[start:]
+                tokens.append(_Token("string", "`", start_line, line))
+                return position + 1
+            elif char == "$" and source.startswith("${", position):
+                template_stack.append(brace_depth)
+                return position + 2
+            position += 1
+        reasons.append(
+            f"unterminated template literal at line {template_starts[-1][1]}"
+        )
+        return length
+
+    while index < length:
+        char = source[index]
+        if char == "\n":
+            line += 1
+            index += 1
+        elif char.isspace():
+            index += 1
+        elif source.startswith("//", index):
+            end = source.find("\n", index)
+            index = length if end == -1 else end
+        elif source.startswith("/*", index):
+            end = source.find("*/", index + 2)
+            if end == -1:
+                reasons.append(f"unterminated block comment at line {line}")
+                return tokens
+            line += source.count("\n", index, end)
+            index = end + 2
+        elif char in "'\"":
+            start_line = line
+            index += 1
+            while index < length and source[index] not in (char, "\n"):
+                index += 2 if source[index] == "\\" else 1
+            if index >= length or source[index] == "\n":
+                reasons.append(f"unterminated string at line {start_line}")
+                return tokens
+            tokens.append(_Token("string", char, start_line, line))
+            index += 1
+        elif char == "`":
+            template_starts.append((len(tokens), line))
+            index = scan_template(index + 1)
+        elif char == "/" and _starts_regex(tokens, source, index):
+            start_line = line
+            index += 1
+            in_class = False
+            while index < length and source[index] != "\n":
+                current = source[index]
+                if current == "\\":
+                    index += 2
+                    continue
+                if current == "[":
+                    in_class = True
+                elif current == "]":
+                    in_class = False
+                elif current == "/" and not in_class:
+                    break
+                index += 1
+            if index >= length or source[index] == "\n":
+                reasons.append(f"unterminated regular expression at line {start_line}")
+                return tokens
+            index += 1
+            while index < length and source[index].isalpha():
+                index += 1
+            tokens.append(_Token("regex", "/", start_line, line))
+        elif char == "}" and template_stack and template_stack[-1] == brace_depth:
+            template_stack.pop()
+            index = scan_template(index + 1)
+        else:
+            word = _WORD_PATTERN.match(source, index)
+            if word:
+                tokens.append(_Token("word", word.group(), line, line))
+                index = word.end()
+                continue
+            if char == "{":
+                brace_depth += 1
+            elif char == "}":
+                brace_depth -= 1
+            tokens.append(_Token("punct", char, line, line))
+            index += 1
+    return tokens
+
+
+def _starts_regex(tokens: List[_Token], source: str, index: int) -> bool:
+    if not tokens:
+        return True
+    previous = tokens[-1]
+    # JSX 의 </Button> 과 <Button /> 는 정규식이 아니다
+    if (previous.kind == "punct" and previous.value == "<") or source.startswith(
+        "/>", index
+    ):
+        return False
+    if previous.kind == "punct":
+        return previous.value in _REGEX_PRECEDING_PUNCTUATION
+    return previous.kind == "word" and previous.value in _REGEX_PRECEDING_KEYWORDS
+
+
+def _match_brackets(tokens: List[_Token], reasons: List[str]):
+    matches: Dict[int, int] = {}
+    depths: List[int] = []
+    stack: List[int] = []
+    for index, token in enumerate(tokens):
+        if token.kind == "punct" and token.value in _CLOSING_BRACKETS:
+            if not stack or _OPENING_BRACKETS[tokens[stack[-1]].value] != token.value:
+                reasons.append(f"unbalanced '{token.value}' at line {token.line}")
+                return matches, depths
+            matches[stack.pop()] = index
+        depths.append(len(stack))
+        if token.kind == "punct" and token.value in _OPENING_BRACKETS:
+            stack.append(index)
+    if stack:
+        reasons.append(
+            f"unclosed '{tokens[stack[-1]].value}' at line {tokens[stack[-1]].line}"
+        )
+    return matches, depths
+
+
+def _last_import_line_number(tokens: List[_Token], depths: List[int]) -> int:
+    """
+    최상위 import 문이 끝나는 줄(모듈 경로 문자열의 줄) 중 가장 마지막 줄, 없으면 0
+    """
+    last_line = 0
+    for index, token in enumerate(tokens):
+        if token.kind != "word" or token.value != "import" or depths[index] != 0:
+            continue
+        if index > 0 and tokens[index - 1].value == ".":
+            continue
+        following = tokens[index + 1] if index + 1 < len(tokens) else None
+        if following is None or following.value in ("(", "."):
+            continue
+        if following.kind == "string":
+            last_line = max(last_line, following.end_line)
+            continue
+        for position in range(index + 1, len(tokens) - 1):
+            if depths[position] != 0:
+                continue
+            if tokens[position].value == ";":
+                break
+            if (
+                tokens[position].value == "from"
+                and tokens[position + 1].kind == "string"
+            ):
+                last_line = max(last_line, tokens[position + 1].end_line)
+                break
+    return last_line
+
+
+def _test_calls(tokens: List[_Token], matches: Dict[int, int]) -> List[Tuple[int, int]]:
+    """
+    test(...), it.only(...), test.each([...])(...), test.each`...`(...) 같은 호출의 (헤더 줄, 닫는 괄호 줄) 목록
+    """
+    calls = []
+    for index, token in enumerate(tokens):
+        if token.kind != "word" or token.value not in _TEST_CALLEES:
+            continue
+        if index > 0 and tokens[index - 1].value in (".", "function"):
+            continue
+        position = index + 1
+        while (
+            position + 1 < len(tokens)
+            and tokens[position].value == "."
+            and tokens[position + 1].kind == "word"
+        ):
+            position += 2
+        # test.each`table`(...) 처럼 태그드 템플릿 뒤에 오는 호출
+        if position < len(tokens) and tokens[position].kind == "string":
+            position += 1
+        if position >= len(tokens) or tokens[position].value != "(":
+            continue
+        end = matches[position]
+        while end + 1 < len(tokens) and tokens[end + 1].value == "(":
+            end = matches[end + 1]
+        calls.append((token.line, tokens[end].end_line))
+    return calls
@@ -0,0 +1,118 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from pydantic import BaseModel, Field
+
+LLM_STAGE = "llm"
+RUNNER_STAGE = "runner"
+
+
+class StageUtilization(BaseModel):
+    busy_seconds: float = Field(
+        default=0.0, description="The time with at least one active call"
+    )
+    concurrency_seconds: float = Field(
+        default=0.0, description="The integral of active calls over time"
+    )
+    max_concurrency: int = Field(default=0, description="The peak number of calls")
+
+
+class UtilizationReport(BaseModel):
+    wall_seconds: float = Field(description="The length of the measured window")
+    overlap_seconds: float = Field(
+        description="The time with two or more stages active at once"
+    )
+    stages: Dict[str, StageUtilization] = Field(description="The usage per stage")
+
+    def busy_ratio(self, stage: str) -> float:
+        if not self.wall_seconds or stage not in self.stages:
+            return 0.0
+        return self.stages[stage].busy_seconds / self.wall_seconds
+
+    def mean_concurrency(self, stage: str) -> float:
+        if not self.wall_seconds or stage not in self.stages:
+            return 0.0
+        return self.stages[stage].concurrency_seconds / self.wall_seconds
+
+    def capacity_ratio(self, stage: str, capacity: int) -> float:
+        return self.mean_concurrency(stage) / capacity if capacity else 0.0
+
+    def summary(self, capacity: Optional[Dict[str, int]] = None) -> str:
+        lines = [
+            f"wall {self.wall_seconds:.2f}s, overlap {self.overlap_seconds:.2f}s"
+            f" ({self.overlap_seconds / self.wall_seconds if self.wall_seconds else 0:.0%})"
+        ]
+        for stage, usage in sorted(self.stages.items()):
+            line = (
+                f"{stage:<7} busy {self.busy_ratio(stage):4.0%}"
+                f"  mean {self.mean_concurrency(stage):5.2f}"
+                f"  max {usage.max_concurrency}"
+            )
+            if capacity and stage in capacity:
+                line += f"  capacity {self.capacity_ratio(stage, capacity[stage]):4.0%}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+class UtilizationTracker:
+    """
+    단계(llm, runner)별 동시 실행 수를 시간에 대해 적분해 실제로 쓰인 동시성을 측정한다
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._started = time.monotonic()
+            self._last_change = self._started
+            self._active: Dict[str, int] = {}
+            self._stages: Dict[str, StageUtilization] = {}
+            self._overlap_seconds = 0.0
+
+    @contextmanager
+    def track(self, stage: str) -> Iterator[None]:
+        self._change(stage, 1)
+        try:
+            yield
+        finally:
+            self._change(stage, -1)
+
+    def report(self) -> UtilizationReport:
+        with self._lock:
+            self._advance(time.monotonic())
+            return UtilizationReport(
+                wall_seconds=self._last_change - self._started,
+                overlap_seconds=self._overlap_seconds,
+                stages={
+                    stage: usage.model_copy() for stage, usage in self._stages.items()
+                },
+            )
+
+    def _change(self, stage: str, delta: int) -> None:
+        with self._lock:
+            self._advance(time.monotonic())
+            active = self._active.get(stage, 0) + delta
+            self._active[stage] = active
+            usage = self._stages.setdefault(stage, StageUtilization())
+            usage.max_concurrency = max(usage.max_concurrency, active)
+
+    def _advance(self, now: float) -> None:
+        elapsed = now - self._last_change
+        busy_stages = 0
+        for stage, active in self._active.items():
+            if active <= 0:
+                continue
+            busy_stages += 1
+            usage = self._stages[stage]
+            usage.busy_seconds += elapsed
+            usage.concurrency_seconds += active * elapsed
+        if busy_stages >= 2:
+            self._overlap_seconds += elapsed
+        self._last_change = now
+
+
+utilization = UtilizationTracker()
@@ -0,0 +1,35 @@
+import re
+from typing import Optional, Set
+
+_TEST_TITLE_PATTERN = re.compile(r"\b(?:it|test)(?:\.\w+)*\s*\(\s*(['\"`])(.+?)\1")
+_FAILURE_MARKERS = ("FAIL", "×", "✗", "✕")
+_DURATION_SUFFIX = re.compile(r"\s+\d+(?:\.\d+)?\s*m?s$")
+
+
+def extract_test_title(test_code: str) -> Optional[str]:
+    """
+    test('...') 또는 it('...') 로 선언된 첫 테스트의 제목
+    """
+    match = _TEST_TITLE_PATTERN.search(test_code)
+    return match.group(2) if match else None
+
+
+def parse_failed_test_titles(output: str) -> Set[str]:
+    """
+    vitest 리포터 출력에서 실패한 테스트의 제목을 모은다.
+    'FAIL  src/a.test.tsx > describe > title' 과 '× describe > title 5ms' 형식을 모두 읽는다.
+    """
+    titles = set()
+    for line in output.splitlines():
+        stripped = line.strip()
+        marker = next(
+            (marker for marker in _FAILURE_MARKERS if stripped.startswith(marker)),
+            None,
+        )
+        if marker is None:
+            continue
+        title = stripped[len(marker) :].split(" > ")[-1]
+        title = _DURATION_SUFFIX.sub("", title).strip()
+        if title:
+            titles.add(title)
+    return titles
@@ -11,3 +11,18 @@ class ToolNodeException(Exception):
 class EmptyOutputException(Exception):
     def __init__(self, message: str = "Empty structured output") -> None:
         super().__init__(message)
+
+
+class TestFileNotFoundException(Exception):
+    def __init__(self, message: str = "Test file content not found") -> None:
+        super().__init__(message)
+
+
+class DeadlineExceededException(Exception):
+    def __init__(self, message: str = "Deadline exceeded") -> None:
+        super().__init__(message)
+
+
+class ModelCascadeExhaustedException(Exception):
+    def __init__(self, message: str = "All model tiers failed") -> None:
+        super().__init__(message)
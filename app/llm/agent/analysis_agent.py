@@ -1,8 +1,10 @@
+from typing import AsyncIterator, List, Optional
 from langchain_core.language_models import BaseChatModel
 from langgraph.graph.graph import CompiledGraph
 
 from app.llm.agent.base import BaseAgentBuilder
 from app.prompts.analysis_prompt import TestAnalysisPrompt
+from app.schemas.agent_event import AgentEvent
 from app.schemas.state import TestAnalysisState
 from app.schemas.structured_output import TestFileAnalysis
 
@@ -12,33 +14,49 @@ class TestAnalysisAgent(BaseAgentBuilder):
     테스트 코드의 분석을 수행하는 에이전트
     """
 
+    role = "analysis"
+
     def __init__(
         self,
         model: BaseChatModel,
+        fallback_models: List[BaseChatModel] = [],
+        output_model: Optional[BaseChatModel] = None,
     ):
         super().__init__(
             model=model,
             tools=[],
+            fallback_models=fallback_models,
+            output_model=output_model,
             tool_call_mode="none",
         )
 
     def build(self) -> CompiledGraph:
         return self.create_agentic_graph(
             state_schema=TestAnalysisState,
-            llm_node=self.create_llm_node(),
+            llm_node=self.create_llm_node(output_schema=TestFileAnalysis),
             output_node=self.create_output_node(TestFileAnalysis),
-        ).compile()
+        ).compile(checkpointer=False)
 
     async def analyze_vitest(
         self,
         test_file_content: str,
     ) -> TestFileAnalysis:
-        agent = self.build()
-        response = await agent.ainvoke(
-            TestAnalysisState(
-                messages=TestAnalysisPrompt(
-                    test_file_content=test_file_content,
-                ).build()
-            )
+        response = await self.ainvoke_agent(
+            self._build_state(test_file_content=test_file_content)
         )
         return response["structured_response"]
+
+    def astream_analyze_vitest(
+        self,
+        test_file_content: str,
+    ) -> AsyncIterator[AgentEvent]:
+        return self.astream_agent(
+            self._build_state(test_file_content=test_file_content)
+        )
+
+    def _build_state(self, test_file_content: str) -> TestAnalysisState:
+        return TestAnalysisState(
+            messages=TestAnalysisPrompt(
+                test_file_content=test_file_content,
+            ).build()
+        )
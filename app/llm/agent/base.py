@@ -1,5 +1,11 @@
+import asyncio
+import contextlib
+import functools
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import (
     Literal,
     Optional,
@@ -10,44 +16,124 @@ from typing import (
     TypeVar,
     Coroutine,
     Any,
+    Hashable,
+    ClassVar,
+    Tuple,
+    Dict,
+    AsyncIterator,
+    Awaitable,
+    Set,
 )
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import BaseMessage, AIMessage, ToolMessage
+from langchain_core.messages import (
+    BaseMessage,
+    BaseMessageChunk,
+    AIMessage,
+    ToolCall,
+    ToolMessage,
+    message_chunk_to_message,
+)
+from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_core.tools import BaseTool
-from langgraph.graph import StateGraph
+from langgraph.graph import END, StateGraph
 from langgraph.prebuilt.chat_agent_executor import (
     AgentStateWithStructuredResponsePydantic,
 )
 from langgraph.graph.graph import CompiledGraph
-from langgraph.prebuilt import ToolNode
-from langgraph.types import RetryPolicy
-from pydantic import BaseModel
+from langgraph.errors import GraphBubbleUp
+from pydantic import BaseModel, ValidationError
 
+from app.core.deadline import (
+    DeadlineScope,
+    min_timeout,
+    remaining_time,
+    run_with_deadline,
+)
+from app.core.metrics import metrics
+from app.core.setting import retry_settings, timeout_settings
+from app.core.utilization import LLM_STAGE, RUNNER_STAGE, utilization
 from app.exceptions.node_exception import (
     InvalidReasoningException,
     EmptyOutputException,
+    ModelCascadeExhaustedException,
 )
+from app.llm.hedging import RequestHedger
+from app.llm.message_compactor import MessageCompactor
+from app.llm.model_usage import record_model_usage
+from app.llm.output_parser import parse_output_locally
+from app.llm.retry import AdaptiveRetryPolicy, RetryRule
+from app.schemas.agent_event import AgentEvent
+from app.schemas.state import ModelTierStats, ToolCallStats
 
 AgentStateLike = TypeVar(
     "AgentStateLike", bound=AgentStateWithStructuredResponsePydantic
 )
 OutputLike = TypeVar("OutputLike", bound=BaseModel)
+ResultLike = TypeVar("ResultLike")
 
 LLM_NODE = "llm_node"
 TOOL_NODE = "tool_node"
 OUTPUT_NODE = "output_node"
 
-retry_policy = RetryPolicy(
-    retry_on=lambda e: isinstance(e, InvalidReasoningException)
-    or isinstance(e, EmptyOutputException),
-    max_attempts=3,
-    initial_interval=2.0,
-    backoff_factor=4.0,
+StructuredOutputMode = Literal["parse", "native"]
+
+OUTPUT_PARSER_LOCAL_HIT = "output_parser.local_hit"
+OUTPUT_PARSER_LOCAL_MISS = "output_parser.local_miss"
+BIND_TOOLS_CACHE_HIT = "bind_tools.cache_hit"
+BIND_TOOLS_CACHE_MISS = "bind_tools.cache_miss"
+BIND_TOOLS_CACHE_SIZE = 128
+TOOL_METRIC_PREFIX = "tool"
+TURN_LIMIT_REACHED = "agent.turn_limit_reached"
+MODEL_CASCADE_PREFIX = "model_cascade"
+MODEL_CASCADE_ESCALATION = "model_cascade.escalation"
+
+_node_retry_rule = RetryRule(
+    max_attempts=retry_settings.NODE_RETRY_MAX_ATTEMPTS,
+    base_delay=retry_settings.NODE_RETRY_BASE_DELAY,
+    max_delay=retry_settings.NODE_RETRY_MAX_DELAY,
+)
+retry_policy = AdaptiveRetryPolicy(
+    rules={
+        InvalidReasoningException: _node_retry_rule,
+        EmptyOutputException: _node_retry_rule,
+    },
+    rate_limit_rule=RetryRule(
+        max_attempts=retry_settings.RATE_LIMIT_RETRY_MAX_ATTEMPTS,
+        base_delay=retry_settings.RATE_LIMIT_RETRY_BASE_DELAY,
+        max_delay=retry_settings.RATE_LIMIT_RETRY_MAX_DELAY,
+    ),
 )
 
 
 class BaseAgentBuilder(ABC):
+    # parse: llm_node 결과를 output_node 에서 한 번 더 호출해 파싱한다
+    # native: llm_node 가 스키마를 직접 생성하고 output_node 를 생략한다
+    structured_output_mode: ClassVar[StructuredOutputMode] = "parse"
+    # 한 AIMessage 안의 도구 호출을 동시에 실행할 최대 개수
+    tool_concurrency: ClassVar[int] = 4
+    # 도구별 제한 시간(초), tool_timeouts 에 없는 도구는 tool_timeout 을 따른다
+    tool_timeout: ClassVar[Optional[float]] = 120.0
+    tool_timeouts: ClassVar[Dict[str, float]] = {}
+    # 테스트 러너를 실행하는 도구, 이 도구의 실행 시간만 runner 단계 사용률로 집계한다
+    runner_tool_names: ClassVar[Set[str]] = {"coverage_tool"}
+    # llm_node 실행 횟수 상한, 도달하면 더 이상 도구를 호출하지 않고 최종 출력을 만든다
+    max_turns: ClassVar[Optional[int]] = 10
+    # 설정되면 message_builder 결과를 토큰 예산 안으로 압축한 뒤 모델에 전달한다
+    message_compactor: ClassVar[Optional[MessageCompactor]] = None
+    # llm_node, output_node 에 적용하는 재시도 정책
+    node_retry_policy: ClassVar[AdaptiveRetryPolicy] = retry_policy
+    # 노드 한 번, 에이전트 호출 한 번에 허용하는 시간(초), 바깥 데드라인이 더 이르면 그쪽을 따른다
+    node_timeout: ClassVar[Optional[float]] = timeout_settings.NODE_TIMEOUT
+    agent_timeout: ClassVar[Optional[float]] = timeout_settings.AGENT_TIMEOUT
+    deadline_scope: ClassVar[DeadlineScope] = "agent"
+    # llm_node 가 astream 으로 응답을 받아 토큰 단위 이벤트를 흘려보낸다
+    streaming: ClassVar[bool] = False
+    # 모델 라우팅과 역할별 사용량 지표에서 쓰는 역할 이름
+    role: ClassVar[str] = "agent"
+    # 설정되면 llm_node, output_node 의 모델 호출이 지연될 때 중복 요청을 보낸다
+    request_hedger: ClassVar[Optional[RequestHedger]] = None
+
     def __init__(
         self,
         model: BaseChatModel,
@@ -55,30 +141,156 @@ class BaseAgentBuilder(ABC):
         tool_call_mode: Literal[
             "multi_turn", "multi_turn_with_force_tool_call", "single_turn", "none"
         ] = "single_turn",
+        fallback_models: List[BaseChatModel] = [],
+        output_model: Optional[BaseChatModel] = None,
     ):
         self.model = model
+        # model 이 InvalidReasoning, EmptyOutput 으로 실패하면 순서대로 넘어갈 상위 모델
+        self.fallback_models = fallback_models
+        # output_node 의 파싱 전용 모델, 실패하면 models 로 넘어간다
+        self.output_model = output_model
         self.tools = tools
         self.tool_call_mode = tool_call_mode
+        self._compiled_graph: Optional[CompiledGraph] = None
+        self._compiled_graph_key: Optional[Hashable] = None
 
     @abstractmethod
     def build(self, *args, **kwargs) -> CompiledGraph:
         pass
 
+    @property
+    def models(self) -> List[BaseChatModel]:
+        return [self.model, *self.fallback_models]
+
+    @property
+    def output_models(self) -> List[BaseChatModel]:
+        if self.output_model is None or self.output_model is self.model:
+            return self.models
+        return [self.output_model, *self.models]
+
+    def get_agent(self) -> CompiledGraph:
+        """
+        컴파일된 그래프를 인스턴스 단위로 캐싱해 반환한다.
+        모델, 도구 목록, 도구 호출 모드가 바뀌면 다음 호출에서 다시 컴파일한다.
+        """
+        key = self._graph_cache_key()
+        if self._compiled_graph is None or self._compiled_graph_key != key:
+            logging.info("에이전트 그래프 컴파일: %s", type(self).__name__)
+            self._compiled_graph = self.build()
+            self._compiled_graph_key = key
+        return self._compiled_graph
+
+    async def ainvoke_agent(
+        self, state: Optional[AgentStateLike], config: Optional[RunnableConfig] = None
+    ) -> dict:
+        """
+        캐싱된 그래프를 agent_timeout 안에서 실행한다.
+        state 가 None 이면 config 의 체크포인트에서 이어서 실행한다.
+        """
+        return await run_with_deadline(
+            self.get_agent().ainvoke(state, config),
+            timeout=self.agent_timeout,
+            scope=self.deadline_scope,
+            name=type(self).__name__,
+        )
+
+    async def astream_agent(self, state: AgentStateLike) -> AsyncIterator[AgentEvent]:
+        """
+        그래프 실행 중 노드 전환, 토큰, 도구 호출 이벤트를 순서대로 내보내고 마지막에 output 이벤트를 낸다.
+        첫 토큰까지 걸린 시간은 stream.<에이전트>.time_to_first_token 으로 기록한다.
+        """
+        agent_name = type(self).__name__
+        started = time.perf_counter()
+        first_token_seen = False
+        # 하위 노드와 도구가 데드라인을 물려받도록 별도 태스크에서 run_with_deadline 으로 실행한다
+        events: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        async def produce() -> None:
+            async for event in self.get_agent().astream_events(state, version="v2"):
+                events.put_nowait(event)
+
+        async def run() -> None:
+            try:
+                await run_with_deadline(
+                    produce(),
+                    timeout=self.agent_timeout,
+                    scope=self.deadline_scope,
+                    name=agent_name,
+                )
+            finally:
+                events.put_nowait(finished)
+
+        producer = asyncio.create_task(run())
+        try:
+            while (event := await events.get()) is not finished:
+                elapsed = time.perf_counter() - started
+                agent_event = _to_agent_event(event, elapsed)
+                if agent_event is None:
+                    continue
+                if agent_event.type == "token" and not first_token_seen:
+                    first_token_seen = True
+                    metrics.observe(f"stream.{agent_name}.time_to_first_token", elapsed)
+                yield agent_event
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await producer
+
+    def invalidate_agent(self) -> None:
+        self._compiled_graph = None
+        self._compiled_graph_key = None
+
+    def _graph_cache_key(self) -> Hashable:
+        # 캐싱된 그래프가 모델과 도구를 참조하고 있으므로 id 가 재사용되지 않는다
+        return (
+            tuple(id(model) for model in self.output_models),
+            tuple(id(tool) for tool in self.tools),
+            self.tool_call_mode,
+            self.structured_output_mode,
+        )
+
     def create_agentic_graph(
         self,
         state_schema: Type[AgentStateLike],
         llm_node: Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]],
-        output_node: Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]],
+        output_node: Optional[
+            Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]]
+        ] = None,
         tools: Optional[List[BaseTool]] = None,
     ) -> StateGraph:
         if tools is None:
             tools = self.tools
+        native_output = self.structured_output_mode == "native"
+        if not native_output and output_node is None:
+            raise ValueError("output_node is required in parse mode")
 
         workflow = StateGraph(state_schema)
 
-        workflow.add_node(LLM_NODE, llm_node, retry=retry_policy)
-        workflow.add_node(TOOL_NODE, ToolNode(tools))
-        workflow.add_node(OUTPUT_NODE, output_node, retry=retry_policy)
+        workflow.add_node(
+            LLM_NODE,
+            self.node_retry_policy.wrap(self._with_node_timeout(llm_node, LLM_NODE)),
+        )
+        workflow.add_node(
+            TOOL_NODE,
+            self._with_node_timeout(self.create_tool_node(tools), TOOL_NODE),
+        )
+        if not native_output:
+            workflow.add_node(
+                OUTPUT_NODE,
+                self.node_retry_policy.wrap(
+                    self._with_node_timeout(output_node, OUTPUT_NODE)
+                ),
+            )
+
+        def route_from_llm_node(
+            state: AgentStateLike,
+        ) -> Literal["tool_node", "__end__"]:
+            if state.structured_response is not None:
+                return END
+            return TOOL_NODE
 
         def route_from_tool_node(
             state: AgentStateLike,
@@ -86,6 +298,11 @@ class BaseAgentBuilder(ABC):
             if len(state.messages) == 0:
                 raise Exception("No messages in state")
 
+            if self._turn_limit_reached(state):
+                logging.warning("최대 추론 횟수 도달: %s", type(self).__name__)
+                metrics.increment(TURN_LIMIT_REACHED)
+                return OUTPUT_NODE
+
             if _is_tool_message_error(state.messages[-1]):
                 return LLM_NODE
 
@@ -93,26 +310,64 @@ class BaseAgentBuilder(ABC):
                 return OUTPUT_NODE
             elif self.tool_call_mode == "single_turn":
                 return OUTPUT_NODE
-            elif self.tool_call_mode == "multi_turn":
+            elif self.tool_call_mode in (
+                "multi_turn",
+                "multi_turn_with_force_tool_call",
+            ):
                 if isinstance(state.messages[-1], ToolMessage):
                     return LLM_NODE
                 else:
                     return OUTPUT_NODE
 
         workflow.set_entry_point(LLM_NODE)
-        workflow.add_edge(LLM_NODE, TOOL_NODE)
-        workflow.add_conditional_edges(
-            TOOL_NODE,
-            route_from_tool_node,
-            {
-                LLM_NODE: LLM_NODE,
-                OUTPUT_NODE: OUTPUT_NODE,
-            },
-        )
-        workflow.set_finish_point(OUTPUT_NODE)
+        if native_output:
+            # 최종 응답 역시 llm_node 가 생성하므로 output_node 대신 llm_node 로 돌아간다
+            workflow.add_conditional_edges(
+                LLM_NODE,
+                route_from_llm_node,
+                {
+                    TOOL_NODE: TOOL_NODE,
+                    END: END,
+                },
+            )
+            workflow.add_conditional_edges(
+                TOOL_NODE,
+                route_from_tool_node,
+                {
+                    LLM_NODE: LLM_NODE,
+                    OUTPUT_NODE: LLM_NODE,
+                },
+            )
+        else:
+            workflow.add_edge(LLM_NODE, TOOL_NODE)
+            workflow.add_conditional_edges(
+                TOOL_NODE,
+                route_from_tool_node,
+                {
+                    LLM_NODE: LLM_NODE,
+                    OUTPUT_NODE: OUTPUT_NODE,
+                },
+            )
+            workflow.set_finish_point(OUTPUT_NODE)
 
         return workflow
 
+    def _with_node_timeout(
+        self,
+        node: Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]],
+        node_name: str,
+    ) -> Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]]:
+        @functools.wraps(node)
+        async def node_with_timeout(state: AgentStateLike) -> AgentStateLike:
+            return await run_with_deadline(
+                node(state),
+                timeout=self.node_timeout,
+                scope="node",
+                name=f"{type(self).__name__}.{node_name}",
+            )
+
+        return node_with_timeout
+
     def create_llm_node(
         self,
         model: Optional[BaseChatModel] = None,
@@ -120,27 +375,290 @@ class BaseAgentBuilder(ABC):
         message_builder: Callable[
             [AgentStateLike], Sequence[BaseMessage]
         ] = lambda state: state.messages,
+        output_schema: Optional[Type[BaseModel]] = None,
     ) -> Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]]:
-        if model is None:
-            model = self.model
+        # model 을 지정하지 않으면 self.models 순서대로 캐스케이드한다
+        models = self.models if model is None else [model]
         if tools is None:
             tools = self.tools
 
+        if self.structured_output_mode == "native":
+            if output_schema is None:
+                raise ValueError("output_schema is required in native mode")
+            nodes = [
+                self._create_native_llm_node(
+                    model, tools, message_builder, output_schema
+                )
+                for model in models
+            ]
+        else:
+            nodes = [
+                self._create_parse_llm_node(model, tools, message_builder)
+                for model in models
+            ]
+        return self._with_model_cascade(nodes)
+
+    def _with_model_cascade(
+        self,
+        nodes: List[Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]]],
+    ) -> Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]]:
+        @functools.wraps(nodes[0])
+        async def cascade_node(state: AgentStateLike) -> AgentStateLike:
+            result, tier_stats = await self._run_model_cascade(
+                [functools.partial(node, state) for node in nodes], node_type="llm"
+            )
+            return {**result, "model_tier_stats": tier_stats}
+
+        return cascade_node
+
+    async def _run_model_cascade(
+        self,
+        calls: List[Callable[[], Awaitable[ResultLike]]],
+        node_type: str,
+    ) -> Tuple[ResultLike, ModelTierStats]:
+        """
+        모델 단계별 호출을 순서대로 시도한다.
+        InvalidReasoning, EmptyOutput 은 같은 모델로 반복하지 않고 다음 단계로 넘긴다.
+        단계가 하나면 실패를 그대로 던져 노드 재시도에 맡기고, 여러 단계를 모두 실패하면
+        재시도 규칙에 없는 ModelCascadeExhaustedException 을 던져 캐스케이드를 처음부터 반복하지 않는다.
+        """
+        agent_name = type(self).__name__
+        for tier, call in enumerate(calls):
+            try:
+                if self.request_hedger is None:
+                    result = await call()
+                else:
+                    result = await self.request_hedger.run(
+                        f"{self.role}.{node_type}.tier_{tier}", call
+                    )
+            except (InvalidReasoningException, EmptyOutputException) as e:
+                if len(calls) == 1:
+                    raise
+                if tier == len(calls) - 1:
+                    raise ModelCascadeExhaustedException(
+                        f"{agent_name} {node_type} 모델 {len(calls)}단계 모두 실패: {e!r}"
+                    ) from e
+                metrics.increment(MODEL_CASCADE_ESCALATION)
+                logging.warning(
+                    "%s 모델 %d단계 실패, 다음 단계로 넘어감: %r", agent_name, tier, e
+                )
+                continue
+            metrics.increment(f"{MODEL_CASCADE_PREFIX}.{agent_name}.tier_{tier}")
+            return result, ModelTierStats(answered_by_tier={tier: 1}, escalations=tier)
+
+    def _create_parse_llm_node(
+        self,
+        model: BaseChatModel,
+        tools: List[BaseTool],
+        message_builder: Callable[[AgentStateLike], Sequence[BaseMessage]],
+    ) -> Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]]:
         async def llm_node(state: AgentStateLike) -> AgentStateLike:
             logging.info("에이전트 추론 중...")
-            model_with_tools = model.bind_tools(tools)
-            inputs = message_builder(state)
-            new_message: BaseMessage = await model_with_tools.ainvoke(inputs)
+            model_with_tools = bind_tools_cached(model, tools)
+            inputs = self._compact_messages(message_builder(state))
+            new_message: BaseMessage = await self._ainvoke_model(
+                model_with_tools, inputs
+            )
             if not self._is_valid_reasoning(new_message, state):
                 logging.error("Invalid reasoning exception")
                 raise InvalidReasoningException()
             logging.info("도구 선택: %s", new_message.tool_calls)
             return {
                 "messages": [new_message],
+                "tool_call_stats": ToolCallStats(turns=1),
             }
 
         return llm_node
 
+    def _create_native_llm_node(
+        self,
+        model: BaseChatModel,
+        tools: List[BaseTool],
+        message_builder: Callable[[AgentStateLike], Sequence[BaseMessage]],
+        output_schema: Type[BaseModel],
+    ) -> Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]]:
+        output_tool_name = output_schema.__name__
+
+        async def llm_node(state: AgentStateLike) -> AgentStateLike:
+            logging.info("에이전트 추론 중... (단일 호출 구조화 출력)")
+            inputs = self._compact_messages(message_builder(state))
+
+            if self._should_respond_directly(state):
+                model_with_output = model.with_structured_output(
+                    output_schema, include_raw=True
+                )
+                started = time.perf_counter()
+                with utilization.track(LLM_STAGE):
+                    result = await model_with_output.ainvoke(inputs)
+                record_model_usage(self.role, "llm", started, result["raw"])
+                if result["parsed"] is None:
+                    raise EmptyOutputException()
+                logging.info("매핑 결과: %s", result["parsed"])
+                return {
+                    "messages": [result["raw"]],
+                    "structured_response": result["parsed"],
+                    "tool_call_stats": ToolCallStats(turns=1),
+                }
+
+            # 출력 스키마를 응답용 도구로 함께 바인딩한다
+            model_with_tools = bind_tools_cached(model, [*tools, output_schema])
+            new_message: BaseMessage = await self._ainvoke_model(
+                model_with_tools, inputs
+            )
+            if not isinstance(new_message, AIMessage):
+                raise InvalidReasoningException()
+
+            output_calls = [
+                tool_call
+                for tool_call in new_message.tool_calls
+                if tool_call["name"] == output_tool_name
+            ]
+            if not output_calls:
+                if _is_empty_tool_calls(new_message):
+                    raise EmptyOutputException()
+                if not self._is_valid_reasoning(new_message, state):
+                    logging.error("Invalid reasoning exception")
+                    raise InvalidReasoningException()
+                logging.info("도구 선택: %s", new_message.tool_calls)
+                return {
+                    "messages": [new_message],
+                    "tool_call_stats": ToolCallStats(turns=1),
+                }
+
+            if self.tool_call_mode in (
+                "single_turn",
+                "multi_turn_with_force_tool_call",
+            ) and _no_tool_calls_in_messages(state):
+                logging.error("Invalid reasoning exception")
+                raise InvalidReasoningException()
+            try:
+                response = output_schema.model_validate(output_calls[-1]["args"])
+            except ValidationError as e:
+                raise EmptyOutputException(str(e)) from e
+            logging.info("매핑 결과: %s", response)
+            return {
+                "messages": [new_message],
+                "structured_response": response,
+                "tool_call_stats": ToolCallStats(turns=1),
+            }
+
+        return llm_node
+
+    async def _ainvoke_model(
+        self, runnable: Runnable, inputs: Sequence[BaseMessage]
+    ) -> BaseMessage:
+        started = time.perf_counter()
+        if not self.streaming:
+            with utilization.track(LLM_STAGE):
+                message = await runnable.ainvoke(inputs)
+            record_model_usage(self.role, "llm", started, message)
+            return message
+
+        merged: Optional[BaseMessageChunk] = None
+        with utilization.track(LLM_STAGE):
+            async for chunk in runnable.astream(inputs):
+                merged = chunk if merged is None else merged + chunk
+        if merged is None:
+            raise EmptyOutputException("Empty streamed response")
+        record_model_usage(self.role, "llm", started, merged)
+        return message_chunk_to_message(merged)
+
+    def _should_respond_directly(self, state: AgentStateLike) -> bool:
+        if self.tool_call_mode == "none" or self._turn_limit_reached(state):
+            return True
+        if self.tool_call_mode == "single_turn":
+            return not _no_tool_calls_in_messages(state)
+        return False
+
+    def create_tool_node(
+        self,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]]:
+        if tools is None:
+            tools = self.tools
+        tools_by_name = {tool.name: tool for tool in tools}
+
+        async def tool_node(state: AgentStateLike) -> AgentStateLike:
+            message = state.messages[-1] if state.messages else None
+            if not isinstance(message, AIMessage) or _is_empty_tool_calls(message):
+                return {"messages": []}
+
+            semaphore = asyncio.Semaphore(max(1, self.tool_concurrency))
+
+            async def run_with_limit(tool_call: ToolCall) -> ToolMessage:
+                async with semaphore:
+                    return await self._run_tool_call(tools_by_name, tool_call)
+
+            tool_messages = await asyncio.gather(
+                *[run_with_limit(tool_call) for tool_call in message.tool_calls]
+            )
+            errored = sum(_is_tool_message_error(msg) for msg in tool_messages)
+            return {
+                "messages": list(tool_messages),
+                "tool_call_stats": ToolCallStats(
+                    successful_tool_calls=len(tool_messages) - errored,
+                    errored_tool_calls=errored,
+                ),
+            }
+
+        return tool_node
+
+    async def _run_tool_call(
+        self,
+        tools_by_name: Dict[str, BaseTool],
+        tool_call: ToolCall,
+    ) -> ToolMessage:
+        tool_name = tool_call["name"]
+        tool = tools_by_name.get(tool_name)
+        if tool is None:
+            return _tool_error_message(
+                tool_call,
+                f"Error: {tool_name} is not a valid tool, "
+                f"try one of [{', '.join(tools_by_name)}].",
+            )
+
+        timeout = min_timeout(
+            self.tool_timeouts.get(tool_name, self.tool_timeout), remaining_time()
+        )
+        started = time.perf_counter()
+        try:
+            with (
+                utilization.track(RUNNER_STAGE)
+                if tool_name in self.runner_tool_names
+                else contextlib.nullcontext()
+            ):
+                result = await asyncio.wait_for(
+                    tool.ainvoke({**tool_call, "type": "tool_call"}),
+                    timeout=timeout,
+                )
+        except GraphBubbleUp:
+            raise
+        except asyncio.TimeoutError:
+            metrics.increment(f"{TOOL_METRIC_PREFIX}.{tool_name}.timeout")
+            logging.error("도구 제한 시간 초과: %s (%s초)", tool_name, timeout)
+            return _tool_error_message(
+                tool_call,
+                f"Error: {tool_name} timed out after {timeout} seconds\n"
+                " Please try again with a narrower request or another tool.",
+            )
+        except Exception as e:
+            logging.error("도구 호출 실패: %s %r", tool_name, e)
+            return _tool_error_message(
+                tool_call, f"Error: {e!r}\n Please fix your mistakes."
+            )
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.observe(f"{TOOL_METRIC_PREFIX}.{tool_name}", elapsed)
+            logging.info("도구 실행 시간: %s %.3f초", tool_name, elapsed)
+
+        if isinstance(result, ToolMessage):
+            return result
+        return ToolMessage(
+            content=str(result),
+            name=tool_name,
+            tool_call_id=tool_call["id"],
+        )
+
     def create_output_node(
         self,
         output_schema: Type[BaseModel],
@@ -149,27 +667,63 @@ class BaseAgentBuilder(ABC):
             [AgentStateLike, OutputLike], None
         ] = lambda state, output: ...,
     ) -> Callable[[AgentStateLike], Coroutine[Any, Any, AgentStateLike]]:
-        if model is None:
-            model = self.model
+        models = self.output_models if model is None else [model]
 
-        async def output_node(state: AgentStateLike) -> AgentStateLike:
-            model_with_output = model.with_structured_output(output_schema)
+        async def parse_with_model(model: BaseChatModel, content: str) -> OutputLike:
+            model_with_output = model.with_structured_output(
+                output_schema, include_raw=True
+            )
             inputs = [
-                state.messages[-1].content,
+                content,
                 "DO NOT GENERATE THE FIELD VALUES, just parse",
             ]
-            logging.info("도구 호출 결과: %s", state.messages[-1].content)
-            response: OutputLike = await model_with_output.ainvoke(inputs)
-            if response is None:
+            started = time.perf_counter()
+            with utilization.track(LLM_STAGE):
+                result = await model_with_output.ainvoke(inputs)
+            record_model_usage(self.role, "output", started, result["raw"])
+            if result["parsed"] is None:
                 raise EmptyOutputException()
+            return result["parsed"]
+
+        async def output_node(state: AgentStateLike) -> AgentStateLike:
+            logging.info("도구 호출 결과: %s", state.messages[-1].content)
+            update = {}
+            response: Optional[OutputLike] = parse_output_locally(
+                state.messages[-1].content, output_schema
+            )
+            if response is not None:
+                metrics.increment(OUTPUT_PARSER_LOCAL_HIT)
+            else:
+                metrics.increment(OUTPUT_PARSER_LOCAL_MISS)
+                response, tier_stats = await self._run_model_cascade(
+                    [
+                        functools.partial(
+                            parse_with_model, model, state.messages[-1].content
+                        )
+                        for model in models
+                    ],
+                    node_type="output",
+                )
+                update["model_tier_stats"] = tier_stats
             output_processor(state, response)
             logging.info("매핑 결과: %s", response)
-            return {
-                "structured_response": response,
-            }
+            update["structured_response"] = response
+            return update
 
         return output_node
 
+    def _compact_messages(
+        self, messages: Sequence[BaseMessage]
+    ) -> Sequence[BaseMessage]:
+        if self.message_compactor is None:
+            return messages
+        return self.message_compactor(messages)
+
+    def _turn_limit_reached(self, state: AgentStateLike) -> bool:
+        if self.max_turns is None:
+            return False
+        return _get_tool_call_stats(state).turns >= self.max_turns
+
     def _is_valid_reasoning(
         self,
         current_message: BaseMessage,
@@ -191,21 +745,116 @@ class BaseAgentBuilder(ABC):
             )
 
 
+_bound_model_cache: OrderedDict[
+    Hashable, Tuple[BaseChatModel, Tuple[Any, ...], Runnable]
+] = OrderedDict()
+_bound_model_cache_lock = threading.Lock()
+
+
+def bind_tools_cached(model: BaseChatModel, tools: Sequence[Any]) -> Runnable:
+    """
+    (모델, 도구 집합) 단위로 bind_tools 결과를 재사용한다.
+    캐시 항목이 모델과 도구를 붙잡고 있으므로 키로 사용한 id 가 재사용되지 않는다.
+    """
+    key = (id(model), tuple(id(tool) for tool in tools))
+    with _bound_model_cache_lock:
+        cached = _bound_model_cache.get(key)
+        if cached is not None:
+            _bound_model_cache.move_to_end(key)
+            metrics.increment(BIND_TOOLS_CACHE_HIT)
+            return cached[2]
+
+    metrics.increment(BIND_TOOLS_CACHE_MISS)
+    bound = model.bind_tools(tools)
+    with _bound_model_cache_lock:
+        _bound_model_cache[key] = (model, tuple(tools), bound)
+        while len(_bound_model_cache) > BIND_TOOLS_CACHE_SIZE:
+            _bound_model_cache.popitem(last=False)
+    return bound
+
+
+def _to_agent_event(event: dict, elapsed: float) -> Optional[AgentEvent]:
+    kind = event["event"]
+    name = event.get("name")
+    node = event.get("metadata", {}).get("langgraph_node")
+    data = event.get("data", {})
+
+    if kind == "on_chat_model_stream":
+        content = data["chunk"].content
+        if isinstance(content, list):
+            content = "".join(
+                block.get("text", "") if isinstance(block, dict) else str(block)
+                for block in content
+            )
+        if not content:
+            return None
+        return AgentEvent(type="token", node=node, content=content, elapsed=elapsed)
+    if kind == "on_tool_start":
+        return AgentEvent(
+            type="tool_call_start",
+            node=node,
+            tool_name=name,
+            tool_input=data.get("input"),
+            elapsed=elapsed,
+        )
+    if kind == "on_tool_end":
+        output = data.get("output")
+        return AgentEvent(
+            type="tool_call_end",
+            node=node,
+            tool_name=name,
+            output=getattr(output, "content", output),
+            elapsed=elapsed,
+        )
+    if kind in ("on_chain_start", "on_chain_end") and name == node:
+        if name.startswith("__"):
+            return None
+        return AgentEvent(
+            type="node_start" if kind == "on_chain_start" else "node_end",
+            node=node,
+            elapsed=elapsed,
+        )
+    if kind == "on_chain_end" and not event.get("parent_ids"):
+        output = data.get("output")
+        if isinstance(output, dict):
+            structured_response = output.get("structured_response")
+        else:
+            structured_response = getattr(output, "structured_response", None)
+        return AgentEvent(type="output", output=structured_response, elapsed=elapsed)
+    return None
+
+
+def _tool_error_message(tool_call: ToolCall, content: str) -> ToolMessage:
+    return ToolMessage(
+        content=content,
+        name=tool_call["name"],
+        tool_call_id=tool_call["id"],
+        status="error",
+    )
+
+
 def _is_empty_tool_calls(message: AIMessage) -> bool:
     curr_tool_calls = len(message.tool_calls)
     return curr_tool_calls == 0
 
 
 def _no_tool_calls_in_messages(state: AgentStateLike) -> bool:
-    prev_tool_message_count = len(
-        list(
-            filter(
-                lambda msg: isinstance(msg, ToolMessage) and msg.status != "error",
-                state.messages,
-            )
-        )
+    return _get_tool_call_stats(state).successful_tool_calls == 0
+
+
+def _get_tool_call_stats(state: AgentStateLike) -> ToolCallStats:
+    stats = getattr(state, "tool_call_stats", None)
+    if stats is not None:
+        return stats
+
+    # 집계 필드가 없는 상태 스키마는 메시지를 훑어서 계산한다
+    tool_messages = [msg for msg in state.messages if isinstance(msg, ToolMessage)]
+    errored = sum(_is_tool_message_error(msg) for msg in tool_messages)
+    return ToolCallStats(
+        successful_tool_calls=len(tool_messages) - errored,
+        errored_tool_calls=errored,
+        turns=sum(isinstance(msg, AIMessage) for msg in state.messages),
     )
-    return prev_tool_message_count == 0
 
 
 def _is_tool_message_error(message: BaseMessage) -> bool:
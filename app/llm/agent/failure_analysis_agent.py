@@ -1,9 +1,11 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
 from langchain_core.language_models import BaseChatModel
 from langgraph.graph.graph import CompiledGraph
 from langchain_core.tools import BaseTool
 from app.llm.agent.base import BaseAgentBuilder
+from app.llm.message_compactor import MessageCompactor
 from app.prompts.failure_analysis_prompt import TestFailureAnalysisPrompt
+from app.schemas.agent_event import AgentEvent
 from app.schemas.state import TestFailureAnalysisState
 from app.schemas.structured_output import TestFailureAnalysis
 
@@ -13,23 +15,30 @@ class TestFailureAnalysisAgent(BaseAgentBuilder):
     테스트 코드의 실패 이유를 분석하고 해결 방법을 제안하는 에이전트
     """
 
+    role = "failure_analysis"
+    message_compactor = MessageCompactor()
+
     def __init__(
         self,
         model: BaseChatModel,
         tools: List[BaseTool],
+        fallback_models: List[BaseChatModel] = [],
+        output_model: Optional[BaseChatModel] = None,
     ):
         super().__init__(
             model=model,
             tools=tools,
+            fallback_models=fallback_models,
+            output_model=output_model,
             tool_call_mode="multi_turn",
         )
 
     def build(self) -> CompiledGraph:
         return self.create_agentic_graph(
             state_schema=TestFailureAnalysisState,
-            llm_node=self.create_llm_node(),
+            llm_node=self.create_llm_node(output_schema=TestFailureAnalysis),
             output_node=self.create_output_node(TestFailureAnalysis),
-        ).compile()
+        ).compile(checkpointer=False)
 
     async def analyze_vitest_failure(
         self,
@@ -40,17 +49,54 @@ class TestFailureAnalysisAgent(BaseAgentBuilder):
         stdout: str,
         stderr: str,
     ) -> TestFailureAnalysis:
-        agent = self.build()
-        response = await agent.ainvoke(
-            TestFailureAnalysisState(
-                messages=TestFailureAnalysisPrompt(
-                    test_file_name=test_file_name,
-                    test_file_content=test_file_content,
-                    source_file_name=source_file_name,
-                    source_file_content=source_file_content,
-                    stdout=stdout,
-                    stderr=stderr,
-                ).build()
+        response = await self.ainvoke_agent(
+            self._build_state(
+                test_file_name=test_file_name,
+                test_file_content=test_file_content,
+                source_file_name=source_file_name,
+                source_file_content=source_file_content,
+                stdout=stdout,
+                stderr=stderr,
             )
         )
         return response["structured_response"]
+
+    def astream_analyze_vitest_failure(
+        self,
+        test_file_name: str,
+        test_file_content: str,
+        source_file_name: str,
+        source_file_content: str,
+        stdout: str,
+        stderr: str,
+    ) -> AsyncIterator[AgentEvent]:
+        return self.astream_agent(
+            self._build_state(
+                test_file_name=test_file_name,
+                test_file_content=test_file_content,
+                source_file_name=source_file_name,
+                source_file_content=source_file_content,
+                stdout=stdout,
+                stderr=stderr,
+            )
+        )
+
+    def _build_state(
+        self,
+        test_file_name: str,
+        test_file_content: str,
+        source_file_name: str,
+        source_file_content: str,
+        stdout: str,
+        stderr: str,
+    ) -> TestFailureAnalysisState:
+        return TestFailureAnalysisState(
+            messages=TestFailureAnalysisPrompt(
+                test_file_name=test_file_name,
+                test_file_content=test_file_content,
+                source_file_name=source_file_name,
+                source_file_content=source_file_content,
+                stdout=stdout,
+                stderr=stderr,
+            ).build()
+        )
@@ -1,13 +1,26 @@
+import asyncio
+import os
 import textwrap
-from typing import List
+from pathlib import Path
+from typing import AsyncIterator, ClassVar, List, Optional, Sequence
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, ToolMessage
 from langchain_core.tools import BaseTool
 from langgraph.graph.graph import CompiledGraph
 
+from app.core.metrics import metrics
+from app.exceptions.node_exception import TestFileNotFoundException
 from app.llm.agent.base import BaseAgentBuilder
+from app.llm.message_compactor import MessageCompactor
+from app.llm.output_parser import parse_output_locally
 from app.prompts.finder_prompt import TestFinderPrompt
+from app.schemas.agent_event import AgentEvent
 from app.schemas.state import TestFinderState
-from app.schemas.structured_output import TestFile
+from app.schemas.structured_output import TestFile, TestFileReference
+
+FINDER_CONTENT_FROM_TOOL = "finder.content.tool_result"
+FINDER_CONTENT_FROM_DISK = "finder.content.disk"
+FINDER_CONTENT_GENERATED = "finder.content.generated"
 
 
 class TestFinderAgent(BaseAgentBuilder):
@@ -15,23 +28,32 @@ class TestFinderAgent(BaseAgentBuilder):
     타겟 소스를 테스트하는 기존 테스트 코드를 찾거나 생성하고 이에 대한 에디터 객체를 반환하는 에이전트
     """
 
+    role = "finder"
+    message_compactor = MessageCompactor()
+    # 상대 경로로 받은 테스트 파일을 읽을 기준 디렉터리, None 이면 현재 작업 디렉터리
+    test_root: ClassVar[Optional[str]] = None
+
     def __init__(
         self,
         model: BaseChatModel,
         tools: List[BaseTool] = [],
+        fallback_models: List[BaseChatModel] = [],
+        output_model: Optional[BaseChatModel] = None,
     ):
         super().__init__(
             model=model,
             tools=tools,
+            fallback_models=fallback_models,
+            output_model=output_model,
             tool_call_mode="multi_turn",
         )
 
     def build(self) -> CompiledGraph:
         return self.create_agentic_graph(
             state_schema=TestFinderState,
-            llm_node=self.create_llm_node(),
-            output_node=self.create_output_node(TestFile),
-        ).compile()
+            llm_node=self.create_llm_node(output_schema=TestFileReference),
+            output_node=self.create_output_node(TestFileReference),
+        ).compile(checkpointer=False)
 
     async def find_or_generate_vitest_file(
         self,
@@ -39,20 +61,129 @@ class TestFinderAgent(BaseAgentBuilder):
         source_file_content: str,
         source_file_path: str,
     ) -> TestFile:
-        agent = self.build()
-        response = await agent.ainvoke(
-            TestFinderState(
-                messages=TestFinderPrompt(
-                    language="typescript",
-                    source_file_name=source_file_name,
-                    source_file_content=source_file_content,
-                    source_file_path=source_file_path,
-                    testing_framework="vitest",
-                    additional_instructions_text=_get_additional_instructions(),
-                ).build()
+        response = await self.ainvoke_agent(
+            self._build_state(
+                source_file_name=source_file_name,
+                source_file_content=source_file_content,
+                source_file_path=source_file_path,
+            )
+        )
+        return await self._resolve_test_file(
+            response["structured_response"], response["messages"]
+        )
+
+    async def _resolve_test_file(
+        self, reference: TestFileReference, messages: Sequence[BaseMessage]
+    ) -> TestFile:
+        """
+        모델은 찾은 테스트 파일의 경로만 돌려주고, 내용은 도구 결과나 디스크에서 읽는다.
+        같은 경로의 파일이 없을 때만 모델이 생성한 내용을 쓴다.
+        """
+        content = _content_from_tool_results(messages, reference.path)
+        if content is not None:
+            metrics.increment(FINDER_CONTENT_FROM_TOOL)
+        else:
+            content = await asyncio.to_thread(
+                _content_from_disk, reference.path, self.test_root
+            )
+            if content is not None:
+                metrics.increment(FINDER_CONTENT_FROM_DISK)
+        if content is None:
+            if reference.content is None:
+                raise TestFileNotFoundException(
+                    f"Test file content not found: {reference.path}"
+                )
+            content = reference.content
+            metrics.increment(FINDER_CONTENT_GENERATED)
+
+        return TestFile(
+            language=reference.language,
+            name=reference.name,
+            content=content,
+            path=reference.path,
+        )
+
+    async def astream_find_or_generate_vitest_file(
+        self,
+        source_file_name: str,
+        source_file_content: str,
+        source_file_path: str,
+    ) -> AsyncIterator[AgentEvent]:
+        """
+        find_or_generate_vitest_file 과 같이 마지막 output 이벤트의 TestFileReference 를
+        도구 결과, 디스크, 생성된 내용 순으로 읽은 TestFile 로 바꿔 내보낸다.
+        """
+        tool_messages: List[ToolMessage] = []
+        async for event in self.astream_agent(
+            self._build_state(
+                source_file_name=source_file_name,
+                source_file_content=source_file_content,
+                source_file_path=source_file_path,
             )
+        ):
+            # tool_call_end 는 성공한 도구 호출에만 오므로 그 결과를 도구 메시지로 모은다
+            if event.type == "tool_call_end":
+                tool_messages.append(
+                    ToolMessage(
+                        content=str(event.output),
+                        name=event.tool_name,
+                        tool_call_id=str(len(tool_messages)),
+                    )
+                )
+            elif event.type == "output" and event.output is not None:
+                event = event.model_copy(
+                    update={
+                        "output": await self._resolve_test_file(
+                            event.output, tool_messages
+                        )
+                    }
+                )
+            yield event
+
+    def _build_state(
+        self,
+        source_file_name: str,
+        source_file_content: str,
+        source_file_path: str,
+    ) -> TestFinderState:
+        return TestFinderState(
+            messages=TestFinderPrompt(
+                language="typescript",
+                source_file_name=source_file_name,
+                source_file_content=source_file_content,
+                source_file_path=source_file_path,
+                testing_framework="vitest",
+                additional_instructions_text=_get_additional_instructions(),
+            ).build()
         )
-        return response["structured_response"]
+
+
+def _content_from_tool_results(
+    messages: Sequence[BaseMessage], path: str
+) -> Optional[str]:
+    """
+    TestFile 로 읽히는 도구 결과 중 정규화한 경로가 같은 것의 내용을 찾는다.
+    """
+    for message in reversed(messages):
+        if not isinstance(message, ToolMessage) or message.status == "error":
+            continue
+        test_file = parse_output_locally(message.content, TestFile)
+        if test_file is not None and _same_path(test_file.path, path):
+            return test_file.content
+    return None
+
+
+def _content_from_disk(path: str, root: Optional[str]) -> Optional[str]:
+    file_path = Path(path)
+    if not file_path.is_absolute():
+        file_path = Path(root or os.getcwd()) / file_path
+    if not file_path.is_file():
+        return None
+    return file_path.read_text(encoding="utf-8")
+
+
+def _same_path(left: str, right: str) -> bool:
+    return os.path.normpath(left) == os.path.normpath(right)
 
 
 def _get_additional_instructions():
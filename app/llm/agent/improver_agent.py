@@ -1,12 +1,22 @@
+import asyncio
+import copy
+import logging
 import textwrap
-from typing import List, Optional
+from typing import AsyncIterator, ClassVar, Dict, List, Optional, Set, Tuple
 from langchain_core.language_models import BaseChatModel
+from langgraph.errors import GraphBubbleUp
 from langgraph.graph.graph import CompiledGraph
 
+from app.core.metrics import metrics
+from app.core.single_test import normalize_code, parse_lines_to_cover
 from app.llm.agent.base import BaseAgentBuilder
 from app.prompts.improver_prompt import TestGenerationPrompt
+from app.schemas.agent_event import AgentEvent
 from app.schemas.state import TestImproverState
-from app.schemas.structured_output import FailedTestReport, NewTests
+from app.schemas.structured_output import FailedTestReport, NewTests, SingleTest
+
+IMPROVER_SAMPLE_CANDIDATES = "improver.sample_candidates"
+IMPROVER_SAMPLE_DUPLICATES = "improver.sample_duplicates"
 
 
 class TestImproverAgent(BaseAgentBuilder):
@@ -14,19 +24,37 @@ class TestImproverAgent(BaseAgentBuilder):
     커버리지 향상을 위해 추가 테스트를 생성하는 에이전트
     """
 
-    def __init__(self, model: BaseChatModel):
+    role = "improver"
+    # 한 번의 생성에서 요청하는 최대 테스트 수
+    max_tests: ClassVar[int] = 10
+    # 1보다 크면 온도를 바꿔 가며 후보를 동시에 생성한 뒤 병합한다
+    num_samples: ClassVar[int] = 1
+    sample_temperatures: ClassVar[List[float]] = [0.2, 0.6, 1.0]
+
+    def __init__(
+        self,
+        model: BaseChatModel,
+        fallback_models: List[BaseChatModel] = [],
+        output_model: Optional[BaseChatModel] = None,
+    ):
         super().__init__(
             model=model,
             tools=[],
+            fallback_models=fallback_models,
+            output_model=output_model,
             tool_call_mode="none",
         )
+        # 온도별 (사본을 만든 원본 모델, 사본 에이전트)
+        self._sampling_agents: Dict[
+            float, Tuple[BaseChatModel, "TestImproverAgent"]
+        ] = {}
 
     def build(self) -> CompiledGraph:
         return self.create_agentic_graph(
             state_schema=TestImproverState,
-            llm_node=self.create_llm_node(),
+            llm_node=self.create_llm_node(output_schema=NewTests),
             output_node=self.create_output_node(NewTests),
-        ).compile()
+        ).compile(checkpointer=False)
 
     async def generate_vitest_test(
         self,
@@ -36,32 +64,171 @@ class TestImproverAgent(BaseAgentBuilder):
         test_file_content: str,
         code_coverage_report: Optional[str] = None,
         failed_test_reports: List[FailedTestReport] = [],
+        num_samples: Optional[int] = None,
     ) -> NewTests:
-        agent = self.build()
-        failed_tests_section = _parse_failed_test_reports(failed_test_reports)
+        if num_samples is None:
+            num_samples = self.num_samples
+        state = self._build_state(
+            source_file_name=source_file_name,
+            source_file_content=source_file_content,
+            test_file_name=test_file_name,
+            test_file_content=test_file_content,
+            code_coverage_report=code_coverage_report,
+            failed_test_reports=failed_test_reports,
+        )
+        if num_samples <= 1:
+            response = await self.ainvoke_agent(state)
+            return response["structured_response"]
+
+        return await self._generate_samples(state, num_samples)
+
+    async def _generate_samples(
+        self, state: TestImproverState, num_samples: int
+    ) -> NewTests:
+        """
+        온도별 후보를 동시에 생성하고 정규화한 test_code 로 중복을 제거한 뒤,
+        lines_to_cover 가 겹치지 않는 순서로 max_tests 개를 고른다.
+        """
+        temperatures = [
+            self.sample_temperatures[i % len(self.sample_temperatures)]
+            for i in range(num_samples)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self._sampling_agent(temperature).ainvoke_agent(state.model_copy())
+                for temperature in temperatures
+            ),
+            return_exceptions=True,
+        )
+        errors = [
+            response for response in responses if isinstance(response, BaseException)
+        ]
+        for error in errors:
+            # 취소와 그래프 인터럽트는 후보 하나의 실패가 아니므로 바로 전파한다
+            if not isinstance(error, Exception) or isinstance(error, GraphBubbleUp):
+                raise error
+        samples: List[NewTests] = [
+            response["structured_response"]
+            for response in responses
+            if not isinstance(response, BaseException)
+        ]
+        if not samples:
+            raise errors[0]
+        for error in errors:
+            logging.warning("테스트 후보 생성 실패: %r", error)
 
-        response = await agent.ainvoke(
-            TestImproverState(
-                messages=TestGenerationPrompt(
-                    language="typescript",
-                    source_file_name=source_file_name,
-                    source_file_numbered="\n".join(
-                        [
-                            f"{i+1}: {line}"
-                            for i, line in enumerate(source_file_content.splitlines())
-                        ]
-                    ),
-                    test_file_name=test_file_name,
-                    test_file=test_file_content,
-                    testing_framework="vitest",
-                    code_coverage_report=str(code_coverage_report),
-                    max_tests=10,
-                    additional_instructions_text=_get_additional_instructions(),
-                    failed_tests_section=failed_tests_section,
-                ).build()
+        candidates = [test for sample in samples for test in sample.new_tests]
+        unique_tests = _deduplicate_tests(candidates)
+        metrics.increment(IMPROVER_SAMPLE_CANDIDATES, len(candidates))
+        metrics.increment(
+            IMPROVER_SAMPLE_DUPLICATES, len(candidates) - len(unique_tests)
+        )
+        return samples[0].model_copy(
+            update={"new_tests": _select_diverse_tests(unique_tests, self.max_tests)}
+        )
+
+    def _sampling_agent(self, temperature: float) -> "TestImproverAgent":
+        """
+        그래프 캐시를 온도별로 유지하기 위해 온도마다 이 에이전트의 사본을 하나씩 둔다.
+        사본은 모델만 바꾸고 인스턴스에 설정한 도구, 타임아웃, 재시도 정책 등을 그대로 쓴다.
+        """
+        cached = self._sampling_agents.get(temperature)
+        if cached is not None and cached[0] is self.model:
+            return cached[1]
+        agent = copy.copy(self)
+        agent.model = _with_temperature(self.model, temperature)
+        agent._compiled_graph = None
+        agent._compiled_graph_key = None
+        agent._sampling_agents = {}
+        self._sampling_agents[temperature] = (self.model, agent)
+        return agent
+
+    def astream_generate_vitest_test(
+        self,
+        source_file_name: str,
+        source_file_content: str,
+        test_file_name: str,
+        test_file_content: str,
+        code_coverage_report: Optional[str] = None,
+        failed_test_reports: List[FailedTestReport] = [],
+    ) -> AsyncIterator[AgentEvent]:
+        return self.astream_agent(
+            self._build_state(
+                source_file_name=source_file_name,
+                source_file_content=source_file_content,
+                test_file_name=test_file_name,
+                test_file_content=test_file_content,
+                code_coverage_report=code_coverage_report,
+                failed_test_reports=failed_test_reports,
             )
         )
-        return response["structured_response"].new_tests
+
+    def _build_state(
+        self,
+        source_file_name: str,
+        source_file_content: str,
+        test_file_name: str,
+        test_file_content: str,
+        code_coverage_report: Optional[str],
+        failed_test_reports: List[FailedTestReport],
+    ) -> TestImproverState:
+        failed_tests_section = _parse_failed_test_reports(failed_test_reports)
+
+        return TestImproverState(
+            messages=TestGenerationPrompt(
+                language="typescript",
+                source_file_name=source_file_name,
+                source_file_numbered="\n".join(
+                    [
+                        f"{i+1}: {line}"
+                        for i, line in enumerate(source_file_content.splitlines())
+                    ]
+                ),
+                test_file_name=test_file_name,
+                test_file=test_file_content,
+                testing_framework="vitest",
+                code_coverage_report=str(code_coverage_report),
+                max_tests=self.max_tests,
+                additional_instructions_text=_get_additional_instructions(),
+                failed_tests_section=failed_tests_section,
+            ).build()
+        )
+
+
+def _with_temperature(model: BaseChatModel, temperature: float) -> BaseChatModel:
+    if "temperature" not in type(model).model_fields:
+        return model
+    return model.model_copy(update={"temperature": temperature})
+
+
+def _deduplicate_tests(tests: List[SingleTest]) -> List[SingleTest]:
+    seen: Set[str] = set()
+    unique_tests = []
+    for test in tests:
+        key = normalize_code(test.test_code)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique_tests.append(test)
+    return unique_tests
+
+
+def _select_diverse_tests(tests: List[SingleTest], max_tests: int) -> List[SingleTest]:
+    """
+    아직 고르지 않은 라인을 가장 많이 새로 덮는 테스트부터 고른다 (같으면 먼저 생성된 순서).
+    """
+    remaining = list(tests)
+    covered: Set[int] = set()
+    selected = []
+    while remaining and len(selected) < max_tests:
+        best = max(
+            remaining,
+            key=lambda test: len(parse_lines_to_cover(test.lines_to_cover) - covered),
+        )
+        remaining.remove(best)
+        covered |= parse_lines_to_cover(best.lines_to_cover)
+        selected.append(best)
+    return selected
 
 
 def _parse_failed_test_reports(
@@ -1,27 +1,91 @@
-from typing import List, Literal
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import ClassVar, Dict, List, Literal, Optional, Set, Tuple
 from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph.graph import CompiledGraph
 from langgraph.graph import StateGraph
+from langgraph.types import Send
+from app.core.setting import checkpoint_settings, retry_settings, timeout_settings
+from app.core.deadline import run_with_deadline
+from app.core.metrics import metrics
+from app.core.single_test import normalize_code, parse_lines_to_cover
 from app.core.snapshot_editor import SnapshotEditor
+from app.core.locator_index import TestLocatorIndex
+from app.core.structure_analyzer import analyze_test_structure
+from app.core.vitest_report import extract_test_title, parse_failed_test_titles
 from app.llm.agent.analysis_agent import TestAnalysisAgent
 from app.llm.agent.base import BaseAgentBuilder
 from app.llm.agent.failure_analysis_agent import TestFailureAnalysisAgent
 from app.llm.agent.finder_agent import TestFinderAgent
 from app.llm.agent.improver_agent import TestImproverAgent
 from app.llm.agent.validation_agent import TestValidationAgent
-from app.schemas.state import TestSupervisorState
+from app.llm.checkpoint import (
+    CHECKPOINT_RESUMED,
+    CHECKPOINT_REUSED,
+    DEFAULT_RUN_ID,
+    checkpoint_thread_id,
+    prune_checkpoints,
+)
+from app.llm.model_factory import ModelFactory
+from app.llm.retry import retry_budget_scope
+from app.schemas.model_factory import ModelRoutingConfig
+from app.schemas.state import (
+    BatchTestOutcome,
+    CandidateResult,
+    CandidateValidation,
+    TestSupervisorState,
+)
 from app.schemas.structured_output import (
+    FailedTestReport,
     ImprovedResult,
+    SingleTest,
     SourceFile,
+    TestCoverage,
+    TestFailureAnalysis,
     TestFile,
 )
 
+VALIDATION_RUNS = "supervisor.validation_runs"
+ANALYSIS_LOCAL = "supervisor.analysis.local"
+ANALYSIS_LLM = "supervisor.analysis.llm"
+PIPELINE_PREFETCH = "supervisor.pipeline.prefetch"
+PIPELINE_PREFETCH_USED = "supervisor.pipeline.prefetch_used"
+PIPELINE_PREFETCH_STALE = "supervisor.pipeline.prefetch_stale"
+
 
 class TestSupervisorAgent(BaseAgentBuilder):
     """
     테스트 커버리지 개선 작업을 총괄하는 에이전트
     """
 
+    role = "supervisor"
+
+    # supervisor 실행 전체의 제한 시간, 하위 에이전트의 데드라인은 이 안으로 줄어든다
+    agent_timeout = timeout_settings.RUN_TIMEOUT
+    deadline_scope = "run"
+    # 목표 커버리지 도달, 최대 improver 반복 횟수, 연속으로 개선이 없는 반복 횟수 중 하나를 만족하면 멈춘다
+    target_coverage_percent: ClassVar[int] = 100
+    max_iterations: ClassVar[int] = 5
+    plateau_rounds: ClassVar[int] = 2
+    # sequential: 하나씩 적용하고 검증한다, parallel: 후보 테스트를 분기된 스냅샷에서 동시에 검증한다
+    # batch: 큐의 후보를 한 파일에 모두 넣어 한 번 실행하고, 실패한 테스트를 뺀 뒤 한 번 더 확인한다
+    # parallel 은 같은 테스트 파일을 동시에 여러 번 쓰므로 검증 러너가 이를 견딜 때만 켠다
+    validation_mode: ClassVar[Literal["sequential", "parallel", "batch"]] = "sequential"
+    # 한 번에 동시에 검증하는 후보 테스트 수
+    validation_parallelism: ClassVar[int] = 4
+    # 체크포인터가 있으면 실행 스레드마다 최근 체크포인트 몇 개만 남긴다
+    checkpoint_keep_last: ClassVar[int] = checkpoint_settings.CHECKPOINT_KEEP_LAST
+    # 현재 묶음을 검증하는 동안 improver 가 다음 묶음을 미리 생성한다
+    pipelined: ClassVar[bool] = False
+    # 로컬 구조 분석을 확신할 수 있으면 analysis 에이전트를 호출하지 않는다
+    local_analysis: ClassVar[bool] = True
+
     def __init__(
         self,
         model: BaseChatModel,
@@ -30,6 +94,8 @@ class TestSupervisorAgent(BaseAgentBuilder):
         validation_agent: TestValidationAgent,
         failure_analysis_agent: TestFailureAnalysisAgent,
         improver_agent: TestImproverAgent,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+        test_locator: Optional[TestLocatorIndex] = None,
     ):
         super().__init__(
             model=model,
@@ -41,150 +107,842 @@ class TestSupervisorAgent(BaseAgentBuilder):
         self.validation_agent = validation_agent
         self.failure_analysis_agent = failure_analysis_agent
         self.improver_agent = improver_agent
+        self.checkpointer = checkpointer
+        self.test_locator = test_locator
+        self._prefetched_tests: Dict[str, asyncio.Task[List[SingleTest]]] = {}
+
+    @classmethod
+    async def from_routing_config(
+        cls,
+        routing: ModelRoutingConfig,
+        finder_tools: List[BaseTool],
+        validation_tools: List[BaseTool],
+        failure_analysis_tools: List[BaseTool],
+        model_factory: Optional[ModelFactory] = None,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+        test_locator: Optional[TestLocatorIndex] = None,
+    ) -> "TestSupervisorAgent":
+        """
+        역할과 노드 종류(llm, output)별로 라우팅된 모델로 supervisor 와 하위 에이전트를 구성한다.
+        """
+        if model_factory is None:
+            model_factory = ModelFactory()
+
+        async def load(role, node_type="llm"):
+            return await model_factory.load_routed_llm(routing, role, node_type)
+
+        return cls(
+            model=await load("supervisor"),
+            finder_agent=TestFinderAgent(
+                model=await load("finder"),
+                tools=finder_tools,
+                output_model=await load("finder", "output"),
+            ),
+            analysis_agent=TestAnalysisAgent(
+                model=await load("analysis"),
+                output_model=await load("analysis", "output"),
+            ),
+            validation_agent=TestValidationAgent(
+                model=await load("validation"),
+                tools=validation_tools,
+                output_model=await load("validation", "output"),
+            ),
+            failure_analysis_agent=TestFailureAnalysisAgent(
+                model=await load("failure_analysis"),
+                tools=failure_analysis_tools,
+                output_model=await load("failure_analysis", "output"),
+            ),
+            improver_agent=TestImproverAgent(
+                model=await load("improver"),
+                output_model=await load("improver", "output"),
+            ),
+            checkpointer=checkpointer,
+            test_locator=test_locator,
+        )
 
     def build(self) -> CompiledGraph:
         workflow = StateGraph(TestSupervisorState)
 
-        async def finder_node(state: TestSupervisorState) -> TestSupervisorState:
-            source_file = state.source_file
-
-            test_file = await self.finder_agent.find_or_generate_vitest_file(
-                source_file_name=source_file.name,
-                source_file_content=source_file.content,
-                source_file_path=source_file.path,
-            )
+        def entry_route(
+            state: TestSupervisorState,
+        ) -> Literal[
+            "finder",
+            "analysis",
+            "baseline_validation",
+            "apply_test",
+            "dispatch_candidates",
+            "batch_validation",
+            "improver",
+            "output",
+        ]:
+            # prepare 로 미리 준비한 상태는 끝난 단계를 건너뛴다
+            if state.base_test_file is None:
+                return "finder"
+            if state.snapshot_editor is None:
+                return "analysis"
+            if state.test_coverage is None:
+                return "baseline_validation"
+            return next_step_route(state)
 
-            state.base_test_file = test_file
+        async def finder_node(state: TestSupervisorState) -> TestSupervisorState:
+            await self._find_test_file(state)
             return state
 
         async def analysis_node(state: TestSupervisorState) -> TestSupervisorState:
-            test_file = state.base_test_file
+            await self._analyze_test_file(state)
+            return state
 
-            analysis = await self.analysis_agent.analyze_vitest(
-                test_file_content=test_file.content,
-            )
-            snapshot_editor = SnapshotEditor(
-                test_file_content=test_file.content,
-                test_file_name=test_file.name,
-                test_file_path=test_file.path,
-                line_number_to_insert_imports_after=analysis.last_import_line_number,
-                line_number_to_insert_tests_after=analysis.last_single_test_line_number,
-            )
+        async def baseline_validation_node(
+            state: TestSupervisorState,
+        ) -> TestSupervisorState:
+            await self._validate_baseline(state)
+            return state
+
+        async def improver_node(state: TestSupervisorState) -> TestSupervisorState:
+            prefetched = self._prefetched_tests.pop(state.pipeline_key, None)
+            new_tests = None
+            if prefetched is not None:
+                try:
+                    new_tests = _drop_stale_tests(await prefetched, state)
+                    metrics.increment(PIPELINE_PREFETCH_USED)
+                except Exception as e:
+                    logging.warning("미리 생성한 테스트 사용 실패, 다시 생성: %r", e)
+            if new_tests is None:
+                new_tests = await self._generate_tests(
+                    state.snapshot_editor,
+                    state.test_coverage.uncovered_lines,
+                    state,
+                )
 
-            state.snapshot_editor = snapshot_editor
+            state.iteration += 1
+            state.single_test_queue.extend(new_tests)
+            if self.pipelined and state.iteration < self.max_iterations:
+                self._prefetch_tests(state)
+            _close_round(state)
             return state
 
-        async def validation_node(state: TestSupervisorState) -> TestSupervisorState:
-            source_file = state.source_file
-            snapshot = state.snapshot_editor
+        async def apply_test_node(state: TestSupervisorState) -> TestSupervisorState:
+            single_test = state.single_test_queue.popleft()
 
-            coverage = await self.validation_agent.validate_vitest(
-                source_file_name=source_file.name,
-                source_file_path=source_file.path,
-                test_file_name=snapshot.test_file_name,
-                test_file_content=snapshot.test_file_content,
+            state.snapshot_editor.add_new_test(
+                additional_test=single_test.test_code,
+                additional_imports=single_test.new_imports_code,
             )
-            state.test_coverage = coverage
+            state.current_test = single_test
+            return state
 
+        async def validation_node(state: TestSupervisorState) -> TestSupervisorState:
+            state.candidate_coverage = await self._validate(
+                state.source_file, state.snapshot_editor
+            )
             return state
 
         def validation_route(
             state: TestSupervisorState,
-        ) -> Literal[
-            "validation_node", "failure_analysis_node", "improver_node", "output_node"
-        ]:
-            coverage = state.test_coverage
+        ) -> Literal["accept_test", "failure_analysis", "reject_test"]:
+            coverage = state.candidate_coverage
             previous_coverage_percent = state.snapshot_editor.coverage_percent
 
             if coverage.improved(previous_coverage_percent):
-                return True
-            else:
-                return False
+                return "accept_test"
+            if not coverage.passed_test():
+                return "failure_analysis"
+            # 통과했지만 커버리지를 올리지 못한 테스트는 분석 없이 되돌린다
+            return "reject_test"
+
+        async def accept_test_node(state: TestSupervisorState) -> TestSupervisorState:
+            coverage = state.candidate_coverage
+
+            logging.info(
+                "테스트 채택: %s (%s%% -> %s%%)",
+                state.current_test.test_name,
+                state.snapshot_editor.coverage_percent,
+                coverage.coverage_percent,
+            )
+            state.snapshot_editor.coverage_percent = coverage.coverage_percent
+            state.test_coverage = coverage
+            state.round_improved = True
+            _close_round(state)
+            return state
 
         async def failure_analysis_node(
             state: TestSupervisorState,
         ) -> TestSupervisorState:
-            coverage = state.test_coverage
             snapshot = state.snapshot_editor
 
-            analysis = await self.failure_analysis_agent.analyze_vitest_failure(
-                test_file_name=snapshot.test_file_name,
-                test_file_content=snapshot.test_file_content,
-                source_file_name=state.source_file.name,
-                source_file_content=state.source_file.content,
-                stdout=coverage.stdout,
-                stderr=coverage.stderr,
+            analysis = await self._analyze_failure(
+                state.source_file, snapshot, state.candidate_coverage
             )
 
             snapshot.rollback()
             state.test_failure_analysis = analysis
+            state.failed_test_reports.append(
+                FailedTestReport(
+                    analysis=analysis,
+                    failed_single_test=state.current_test,
+                )
+            )
+            _close_round(state)
             return state
 
-        async def improver_node(state: TestSupervisorState) -> TestSupervisorState:
-            source_file = state.source_file
+        async def reject_test_node(state: TestSupervisorState) -> TestSupervisorState:
+            state.snapshot_editor.rollback()
+            _close_round(state)
+            return state
+
+        def next_step_route(
+            state: TestSupervisorState,
+        ) -> Literal[
+            "apply_test",
+            "dispatch_candidates",
+            "batch_validation",
+            "improver",
+            "output",
+        ]:
+            coverage_percent = state.snapshot_editor.coverage_percent
+            if (
+                coverage_percent is not None
+                and coverage_percent >= self.target_coverage_percent
+            ):
+                logging.info("목표 커버리지 도달: %s%%", coverage_percent)
+                return "output"
+            if state.single_test_queue:
+                if self.validation_mode == "batch" and not state.skip_batch_validation:
+                    return "batch_validation"
+                if self.validation_mode == "sequential":
+                    return "apply_test"
+                return "dispatch_candidates"
+            if state.iteration >= self.max_iterations:
+                logging.info("최대 반복 횟수 도달: %d", state.iteration)
+                return "output"
+            if state.rounds_without_improvement >= self.plateau_rounds:
+                logging.info(
+                    "커버리지 정체로 중단: %d회 연속 개선 없음",
+                    state.rounds_without_improvement,
+                )
+                return "output"
+            return "improver"
+
+        async def dispatch_candidates_node(
+            state: TestSupervisorState,
+        ) -> TestSupervisorState:
+            wave_size = min(self.validation_parallelism, len(state.single_test_queue))
+            state.pending_candidates = [
+                state.single_test_queue.popleft() for _ in range(wave_size)
+            ]
+            state.wave += 1
+            return state
+
+        def fan_out_route(state: TestSupervisorState) -> List[Send]:
+            # 브랜치마다 스냅샷을 깊은 복사해 서로의 삽입 위치와 이력이 섞이지 않게 한다
+            return [
+                Send(
+                    "validate_candidate",
+                    CandidateValidation(
+                        wave=state.wave,
+                        index=index,
+                        single_test=single_test,
+                        snapshot_editor=state.snapshot_editor.model_copy(deep=True),
+                        source_file=state.source_file,
+                    ),
+                )
+                for index, single_test in enumerate(state.pending_candidates)
+            ]
+
+        async def validate_candidate_node(candidate: CandidateValidation) -> dict:
+            single_test = candidate.single_test
+            snapshot = candidate.snapshot_editor
+
+            snapshot.add_new_test(
+                additional_test=single_test.test_code,
+                additional_imports=single_test.new_imports_code,
+            )
+            coverage = await self._validate(candidate.source_file, snapshot)
+            failed_test_report = None
+            if not coverage.passed_test():
+                analysis = await self._analyze_failure(
+                    candidate.source_file, snapshot, coverage
+                )
+                failed_test_report = FailedTestReport(
+                    analysis=analysis, failed_single_test=single_test
+                )
+
+            result = CandidateResult(
+                wave=candidate.wave,
+                index=candidate.index,
+                single_test=single_test,
+                coverage=coverage,
+                failed_test_report=failed_test_report,
+            )
+            return {"candidate_results": {f"{result.wave}:{result.index}": result}}
+
+        async def merge_candidates_node(
+            state: TestSupervisorState,
+        ) -> TestSupervisorState:
             snapshot = state.snapshot_editor
+            results = sorted(
+                (
+                    result
+                    for result in state.candidate_results.values()
+                    if result.wave == state.wave
+                ),
+                key=lambda result: result.index,
+            )
+            state.failed_test_reports.extend(
+                result.failed_test_report
+                for result in results
+                if result.failed_test_report is not None
+            )
 
-            improver_result = await self.improver_agent.generate_vitest_test(
-                source_file_name=source_file.name,
-                source_file_content=source_file.content,
-                test_file_name=snapshot.test_file_name,
-                test_file_content=snapshot.test_file_content,
-                code_coverage_report=state.test_coverage.uncovered_lines,
-                failed_test_reports=state.failed_test_reports,
+            improved = sorted(
+                (
+                    result
+                    for result in results
+                    if result.coverage.improved(snapshot.coverage_percent)
+                ),
+                key=lambda result: result.coverage.coverage_percent,
+                reverse=True,
             )
+            if improved:
+                coverage = await self._merge_improved_candidates(
+                    state.source_file, snapshot, improved
+                )
+                logging.info(
+                    "테스트 %d개 채택: %s%% -> %s%%",
+                    len(improved),
+                    snapshot.coverage_percent,
+                    coverage.coverage_percent,
+                )
+                snapshot.coverage_percent = coverage.coverage_percent
+                state.test_coverage = coverage
+                state.round_improved = True
+
+            state.pending_candidates = []
+            _close_round(state)
+            return state
 
-            state.single_test_queue.extend(improver_result.new_tests)
+        async def batch_validation_node(
+            state: TestSupervisorState,
+        ) -> TestSupervisorState:
+            await self._validate_batch(state)
+            _close_round(state)
             return state
 
         async def output_node(state: TestSupervisorState) -> TestSupervisorState:
-            pass
+            snapshot = state.snapshot_editor
+
+            self._discard_prefetched_tests(state.pipeline_key)
+
+            state.structured_response = ImprovedResult(
+                coverage_percent=snapshot.coverage_percent,
+                source_file=state.source_file,
+                test_file=TestFile(
+                    language=state.base_test_file.language,
+                    name=snapshot.test_file_name,
+                    content=snapshot.test_file_content,
+                    path=snapshot.test_file_path,
+                ),
+            )
+            return state
 
         workflow.add_node("finder", finder_node)
         workflow.add_node("analysis", analysis_node)
+        workflow.add_node("baseline_validation", baseline_validation_node)
+        workflow.add_node("improver", improver_node)
+        workflow.add_node("apply_test", apply_test_node)
         workflow.add_node("validation", validation_node)
+        workflow.add_node("accept_test", accept_test_node)
         workflow.add_node("failure_analysis", failure_analysis_node)
-        workflow.add_node("improver", improver_node)
+        workflow.add_node("reject_test", reject_test_node)
+        workflow.add_node("dispatch_candidates", dispatch_candidates_node)
+        workflow.add_node(
+            "validate_candidate", validate_candidate_node, input=CandidateValidation
+        )
+        workflow.add_node("merge_candidates", merge_candidates_node)
+        workflow.add_node("batch_validation", batch_validation_node)
         workflow.add_node("output", output_node)
 
+        workflow.set_conditional_entry_point(entry_route)
         workflow.add_edge("finder", "analysis")
-        workflow.add_edge("analysis", "validation")
-        workflow.add_edge("validation", "failure_analysis")
-        workflow.add_edge("failure_analysis", "improver")
-        workflow.add_edge("improver", "output")
+        workflow.add_edge("analysis", "baseline_validation")
+        workflow.add_edge("apply_test", "validation")
+        workflow.add_conditional_edges("validation", validation_route)
+        workflow.add_conditional_edges(
+            "dispatch_candidates", fan_out_route, ["validate_candidate"]
+        )
+        workflow.add_edge("validate_candidate", "merge_candidates")
+        for node in (
+            "baseline_validation",
+            "improver",
+            "accept_test",
+            "failure_analysis",
+            "reject_test",
+            "merge_candidates",
+            "batch_validation",
+        ):
+            workflow.add_conditional_edges(node, next_step_route)
+        workflow.set_finish_point("output")
+
+        return workflow.compile(checkpointer=self.checkpointer)
+
+    async def _find_test_file(self, state: TestSupervisorState) -> None:
+        source_file = state.source_file
+
+        # 명명 규칙이나 import 로 찾을 수 있는 테스트 파일은 에이전트를 거치지 않는다
+        if self.test_locator is not None:
+            test_file = await asyncio.to_thread(
+                _read_located_test_file, self.test_locator, source_file.path
+            )
+            if test_file is not None:
+                state.base_test_file = test_file
+                return
+
+        test_file = await self.finder_agent.find_or_generate_vitest_file(
+            source_file_name=source_file.name,
+            source_file_content=source_file.content,
+            source_file_path=source_file.path,
+        )
 
-        return workflow.compile()
+        state.base_test_file = test_file
+
+    async def _analyze_test_file(self, state: TestSupervisorState) -> None:
+        test_file = state.base_test_file
+
+        structure = (
+            analyze_test_structure(test_file.content) if self.local_analysis else None
+        )
+        if structure is not None and structure.confident:
+            metrics.increment(ANALYSIS_LOCAL)
+            analysis = structure.analysis
+        else:
+            if structure is not None:
+                logging.info("로컬 구조 분석 불확실, LLM 분석: %s", structure.reasons)
+            metrics.increment(ANALYSIS_LLM)
+            analysis = await self.analysis_agent.analyze_vitest(
+                test_file_content=test_file.content,
+            )
+        snapshot_editor = SnapshotEditor(
+            test_file_content=test_file.content,
+            test_file_name=test_file.name,
+            test_file_path=test_file.path,
+            line_number_to_insert_imports_after=analysis.last_import_line_number,
+            line_number_to_insert_tests_after=analysis.last_single_test_line_number,
+        )
+
+        state.snapshot_editor = snapshot_editor
+
+    async def _validate_baseline(self, state: TestSupervisorState) -> None:
+        coverage = await self._validate(state.source_file, state.snapshot_editor)
+
+        state.test_coverage = coverage
+        state.snapshot_editor.coverage_percent = coverage.coverage_percent
+
+    async def _generate_tests(
+        self,
+        snapshot: SnapshotEditor,
+        uncovered_lines: Optional[List[int]],
+        state: TestSupervisorState,
+    ) -> List[SingleTest]:
+        source_file = state.source_file
+
+        improver_result = await self.improver_agent.generate_vitest_test(
+            source_file_name=source_file.name,
+            source_file_content=source_file.content,
+            test_file_name=snapshot.test_file_name,
+            test_file_content=snapshot.test_file_content,
+            code_coverage_report=uncovered_lines,
+            failed_test_reports=state.failed_test_reports,
+        )
+        return improver_result.new_tests
+
+    def _prefetch_tests(self, state: TestSupervisorState) -> None:
+        """
+        방금 큐에 넣은 테스트가 모두 통과한다고 가정한 파일과 남은 라인으로 다음 테스트를 미리 생성한다.
+        실행마다 미리 생성하는 묶음은 하나뿐이라 improver 가 검증보다 한 반복 이상 앞서가지 않는다.
+        """
+        snapshot = state.snapshot_editor.model_copy(deep=True)
+        _add_tests(snapshot, list(state.single_test_queue))
+        targeted = set()
+        for single_test in state.single_test_queue:
+            targeted |= parse_lines_to_cover(single_test.lines_to_cover)
+        uncovered_lines = [
+            line
+            for line in state.test_coverage.uncovered_lines or []
+            if line not in targeted
+        ]
+        self._discard_prefetched_tests(state.pipeline_key)
+        self._prefetched_tests[state.pipeline_key] = asyncio.create_task(
+            self._generate_tests(snapshot, uncovered_lines, state.model_copy(deep=True))
+        )
+        metrics.increment(PIPELINE_PREFETCH)
+
+    def _discard_prefetched_tests(self, pipeline_key: str) -> None:
+        task = self._prefetched_tests.pop(pipeline_key, None)
+        if task is not None:
+            task.cancel()
+
+    async def _validate(
+        self, source_file: SourceFile, snapshot: SnapshotEditor
+    ) -> TestCoverage:
+        metrics.increment(VALIDATION_RUNS)
+        return await self.validation_agent.validate_vitest(
+            source_file_name=source_file.name,
+            source_file_path=source_file.path,
+            test_file_name=snapshot.test_file_name,
+            test_file_content=snapshot.test_file_content,
+        )
+
+    async def _validate_batch(self, state: TestSupervisorState) -> None:
+        """
+        큐의 후보를 모두 넣은 파일을 한 번 실행해 테스트별 통과 여부를 가려낸다.
+        실패한 테스트가 있으면 나머지만 남겨 한 번 더 실행하고, 실패를 테스트별로 가려낼 수 없으면
+        남은 후보를 큐로 되돌려 이번 반복의 나머지를 테스트별 검증으로 처리한다.
+        """
+        snapshot = state.snapshot_editor
+        previous_coverage = state.test_coverage
+        batch = list(state.single_test_queue)
+        state.single_test_queue.clear()
+
+        _add_tests(snapshot, batch)
+        batch_coverage = await self._validate(state.source_file, snapshot)
+        coverage = batch_coverage
+        failed_titles = parse_failed_test_titles(
+            f"{batch_coverage.stdout or ''}\n{batch_coverage.stderr or ''}"
+        )
+        failing = [
+            test
+            for test in batch
+            if extract_test_title(test.test_code) in failed_titles
+        ]
+        passing = [test for test in batch if test not in failing]
+        batch_snapshot = snapshot.model_copy(deep=True)
+
+        if failing:
+            _rollback_tests(snapshot, batch)
+            _add_tests(snapshot, passing)
+            if passing:
+                coverage = await self._validate(state.source_file, snapshot)
+            # 실패한 테스트들이 같은 실행 결과를 공유하므로 실패 분석은 한 번만 한다
+            analysis = await self._analyze_failure(
+                state.source_file, batch_snapshot, batch_coverage
+            )
+            state.failed_test_reports.extend(
+                FailedTestReport(analysis=analysis, failed_single_test=test)
+                for test in failing
+            )
+
+        if passing and not coverage.passed_test():
+            logging.warning(
+                "일괄 검증 실패를 테스트별로 구분할 수 없음, 개별 검증으로 전환"
+            )
+            _rollback_tests(snapshot, passing)
+            state.single_test_queue.extend(passing)
+            state.skip_batch_validation = True
+            return
+
+        newly_covered = _newly_covered_lines(previous_coverage, coverage)
+        state.batch_outcomes = [
+            BatchTestOutcome(
+                single_test=test,
+                passed=test not in failing,
+                newly_covered_lines=(
+                    sorted(newly_covered & parse_lines_to_cover(test.lines_to_cover))
+                    if test not in failing
+                    else []
+                ),
+            )
+            for test in batch
+        ]
+        if passing and coverage.improved(snapshot.coverage_percent):
+            passing, coverage = await self._drop_idle_batch_tests(
+                state, passing, coverage
+            )
+        if passing and coverage.improved(snapshot.coverage_percent):
+            logging.info(
+                "테스트 %d개 일괄 채택: %s%% -> %s%%",
+                len(passing),
+                snapshot.coverage_percent,
+                coverage.coverage_percent,
+            )
+            snapshot.coverage_percent = coverage.coverage_percent
+            state.test_coverage = coverage
+            state.round_improved = True
+        else:
+            _rollback_tests(snapshot, passing)
+
+    async def _drop_idle_batch_tests(
+        self,
+        state: TestSupervisorState,
+        passing: List[SingleTest],
+        coverage: TestCoverage,
+    ) -> Tuple[List[SingleTest], TestCoverage]:
+        """
+        테스트별 검증처럼 커버리지를 올리지 못한 테스트는 채택하지 않는다.
+        통과했지만 노린 라인을 하나도 새로 덮지 못한 테스트를 빼고 한 번 더 실행해,
+        커버리지가 그대로면 뺀 상태를 쓰고 떨어지면 원래 묶음을 그대로 쓴다.
+        어느 테스트도 라인을 덮었다고 볼 수 없으면 테스트별로 가려낼 수 없으므로 묶음을 그대로 쓴다.
+        """
+        idle = [
+            outcome.single_test
+            for outcome in state.batch_outcomes
+            if outcome.passed and not outcome.newly_covered_lines
+        ]
+        productive = [test for test in passing if test not in idle]
+        if not idle or not productive:
+            return passing, coverage
+
+        snapshot = state.snapshot_editor
+        _rollback_tests(snapshot, passing)
+        _add_tests(snapshot, productive)
+        productive_coverage = await self._validate(state.source_file, snapshot)
+        if (
+            productive_coverage.passed_test()
+            and productive_coverage.coverage_percent >= coverage.coverage_percent
+        ):
+            logging.info(
+                "커버리지를 올리지 못한 테스트 %d개 제외: %s",
+                len(idle),
+                [test.test_name for test in idle],
+            )
+            return productive, productive_coverage
+
+        _rollback_tests(snapshot, productive)
+        _add_tests(snapshot, passing)
+        return passing, coverage
+
+    async def _analyze_failure(
+        self,
+        source_file: SourceFile,
+        snapshot: SnapshotEditor,
+        coverage: TestCoverage,
+    ) -> TestFailureAnalysis:
+        return await self.failure_analysis_agent.analyze_vitest_failure(
+            test_file_name=snapshot.test_file_name,
+            test_file_content=snapshot.test_file_content,
+            source_file_name=source_file.name,
+            source_file_content=source_file.content,
+            stdout=coverage.stdout,
+            stderr=coverage.stderr,
+        )
+
+    async def _merge_improved_candidates(
+        self,
+        source_file: SourceFile,
+        snapshot: SnapshotEditor,
+        improved: List[CandidateResult],
+    ) -> TestCoverage:
+        """
+        커버리지를 올린 후보를 모두 메인 스냅샷에 적용한다.
+        둘 이상이면 합친 파일을 한 번 더 검증하고, 실패하면 가장 많이 올린 후보 하나만 남긴다.
+        """
+        for result in improved:
+            snapshot.add_new_test(
+                additional_test=result.single_test.test_code,
+                additional_imports=result.single_test.new_imports_code,
+            )
+        if len(improved) == 1:
+            return improved[0].coverage
+
+        merged_coverage = await self._validate(source_file, snapshot)
+        if merged_coverage.passed_test():
+            return merged_coverage
+
+        logging.warning("병합한 테스트 파일 검증 실패, 가장 좋은 후보 하나만 유지")
+        for _ in improved:
+            snapshot.rollback()
+        best = improved[0]
+        snapshot.add_new_test(
+            additional_test=best.single_test.test_code,
+            additional_imports=best.single_test.new_imports_code,
+        )
+        return best.coverage
+
+    def build_state(
+        self, source_file_name: str, source_file_path: str, source_file_content: str
+    ) -> TestSupervisorState:
+        return TestSupervisorState(
+            messages=[],
+            source_file=SourceFile(
+                language="python",
+                name=source_file_name,
+                content=source_file_content,
+                path=source_file_path,
+            ),
+        )
+
+    async def prepare(self, state: TestSupervisorState) -> TestSupervisorState:
+        """
+        finder, analysis, 기준 커버리지 검증만 실행한다.
+        배치 파이프라인은 다음 파일을 이렇게 준비해 두고, improve 는 끝난 단계를 건너뛴다.
+        """
+
+        async def run_stages():
+            if state.base_test_file is None:
+                await self._find_test_file(state)
+            if state.snapshot_editor is None:
+                await self._analyze_test_file(state)
+            if state.test_coverage is None:
+                await self._validate_baseline(state)
+            return state
+
+        with retry_budget_scope(retry_settings.RETRY_BUDGET_PER_RUN):
+            return await run_with_deadline(
+                run_stages(),
+                timeout=self.agent_timeout,
+                scope=self.deadline_scope,
+                name=type(self).__name__,
+            )
 
     async def cover_test(
         self,
         source_file_name: str,
         source_file_path: str,
         source_file_content: str,
+        run_id: str = DEFAULT_RUN_ID,
     ) -> ImprovedResult:
-        agent = self.build()
-        response = await agent.ainvoke(
-            TestSupervisorState(
-                messages=[],
-                source_file=SourceFile(
-                    language="python",
-                    name=source_file_name,
-                    content=source_file_content,
-                    path=source_file_path,
-                ),
-            )
+        return await self.improve(
+            self.build_state(source_file_name, source_file_path, source_file_content),
+            run_id=run_id,
+        )
+
+    async def has_checkpoint(
+        self, state: TestSupervisorState, run_id: str = DEFAULT_RUN_ID
+    ) -> bool:
+        """
+        완료됐거나 이어서 실행할 체크포인트가 있는지 확인한다.
+        있으면 improve 가 저장된 결과나 상태를 쓰므로 prepare 를 실행할 필요가 없다.
+        """
+        if self.checkpointer is None:
+            return False
+        checkpoint = await self.get_agent().aget_state(
+            self._checkpoint_config(state, run_id)
         )
+        return bool(checkpoint.values or checkpoint.next)
+
+    def _checkpoint_config(
+        self, state: TestSupervisorState, run_id: str
+    ) -> RunnableConfig:
+        source_file = state.source_file
+        thread_id = checkpoint_thread_id(source_file.path, source_file.content, run_id)
+        return {"configurable": {"thread_id": thread_id}}
+
+    async def improve(
+        self, state: TestSupervisorState, run_id: str = DEFAULT_RUN_ID
+    ) -> ImprovedResult:
+        """
+        체크포인터가 있으면 소스 파일 해시와 run_id 로 정한 스레드에서 실행한다.
+        중단된 실행은 마지막으로 완료된 노드 다음부터 이어서 실행하고, 완료된 실행은 저장된 결과를 돌려준다.
+        """
+        pipeline_key = state.pipeline_key
+        config = None
+        if self.checkpointer is not None:
+            config = self._checkpoint_config(state, run_id)
+            thread_id = config["configurable"]["thread_id"]
+            checkpoint = await self.get_agent().aget_state(config)
+            if checkpoint.values and not checkpoint.next:
+                logging.info("완료된 실행 결과 재사용: %s", thread_id)
+                metrics.increment(CHECKPOINT_REUSED)
+                return checkpoint.values["structured_response"]
+            if checkpoint.next:
+                logging.info(
+                    "체크포인트에서 이어서 실행: %s %s", thread_id, checkpoint.next
+                )
+                metrics.increment(CHECKPOINT_RESUMED)
+                pipeline_key = checkpoint.values["pipeline_key"]
+                state = None
+
+        try:
+            with retry_budget_scope(retry_settings.RETRY_BUDGET_PER_RUN):
+                response = await self.ainvoke_agent(state, config)
+        finally:
+            self._discard_prefetched_tests(pipeline_key)
+        if config is not None:
+            await self._prune_checkpoints(thread_id)
         return response["structured_response"]
-        # return ImprovedResult(
-        #     coverage_percent=100,
-        #     source_file=SourceFile(
-        #         language="python",
-        #         name=source_file_name,
-        #         content=source_file_content,
-        #         path=source_file_path,
-        #     ),
-        #     test_file=TestFile(
-        #         language="python",
-        #         name="",
-        #         content="",
-        #         path="",
-        #     ),
-        # )
+
+    async def _prune_checkpoints(self, thread_id: str) -> None:
+        """
+        정리는 SQLite 체크포인터에서만 하고, 실패해도 실행 결과에는 영향을 주지 않는다.
+        """
+        if not isinstance(self.checkpointer, AsyncSqliteSaver):
+            return
+        try:
+            await prune_checkpoints(
+                self.checkpointer, thread_id, self.checkpoint_keep_last
+            )
+        except Exception as e:
+            logging.warning("체크포인트 정리 실패: %s %r", thread_id, e)
+
+
+def _close_round(state: TestSupervisorState) -> None:
+    """
+    큐가 비면 이번 improver 반복을 마무리하고 연속 무개선 횟수를 갱신한다.
+    """
+    if state.single_test_queue:
+        return
+    if state.round_improved:
+        state.rounds_without_improvement = 0
+    else:
+        state.rounds_without_improvement += 1
+    state.round_improved = False
+    state.skip_batch_validation = False
+
+
+def _read_located_test_file(
+    test_locator: TestLocatorIndex, source_path: str
+) -> Optional[TestFile]:
+    test_path = test_locator.locate(source_path)
+    if test_path is None:
+        return None
+    return TestFile(
+        language="javascript" if test_path.endswith(("js", "jsx")) else "typescript",
+        name=os.path.basename(test_path),
+        content=Path(test_path).read_text(encoding="utf-8"),
+        path=test_path,
+    )
+
+
+def _add_tests(snapshot: SnapshotEditor, tests: List[SingleTest]) -> None:
+    for single_test in tests:
+        snapshot.add_new_test(
+            additional_test=single_test.test_code,
+            additional_imports=single_test.new_imports_code,
+        )
+
+
+def _rollback_tests(snapshot: SnapshotEditor, tests: List[SingleTest]) -> None:
+    for _ in tests:
+        snapshot.rollback()
+
+
+def _newly_covered_lines(
+    previous_coverage: Optional[TestCoverage], coverage: TestCoverage
+) -> Set[int]:
+    """
+    이전 실행에서 덮이지 않았고 이번 실행에서 덮인 라인
+    """
+    if previous_coverage is None or not coverage.passed_test():
+        return set()
+    return set(previous_coverage.uncovered_lines or []) - set(
+        coverage.uncovered_lines or []
+    )
+
+
+def _drop_stale_tests(
+    tests: List[SingleTest], state: TestSupervisorState
+) -> List[SingleTest]:
+    """
+    미리 생성한 테스트 중 이미 파일에 있거나, 노리는 라인이 그사이 모두 덮인 테스트를 뺀다.
+    """
+    test_file_content = normalize_code(state.snapshot_editor.test_file_content)
+    uncovered_lines = set(state.test_coverage.uncovered_lines or [])
+    fresh_tests = []
+    for single_test in tests:
+        lines_to_cover = parse_lines_to_cover(single_test.lines_to_cover)
+        if normalize_code(single_test.test_code) in test_file_content:
+            continue
+        if lines_to_cover and not lines_to_cover & uncovered_lines:
+            continue
+        fresh_tests.append(single_test)
+    metrics.increment(PIPELINE_PREFETCH_STALE, len(tests) - len(fresh_tests))
+    return fresh_tests
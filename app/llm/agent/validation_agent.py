@@ -1,35 +1,64 @@
-from typing import List
+import logging
+import time
+import uuid
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+)
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import ToolCall, ToolMessage
 from langgraph.graph.graph import CompiledGraph
 from langchain_core.tools import BaseTool
-from app.llm.agent.base import BaseAgentBuilder
+from app.core.metrics import metrics
+from app.llm.agent.base import OUTPUT_NODE, BaseAgentBuilder
 from app.prompts.validation_prompt import TestValidationPrompt
+from app.schemas.agent_event import AgentEvent
 from app.schemas.state import TestValidationState
 from app.schemas.structured_output import TestCoverage
 
+VALIDATION_DIRECT = "validation.direct"
+VALIDATION_DIRECT_FALLBACK = "validation.direct.fallback"
+
 
 class TestValidationAgent(BaseAgentBuilder):
     """
     테스트 코드의 유효성을 검증하고 개선 사항을 제안하는 에이전트
     """
 
+    role = "validation"
+    # 커버리지 도구가 있으면 LLM 이 테스트 파일을 인자로 다시 출력하게 하지 않고 직접 호출한다.
+    # LLM 은 도구 출력을 TestCoverage 로 바로 읽을 수 없을 때 해석하는 데만 쓴다.
+    direct_tool_call: ClassVar[bool] = True
+    coverage_tool_name: ClassVar[str] = "coverage_tool"
+
     def __init__(
         self,
         model: BaseChatModel,
         tools: List[BaseTool],
+        fallback_models: List[BaseChatModel] = [],
+        output_model: Optional[BaseChatModel] = None,
     ):
         super().__init__(
             model=model,
             tools=tools,
+            fallback_models=fallback_models,
+            output_model=output_model,
             tool_call_mode="single_turn",
         )
+        self._direct_output_node: Optional[Tuple[Hashable, Callable[..., Any]]] = None
 
     def build(self) -> CompiledGraph:
         return self.create_agentic_graph(
             state_schema=TestValidationState,
-            llm_node=self.create_llm_node(),
+            llm_node=self.create_llm_node(output_schema=TestCoverage),
             output_node=self.create_output_node(TestCoverage),
-        ).compile()
+        ).compile(checkpointer=False)
 
     async def validate_vitest(
         self,
@@ -38,17 +67,123 @@ class TestValidationAgent(BaseAgentBuilder):
         test_file_name: str,
         test_file_content: str,
     ) -> TestCoverage:
-        agent = self.build()
-        response = await agent.ainvoke(
-            TestValidationState(
-                messages=TestValidationPrompt(
-                    language="typescript",
-                    source_file_name=source_file_name,
-                    source_file_path=source_file_path,
-                    test_file_name=test_file_name,
-                    test_file_content=test_file_content,
-                    testing_framework="vitest",
-                ).build()
+        coverage_tool = self._coverage_tool()
+        if coverage_tool is not None:
+            coverage = await self._validate_directly(
+                coverage_tool,
+                source_file_name=source_file_name,
+                source_file_path=source_file_path,
+                test_file_name=test_file_name,
+                test_file_content=test_file_content,
+            )
+            if coverage is not None:
+                return coverage
+
+        response = await self.ainvoke_agent(
+            self._build_state(
+                source_file_name=source_file_name,
+                source_file_path=source_file_path,
+                test_file_name=test_file_name,
+                test_file_content=test_file_content,
             )
         )
         return response["structured_response"]
+
+    def _coverage_tool(self) -> Optional[BaseTool]:
+        if not self.direct_tool_call:
+            return None
+        return next(
+            (tool for tool in self.tools if tool.name == self.coverage_tool_name), None
+        )
+
+    async def _validate_directly(
+        self,
+        coverage_tool: BaseTool,
+        source_file_name: str,
+        source_file_path: str,
+        test_file_name: str,
+        test_file_content: str,
+    ) -> Optional[TestCoverage]:
+        """
+        스냅샷의 테스트 파일 내용으로 커버리지 도구를 바로 호출하고 출력을 TestCoverage 로 읽는다.
+        로컬 파싱에 실패하면 도구 출력만 LLM 에 넘겨 해석하고, 도구 호출이 실패하면 None 을 돌려 에이전트 경로로 넘긴다.
+        """
+        started = time.perf_counter()
+        tool_message: ToolMessage = await self._run_tool_call(
+            {coverage_tool.name: coverage_tool},
+            ToolCall(
+                name=coverage_tool.name,
+                args={
+                    name: value
+                    for name, value in {
+                        "source_file_name": source_file_name,
+                        "source_file_path": source_file_path,
+                        "test_file_name": test_file_name,
+                        "test_file_content": test_file_content,
+                    }.items()
+                    if name in coverage_tool.args
+                },
+                id=f"direct-{uuid.uuid4().hex}",
+            ),
+        )
+        if tool_message.status == "error":
+            logging.warning(
+                "커버리지 도구 직접 호출 실패, 에이전트로 검증: %s",
+                tool_message.content,
+            )
+            metrics.increment(VALIDATION_DIRECT_FALLBACK)
+            return None
+
+        update = await self._output_node()(TestValidationState(messages=[tool_message]))
+        metrics.observe(VALIDATION_DIRECT, time.perf_counter() - started)
+        return update["structured_response"]
+
+    def _output_node(self) -> Callable[..., Any]:
+        """
+        그래프의 output 노드와 같은 재시도, 제한 시간을 두른 파싱 노드를 모델 구성별로 한 번만 만든다.
+        """
+        key = self._graph_cache_key()
+        if self._direct_output_node is None or self._direct_output_node[0] != key:
+            self._direct_output_node = (
+                key,
+                self.node_retry_policy.wrap(
+                    self._with_node_timeout(
+                        self.create_output_node(TestCoverage), OUTPUT_NODE
+                    )
+                ),
+            )
+        return self._direct_output_node[1]
+
+    def astream_validate_vitest(
+        self,
+        source_file_name: str,
+        source_file_path: str,
+        test_file_name: str,
+        test_file_content: str,
+    ) -> AsyncIterator[AgentEvent]:
+        return self.astream_agent(
+            self._build_state(
+                source_file_name=source_file_name,
+                source_file_path=source_file_path,
+                test_file_name=test_file_name,
+                test_file_content=test_file_content,
+            )
+        )
+
+    def _build_state(
+        self,
+        source_file_name: str,
+        source_file_path: str,
+        test_file_name: str,
+        test_file_content: str,
+    ) -> TestValidationState:
+        return TestValidationState(
+            messages=TestValidationPrompt(
+                language="typescript",
+                source_file_name=source_file_name,
+                source_file_path=source_file_path,
+                test_file_name=test_file_name,
+                test_file_content=test_file_content,
+                testing_framework="vitest",
+            ).build()
+        )
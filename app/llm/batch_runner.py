@@ -0,0 +1,254 @@
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import AsyncIterator, Iterable, List, Optional, Self, Tuple, Union
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from pydantic import BaseModel, Field
+
+from app.core.deadline import run_with_deadline
+from app.core.metrics import metrics
+from app.core.setting import batch_settings
+from app.core.locator_index import TestLocatorIndex
+from app.llm.agent.supervisor_agent import TestSupervisorAgent
+from app.llm.model_factory import ModelFactory
+from app.mcp.client import McpManager
+from app.schemas.model_factory import ModelRoutingConfig
+from app.schemas.state import TestSupervisorState
+from app.schemas.structured_output import ImprovedResult
+
+BATCH_FILE = "batch.file"
+BATCH_FILE_SUCCEEDED = "batch.file.succeeded"
+BATCH_FILE_FAILED = "batch.file.failed"
+BATCH_PREPARE_SKIPPED = "batch.prepare.skipped"
+
+PathLike = Union[str, Path]
+
+
+class BatchFileResult(BaseModel):
+    source_file_path: str = Field(description="The path of the source file")
+    result: Optional[ImprovedResult] = Field(
+        default=None, description="The improved result when the pipeline succeeded"
+    )
+    error: Optional[str] = Field(
+        default=None, description="The error when the pipeline failed"
+    )
+    elapsed: float = Field(description="The pipeline duration in seconds")
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class BatchRunner:
+    """
+    여러 소스 파일의 cover_test 파이프라인을 하나의 supervisor 로 동시에 실행하는 실행기
+    """
+
+    def __init__(
+        self,
+        supervisor: TestSupervisorAgent,
+        concurrency: int = batch_settings.BATCH_CONCURRENCY,
+        pipelined: bool = batch_settings.BATCH_PIPELINED,
+        prepare_concurrency: int = batch_settings.BATCH_PREPARE_CONCURRENCY,
+        queue_size: int = batch_settings.BATCH_PIPELINE_QUEUE_SIZE,
+    ) -> None:
+        # 모든 파일이 같은 supervisor 를 쓰므로 모델, 도구, 컴파일된 그래프를 공유한다
+        self.supervisor = supervisor
+        self.concurrency = concurrency
+        self.pipelined = pipelined
+        self.prepare_concurrency = prepare_concurrency
+        self.queue_size = queue_size
+
+    @classmethod
+    async def from_routing_config(
+        cls,
+        routing: ModelRoutingConfig,
+        mcp_manager: McpManager,
+        concurrency: int = batch_settings.BATCH_CONCURRENCY,
+        model_factory: Optional[ModelFactory] = None,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+        pipelined: bool = batch_settings.BATCH_PIPELINED,
+        test_locator: Optional[TestLocatorIndex] = None,
+    ) -> Self:
+        supervisor = await TestSupervisorAgent.from_routing_config(
+            routing,
+            finder_tools=mcp_manager.tools,
+            validation_tools=mcp_manager.tools,
+            failure_analysis_tools=mcp_manager.tools,
+            model_factory=model_factory,
+            checkpointer=checkpointer,
+            test_locator=test_locator,
+        )
+        return cls(supervisor, concurrency=concurrency, pipelined=pipelined)
+
+    async def run(
+        self, source_paths: Iterable[PathLike]
+    ) -> AsyncIterator[BatchFileResult]:
+        """
+        끝나는 순서대로 결과를 내보낸다.
+        한 파일의 실패는 해당 결과의 error 로만 기록하고 나머지 파일은 계속 진행한다.
+        """
+        source_paths = [Path(path) for path in source_paths]
+        results = (
+            self._run_pipelined(source_paths)
+            if self.pipelined
+            else self._run_concurrently(source_paths)
+        )
+        async for result in results:
+            yield result
+
+    async def run_all(self, source_paths: Iterable[PathLike]) -> List[BatchFileResult]:
+        return [result async for result in self.run(source_paths)]
+
+    async def _run_concurrently(
+        self, source_paths: List[Path]
+    ) -> AsyncIterator[BatchFileResult]:
+        # 전역 세마포어로 파일 단위 동시 실행 수를 제한한다
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [
+            asyncio.create_task(self._cover_file(path, semaphore))
+            for path in source_paths
+        ]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _run_pipelined(
+        self, source_paths: List[Path]
+    ) -> AsyncIterator[BatchFileResult]:
+        """
+        finder, analysis, 기준 검증(prepare) 단계와 improve 단계를 크기가 제한된 큐로 잇는다.
+        파일 N 을 개선하는 동안 파일 N+1 을 준비하고, improve 가 밀리면 prepare 는 큐 크기 이상 앞서가지 않는다.
+        """
+        pending: asyncio.Queue[Path] = asyncio.Queue()
+        for path in source_paths:
+            pending.put_nowait(path)
+        prepared: asyncio.Queue[
+            Optional[Tuple[Path, float, Optional[float], TestSupervisorState]]
+        ] = asyncio.Queue(maxsize=self.queue_size)
+        results: asyncio.Queue[BatchFileResult] = asyncio.Queue()
+
+        async def prepare_worker():
+            while not pending.empty():
+                source_path = pending.get_nowait()
+                started = time.perf_counter()
+                try:
+                    content = await asyncio.to_thread(
+                        source_path.read_text, encoding="utf-8"
+                    )
+                    state = self.supervisor.build_state(
+                        source_path.name, str(source_path), content
+                    )
+                    # 완료됐거나 이어서 실행할 파일은 improve 가 체크포인트를 쓰므로 준비하지 않는다
+                    if await self.supervisor.has_checkpoint(state):
+                        metrics.increment(BATCH_PREPARE_SKIPPED)
+                    else:
+                        state = await self.supervisor.prepare(state)
+                except Exception as e:
+                    results.put_nowait(_failed_result(source_path, started, e))
+                    continue
+                # prepare 와 improve 가 한 파일의 실행 제한 시간을 나눠 쓴다
+                remaining = _remaining_timeout(
+                    self.supervisor.agent_timeout, time.perf_counter() - started
+                )
+                await prepared.put((source_path, started, remaining, state))
+
+        async def prepare_all():
+            await asyncio.gather(
+                *(prepare_worker() for _ in range(self.prepare_concurrency))
+            )
+            for _ in range(self.concurrency):
+                await prepared.put(None)
+
+        async def improve_worker():
+            while (item := await prepared.get()) is not None:
+                source_path, started, remaining, state = item
+                try:
+                    result = await run_with_deadline(
+                        self.supervisor.improve(state),
+                        timeout=remaining,
+                        scope=self.supervisor.deadline_scope,
+                        name=type(self.supervisor).__name__,
+                    )
+                except Exception as e:
+                    results.put_nowait(_failed_result(source_path, started, e))
+                    continue
+                results.put_nowait(_succeeded_result(source_path, started, result))
+
+        tasks = [
+            asyncio.create_task(prepare_all()),
+            *(asyncio.create_task(improve_worker()) for _ in range(self.concurrency)),
+        ]
+        try:
+            for _ in source_paths:
+                yield await results.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _cover_file(
+        self, source_path: Path, semaphore: asyncio.Semaphore
+    ) -> BatchFileResult:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                content = await asyncio.to_thread(
+                    source_path.read_text, encoding="utf-8"
+                )
+                result = await self.supervisor.cover_test(
+                    source_file_name=source_path.name,
+                    source_file_path=str(source_path),
+                    source_file_content=content,
+                )
+            except Exception as e:
+                return _failed_result(source_path, started, e)
+            return _succeeded_result(source_path, started, result)
+
+
+def _remaining_timeout(timeout: Optional[float], elapsed: float) -> Optional[float]:
+    return None if timeout is None else max(0.0, timeout - elapsed)
+
+
+def _failed_result(
+    source_path: Path, started: float, error: Exception
+) -> BatchFileResult:
+    elapsed = time.perf_counter() - started
+    logging.error("파일 처리 실패: %s %r", source_path, error)
+    metrics.increment(BATCH_FILE_FAILED)
+    return BatchFileResult(
+        source_file_path=str(source_path), error=repr(error), elapsed=elapsed
+    )
+
+
+def _succeeded_result(
+    source_path: Path, started: float, result: ImprovedResult
+) -> BatchFileResult:
+    elapsed = time.perf_counter() - started
+    logging.info("파일 처리 완료: %s (%.1f초)", source_path, elapsed)
+    metrics.increment(BATCH_FILE_SUCCEEDED)
+    metrics.observe(BATCH_FILE, elapsed)
+    return BatchFileResult(
+        source_file_path=str(source_path), result=result, elapsed=elapsed
+    )
+
+
+def resolve_source_paths(patterns: Iterable[str], root: PathLike = ".") -> List[Path]:
+    """
+    파일 경로와 glob 패턴(**/*.tsx 등)을 root 기준의 중복 없는 파일 목록으로 바꾼다.
+    """
+    root = Path(root)
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        candidate = root / pattern
+        matches = [candidate] if candidate.is_file() else sorted(root.glob(pattern))
+        for path in matches:
+            if path.is_file() and path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
@@ -0,0 +1,81 @@
+import hashlib
+import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from app.core.metrics import metrics
+from app.core.setting import checkpoint_settings
+
+DEFAULT_RUN_ID = "default"
+
+CHECKPOINT_RESUMED = "checkpoint.resumed"
+CHECKPOINT_REUSED = "checkpoint.reused"
+CHECKPOINT_PRUNED = "checkpoint.pruned"
+
+
+@asynccontextmanager
+async def open_checkpointer(
+    path: Optional[str] = None,
+) -> AsyncIterator[AsyncSqliteSaver]:
+    """
+    SQLite 파일 기반 체크포인터를 연다. 블록을 벗어나면 연결을 닫는다.
+    """
+    if path is None:
+        path = checkpoint_settings.CHECKPOINT_PATH
+    if path != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    async with AsyncSqliteSaver.from_conn_string(path) as checkpointer:
+        await checkpointer.setup()
+        yield checkpointer
+
+
+def checkpoint_thread_id(
+    source_file_path: str, source_file_content: str, run_id: str = DEFAULT_RUN_ID
+) -> str:
+    """
+    소스 파일 경로와 내용의 해시, 실행 id 로 체크포인트 스레드를 정한다.
+    파일이 바뀌면 새 스레드에서 처음부터 실행한다.
+    """
+    digest = hashlib.sha256(
+        f"{source_file_path}\0{source_file_content}".encode("utf-8")
+    ).hexdigest()
+    return f"{digest[:16]}:{run_id}"
+
+
+async def prune_checkpoints(
+    checkpointer: AsyncSqliteSaver, thread_id: str, keep_last: int
+) -> int:
+    """
+    스레드의 체크포인트 중 최근 keep_last 개와 그 쓰기 기록만 남기고 지운다.
+    체크포인트 id 는 시간순으로 정렬되는 uuid6 이다.
+    """
+    await checkpointer.setup()
+    async with checkpointer.lock, checkpointer.conn.cursor() as cur:
+        await cur.execute(
+            """
+            DELETE FROM checkpoints
+            WHERE thread_id = ? AND checkpoint_id NOT IN (
+                SELECT checkpoint_id FROM checkpoints
+                WHERE thread_id = ? ORDER BY checkpoint_id DESC LIMIT ?
+            )
+            """,
+            (thread_id, thread_id, keep_last),
+        )
+        pruned = cur.rowcount
+        await cur.execute(
+            """
+            DELETE FROM writes
+            WHERE thread_id = ? AND checkpoint_id NOT IN (
+                SELECT checkpoint_id FROM checkpoints WHERE thread_id = ?
+            )
+            """,
+            (thread_id, thread_id),
+        )
+        await checkpointer.conn.commit()
+    if pruned:
+        metrics.increment(CHECKPOINT_PRUNED, pruned)
+        logging.info("오래된 체크포인트 %d개 정리: %s", pruned, thread_id)
+    return pruned
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from app.core.metrics import metrics
+from app.core.setting import hedging_settings
+
+HEDGE_PREFIX = "hedge"
+HEDGE_FIRED = "hedge.fired"
+HEDGE_WON = "hedge.won"
+HEDGE_BUDGET_EXHAUSTED = "hedge.budget_exhausted"
+
+ResultLike = TypeVar("ResultLike")
+
+
+class RequestHedger:
+    """
+    최근 지연 시간 분포의 백분위 시점까지 응답이 없으면 같은 요청을 한 번 더 보내고 먼저 끝난 정상 응답을 쓰는 래퍼
+    """
+
+    def __init__(
+        self,
+        percentile: float = hedging_settings.HEDGE_PERCENTILE,
+        min_samples: int = hedging_settings.HEDGE_MIN_SAMPLES,
+        min_delay: float = hedging_settings.HEDGE_MIN_DELAY,
+        budget_ratio: float = hedging_settings.HEDGE_BUDGET_RATIO,
+    ) -> None:
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        # 전체 요청 대비 추가로 보낼 수 있는 요청의 비율
+        self.budget_ratio = budget_ratio
+        self.requests = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """
+        key 의 최근 지연 시간 백분위 값, 표본이 부족하면 None
+        """
+        samples = sorted(metrics.recent_timings(_latency_name(key)))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, math.ceil(self.percentile * len(samples)) - 1)
+        return max(self.min_delay, samples[max(0, index)])
+
+    def _try_acquire_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.budget_ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    async def run(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[ResultLike]],
+    ) -> ResultLike:
+        """
+        call 을 실행하고 hedge_delay 안에 끝나지 않으면 예산 안에서 한 번 더 실행한다.
+        예외 없이 먼저 끝난 쪽을 반환하고 나머지는 취소하며, 둘 다 실패하면 마지막 예외를 던진다.
+        """
+        with self._lock:
+            self.requests += 1
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(call())
+        pending = {primary}
+        try:
+            delay = self.hedge_delay(key)
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done:
+                    if self._try_acquire_hedge():
+                        logging.warning(
+                            "%s 응답 지연 %.2f초, 중복 요청 전송", key, delay
+                        )
+                        metrics.increment(HEDGE_FIRED)
+                        pending.add(asyncio.ensure_future(call()))
+                    else:
+                        metrics.increment(HEDGE_BUDGET_EXHAUSTED)
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    if task is not primary:
+                        metrics.increment(HEDGE_WON)
+                    metrics.observe(_latency_name(key), time.perf_counter() - started)
+                    return task.result()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def _latency_name(key: str) -> str:
+    return f"{HEDGE_PREFIX}.{key}.latency"
@@ -0,0 +1,120 @@
+import logging
+from typing import Callable, List, Optional, Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+from app.core.metrics import metrics
+
+TOKENS_SAVED = "message_compactor.tokens_saved"
+COMPACTED_TURNS = "message_compactor.compacted_turns"
+
+
+def estimate_tokens(message: BaseMessage) -> int:
+    """모델 호출 없이 쓰는 근사치, 평균적으로 4글자가 1토큰에 해당한다"""
+    content = message.content
+    if not isinstance(content, str):
+        content = str(content)
+    tool_calls = getattr(message, "tool_calls", None) or []
+    return (len(content) + len(str(tool_calls))) // 4 + 1
+
+
+class MessageCompactor:
+    """
+    멀티턴 에이전트의 메시지 이력을 토큰 예산 안으로 줄이는 압축기.
+    시스템/사용자 프롬프트와 최근 K 번의 교환은 그대로 두고, 오래된 도구 결과부터 잘라낸다.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 24_000,
+        keep_last_exchanges: int = 2,
+        truncated_tool_output_chars: int = 600,
+        token_counter: Callable[[BaseMessage], int] = estimate_tokens,
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.keep_last_exchanges = keep_last_exchanges
+        self.truncated_tool_output_chars = truncated_tool_output_chars
+        self.token_counter = token_counter
+
+    def __call__(self, messages: Sequence[BaseMessage]) -> List[BaseMessage]:
+        compacted = list(messages)
+        original_tokens = sum(self.token_counter(msg) for msg in compacted)
+        if original_tokens <= self.max_tokens:
+            return compacted
+
+        total_tokens = original_tokens
+        candidates = self._compactable_indexes(compacted)
+
+        # 1단계: 오래된 도구 결과의 앞뒤만 남긴다
+        for index in candidates:
+            if total_tokens <= self.max_tokens:
+                break
+            total_tokens += self._replace(
+                compacted, index, self._truncate(compacted[index])
+            )
+
+        # 2단계: 그래도 넘치면 한 줄 요약으로 대체한다
+        for index in candidates:
+            if total_tokens <= self.max_tokens:
+                break
+            total_tokens += self._replace(
+                compacted, index, self._summarize(messages[index])
+            )
+
+        saved_tokens = original_tokens - total_tokens
+        if saved_tokens > 0:
+            metrics.increment(TOKENS_SAVED, saved_tokens)
+            metrics.increment(COMPACTED_TURNS)
+            logging.info(
+                "메시지 압축: %d -> %d 토큰 (%d 절약)",
+                original_tokens,
+                total_tokens,
+                saved_tokens,
+            )
+        return compacted
+
+    def _compactable_indexes(self, messages: List[BaseMessage]) -> List[int]:
+        ai_indexes = [i for i, msg in enumerate(messages) if isinstance(msg, AIMessage)]
+        if not ai_indexes:
+            return []
+
+        # 첫 AIMessage 이전은 프롬프트, 최근 K 번째 AIMessage 이후는 최근 교환이다
+        if self.keep_last_exchanges > 0:
+            recent_start = ai_indexes[
+                max(0, len(ai_indexes) - self.keep_last_exchanges)
+            ]
+        else:
+            recent_start = len(messages)
+        return [
+            i
+            for i in range(ai_indexes[0], recent_start)
+            if isinstance(messages[i], ToolMessage)
+        ]
+
+    def _replace(
+        self, messages: List[BaseMessage], index: int, content: Optional[str]
+    ) -> int:
+        if content is None:
+            return 0
+        before = self.token_counter(messages[index])
+        messages[index] = messages[index].model_copy(update={"content": content})
+        return self.token_counter(messages[index]) - before
+
+    def _truncate(self, message: ToolMessage) -> Optional[str]:
+        content = (
+            message.content
+            if isinstance(message.content, str)
+            else str(message.content)
+        )
+        limit = self.truncated_tool_output_chars
+        if len(content) <= limit:
+            return None
+        half = limit // 2
+        omitted = len(content) - 2 * half
+        return f"{content[:half]}\n... [{omitted} characters truncated] ...\n{content[-half:]}"
+
+    def _summarize(self, message: ToolMessage) -> str:
+        return (
+            f"[Output of `{message.name}` omitted to save context: "
+            f"about {self.token_counter(message)} tokens, status={message.status}]"
+        )
@@ -1,10 +1,18 @@
 import asyncio
+import json
 from abc import ABC, abstractmethod
 
 from langchain_core.language_models import BaseChatModel
 from langchain_google_genai import ChatGoogleGenerativeAI
+from pydantic import SecretStr
 
-from app.schemas.model_factory import ModelParams, GeminiParams
+from app.schemas.model_factory import (
+    AgentRole,
+    GeminiParams,
+    ModelParams,
+    ModelRoutingConfig,
+    NodeType,
+)
 
 
 class BaseModelLoader(ABC):
@@ -30,8 +38,32 @@ class ModelFactory:
         GeminiParams.MODEL_TYPE: GeminiLoader(),
     }
 
+    def __init__(self):
+        # 같은 파라미터를 쓰는 역할끼리 모델 인스턴스를 공유한다
+        self._loaded = {}
+
     async def load_llm(self, params: ModelParams) -> BaseChatModel:
         model_type = params.MODEL_TYPE
         if model_type not in self._registry:
             raise ValueError(f"Unsupported model type: {model_type}")
         return await self._registry[model_type].load_llm(params)
+
+    async def load_routed_llm(
+        self,
+        routing: ModelRoutingConfig,
+        role: AgentRole,
+        node_type: NodeType = "llm",
+    ) -> BaseChatModel:
+        params = routing.params_for(role, node_type)
+        key = _params_key(params)
+        if key not in self._loaded:
+            self._loaded[key] = await self.load_llm(params)
+        return self._loaded[key]
+
+
+def _params_key(params: ModelParams) -> str:
+    values = {
+        name: value.get_secret_value() if isinstance(value, SecretStr) else value
+        for name, value in params.model_dump().items()
+    }
+    return json.dumps([params.MODEL_TYPE, values], sort_keys=True, default=str)
@@ -0,0 +1,62 @@
+import time
+from typing import List, Optional
+
+from langchain_core.messages import BaseMessage
+from pydantic import BaseModel, Field
+
+from app.core.metrics import metrics
+
+MODEL_USAGE_PREFIX = "model"
+
+
+class ModelUsage(BaseModel):
+    role: str = Field(description="The agent role that called the model")
+    node_type: str = Field(description="The node type, llm or output")
+    calls: int = Field(description="The number of model calls")
+    mean_latency: float = Field(description="The mean call latency in seconds")
+    max_latency: float = Field(description="The slowest call latency in seconds")
+    input_tokens: int = Field(description="The total prompt tokens")
+    output_tokens: int = Field(description="The total completion tokens")
+
+
+def record_model_usage(
+    role: str,
+    node_type: str,
+    started: float,
+    message: Optional[BaseMessage],
+) -> None:
+    """
+    started 는 time.perf_counter() 값이고, 토큰 수는 응답 메시지의 usage_metadata 에서 읽는다.
+    """
+    name = f"{MODEL_USAGE_PREFIX}.{role}.{node_type}"
+    metrics.observe(f"{name}.latency", time.perf_counter() - started)
+    usage = getattr(message, "usage_metadata", None)
+    if usage:
+        metrics.increment(f"{name}.input_tokens", usage.get("input_tokens", 0))
+        metrics.increment(f"{name}.output_tokens", usage.get("output_tokens", 0))
+
+
+def model_usage_report() -> List[ModelUsage]:
+    """
+    역할, 노드 종류별 모델 호출 지연 시간과 토큰 사용량
+    """
+    report = []
+    for name in sorted(metrics.snapshot()["timings"]):
+        parts = name.split(".")
+        if len(parts) != 4 or parts[0] != MODEL_USAGE_PREFIX or parts[3] != "latency":
+            continue
+        _, role, node_type, _ = parts
+        prefix = f"{MODEL_USAGE_PREFIX}.{role}.{node_type}"
+        latency = metrics.timing(name)
+        report.append(
+            ModelUsage(
+                role=role,
+                node_type=node_type,
+                calls=latency.count,
+                mean_latency=latency.mean,
+                max_latency=latency.max,
+                input_tokens=int(metrics.counter(f"{prefix}.input_tokens")),
+                output_tokens=int(metrics.counter(f"{prefix}.output_tokens")),
+            )
+        )
+    return report
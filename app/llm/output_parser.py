@@ -0,0 +1,150 @@
+import ast
+import json
+import re
+from typing import Any, Iterator, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+OutputLike = TypeVar("OutputLike", bound=BaseModel)
+
+_FENCED_BLOCK_PATTERN = re.compile(r"```[\w+-]*[ \t]*\n(.*?)```", re.DOTALL)
+# JSON 문자열, 파이썬 리터럴, 닫는 괄호 앞의 쉼표. 문자열 안은 고치지 않는다
+_JSON_REPAIR_PATTERN = re.compile(
+    r'"(?:\\.|[^"\\])*"|\b(True|False|None)\b|,(\s*[}\]])'
+)
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+def parse_output_locally(
+    content: Any, schema: Type[OutputLike]
+) -> Optional[OutputLike]:
+    """
+    LLM 호출 없이 메시지 본문을 출력 스키마로 검증한다.
+    코드 블록 추출, 관대한 JSON 복구, pydantic repr 형식을 순서대로 시도하고 실패하면 None 을 반환한다.
+    """
+    text = _content_to_text(content)
+    if not text.strip():
+        return None
+
+    for candidate in _candidate_texts(text):
+        for value in _decode_candidates(candidate, schema):
+            try:
+                return schema.model_validate(value)
+            except ValidationError:
+                continue
+    return None
+
+
+def _content_to_text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for block in content:
+            if isinstance(block, str):
+                parts.append(block)
+            elif isinstance(block, dict) and block.get("type") == "text":
+                parts.append(block.get("text", ""))
+        return "\n".join(parts)
+    return ""
+
+
+def _candidate_texts(text: str) -> Iterator[str]:
+    for match in _FENCED_BLOCK_PATTERN.finditer(text):
+        yield match.group(1).strip()
+    yield text.strip()
+    for start, end in _balanced_object_spans(text):
+        yield text[start:end]
+
+
+def _balanced_object_spans(text: str) -> List[tuple[int, int]]:
+    """문자열 리터럴을 건너뛰며 최상위 중괄호 구간을 찾는다"""
+    spans = []
+    depth = 0
+    start = -1
+    quote: Optional[str] = None
+    escaped = False
+    for index, char in enumerate(text):
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+            continue
+        if char in ('"', "'") and depth > 0:
+            quote = char
+        elif char == "{":
+            if depth == 0:
+                start = index
+            depth += 1
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                spans.append((start, index + 1))
+    return spans
+
+
+def _decode_candidates(candidate: str, schema: Type[BaseModel]) -> Iterator[Any]:
+    try:
+        yield json.loads(candidate)
+    except ValueError:
+        pass
+
+    repaired = _repair_json(candidate)
+    if repaired != candidate:
+        try:
+            yield json.loads(repaired)
+        except ValueError:
+            pass
+
+    try:
+        yield ast.literal_eval(candidate)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        pass
+
+    model_repr = _parse_model_repr(candidate, schema)
+    if model_repr is not None:
+        yield model_repr
+
+
+def _repair_json(candidate: str) -> str:
+    def repair(match: re.Match) -> str:
+        if match.group(1):
+            return _PYTHON_LITERALS[match.group(1)]
+        if match.group(2) is not None:
+            return match.group(2)
+        return match.group()
+
+    return _JSON_REPAIR_PATTERN.sub(repair, candidate)
+
+
+def _parse_model_repr(candidate: str, schema: Type[BaseModel]) -> Optional[dict]:
+    """
+    도구가 pydantic 모델을 그대로 반환하면 `field=value field=value` 형태의 문자열이 된다.
+    스키마의 필드명을 경계로 값을 나눠 파이썬 리터럴로 해석한다.
+    """
+    body = candidate.strip()
+    prefix = f"{schema.__name__}("
+    if body.startswith(prefix) and body.endswith(")"):
+        body = body[len(prefix) : -1]
+
+    field_names = "|".join(re.escape(name) for name in schema.model_fields)
+    if not field_names:
+        return None
+    boundaries = list(re.finditer(rf"(?:^|[\s,])({field_names})=", body))
+    if not boundaries or boundaries[0].start(1) != 0:
+        return None
+
+    values = {}
+    for index, boundary in enumerate(boundaries):
+        end = (
+            boundaries[index + 1].start() if index + 1 < len(boundaries) else len(body)
+        )
+        raw_value = body[boundary.end() : end].strip().rstrip(",")
+        try:
+            values[boundary.group(1)] = ast.literal_eval(raw_value)
+        except (ValueError, SyntaxError, MemoryError, RecursionError):
+            return None
+    return values
@@ -0,0 +1,188 @@
+import asyncio
+import functools
+import logging
+import random
+import re
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http import HTTPStatus
+from typing import Any, Callable, Coroutine, Dict, Iterator, Optional, Type
+
+from pydantic import BaseModel, Field
+
+from app.core.metrics import metrics
+
+RETRY_SLEEP_SECONDS = "retry.sleep_seconds"
+RETRY_BUDGET_EXHAUSTED = "retry.budget_exhausted"
+RETRY_ATTEMPT_PREFIX = "retry.attempt"
+
+_DURATION_PATTERN = re.compile(r"^\s*([\d.]+)\s*s?\s*$")
+
+
+class RetryRule(BaseModel):
+    max_attempts: int = Field(ge=1, default=3)
+    base_delay: float = Field(ge=0.0, default=0.5)
+    max_delay: float = Field(ge=0.0, default=8.0)
+
+
+class RetryBudget:
+    """
+    supervisor 실행 한 번 동안 모든 노드가 공유하는 재시도 횟수 예산
+    """
+
+    def __init__(self, max_retries: int) -> None:
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.max_retries - self.used)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.used >= self.max_retries:
+                return False
+            self.used += 1
+            return True
+
+
+_current_retry_budget: ContextVar[Optional[RetryBudget]] = ContextVar(
+    "current_retry_budget", default=None
+)
+
+
+def current_retry_budget() -> Optional[RetryBudget]:
+    return _current_retry_budget.get()
+
+
+@contextmanager
+def retry_budget_scope(max_retries: int) -> Iterator[RetryBudget]:
+    """
+    블록 안에서 실행되는 노드(하위 에이전트 포함)가 하나의 재시도 예산을 공유하게 한다.
+    asyncio 태스크는 생성 시점의 컨텍스트를 복사하므로 중첩 그래프에도 전파된다.
+    """
+    budget = RetryBudget(max_retries)
+    token = _current_retry_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_retry_budget.reset(token)
+
+
+class AdaptiveRetryPolicy:
+    """
+    예외 종류별 규칙, full jitter 백오프, 재시도 예산, 제공자 retry-after 를 반영하는 노드 재시도 정책
+    """
+
+    def __init__(
+        self,
+        rules: Dict[Type[BaseException], RetryRule],
+        rate_limit_rule: Optional[RetryRule] = None,
+    ) -> None:
+        self.rules = rules
+        self.rate_limit_rule = rate_limit_rule
+
+    def rule_for(self, error: BaseException) -> Optional[RetryRule]:
+        if self.rate_limit_rule is not None and is_rate_limit_error(error):
+            return self.rate_limit_rule
+        for error_type in type(error).__mro__:
+            if error_type in self.rules:
+                return self.rules[error_type]
+        return None
+
+    def compute_delay(
+        self, rule: RetryRule, attempt: int, error: BaseException
+    ) -> float:
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            # 제공자가 알려준 대기 시간보다 일찍 재시도해도 다시 거절된다
+            return retry_after + random.uniform(0, rule.base_delay)
+        ceiling = min(rule.max_delay, rule.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def wrap(
+        self, node: Callable[..., Coroutine[Any, Any, Any]]
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        @functools.wraps(node)
+        async def node_with_retry(*args, **kwargs):
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    return await node(*args, **kwargs)
+                except Exception as e:
+                    rule = self.rule_for(e)
+                    if rule is None or attempt >= rule.max_attempts:
+                        raise
+                    budget = current_retry_budget()
+                    if budget is not None and not budget.try_acquire():
+                        logging.error("재시도 예산 소진: %r", e)
+                        metrics.increment(RETRY_BUDGET_EXHAUSTED)
+                        raise
+
+                    delay = self.compute_delay(rule, attempt, e)
+                    metrics.increment(f"{RETRY_ATTEMPT_PREFIX}.{type(e).__name__}")
+                    metrics.observe(RETRY_SLEEP_SECONDS, delay)
+                    logging.warning(
+                        "%s 재시도 %d/%d, %.2f초 대기: %r",
+                        getattr(node, "__name__", "node"),
+                        attempt,
+                        rule.max_attempts - 1,
+                        delay,
+                        e,
+                    )
+                    await asyncio.sleep(delay)
+
+        return node_with_retry
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    for attribute in ("code", "status_code"):
+        if getattr(error, attribute, None) == HTTPStatus.TOO_MANY_REQUESTS:
+            return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == HTTPStatus.TOO_MANY_REQUESTS
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    예외에 담긴 재시도 대기 시간을 찾는다.
+    retry_after 속성, HTTP Retry-After 헤더, google.rpc.RetryInfo 순서로 확인한다.
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if isinstance(retry_after, (int, float)):
+        return float(retry_after)
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is not None:
+        seconds = _parse_duration(headers.get("retry-after"))
+        if seconds is not None:
+            return seconds
+
+    try:
+        details = list(getattr(error, "details", None) or [])
+    except TypeError:
+        details = []
+    for detail in details:
+        if isinstance(detail, dict):
+            seconds = _parse_duration(detail.get("retryDelay"))
+        else:
+            seconds = _parse_protobuf_duration(getattr(detail, "retry_delay", None))
+        if seconds is not None:
+            return seconds
+    return None
+
+
+def _parse_duration(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    match = _DURATION_PATTERN.match(str(value))
+    return float(match.group(1)) if match else None
+
+
+def _parse_protobuf_duration(value: Any) -> Optional[float]:
+    if value is None or not hasattr(value, "seconds"):
+        return None
+    return value.seconds + getattr(value, "nanos", 0) / 1e9
@@ -0,0 +1,190 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from inspect import signature
+from typing import Any, Iterable, List, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, ConfigDict
+
+from app.core.metrics import metrics
+
+TOOL_CACHE_HIT = "mcp_tool_cache.hit"
+TOOL_CACHE_MISS = "mcp_tool_cache.miss"
+
+
+class ToolCacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ToolResultCache:
+    """
+    도구 이름과 정규화된 인자를 키로 MCP 도구 호출 결과를 보관하는 LRU/TTL 캐시
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: Optional[float] = 300.0,
+        excluded_tools: Iterable[str] = (),
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.excluded_tools = set(excluded_tools)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_cacheable(self, tool_name: str) -> bool:
+        return tool_name not in self.excluded_tools
+
+    def make_key(self, tool_name: str, args: tuple, kwargs: dict) -> str:
+        return json.dumps(
+            [tool_name, list(args), kwargs],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_canonicalize,
+        )
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._is_expired(entry[0]):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                metrics.increment(TOOL_CACHE_HIT)
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            metrics.increment(TOOL_CACHE_MISS)
+            return False, None
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """
+        워크스페이스가 바뀌었을 수 있을 때 결과만 버리고 적중 통계는 유지한다
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> ToolCacheStats:
+        with self._lock:
+            return ToolCacheStats(
+                hits=self.hits, misses=self.misses, size=len(self._entries)
+            )
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.monotonic() - stored_at > self.ttl
+
+
+class CachedTool(BaseTool):
+    """
+    원본 도구의 스키마를 그대로 노출하면서 호출 결과를 ToolResultCache 에 보관하는 래퍼.
+    캐시하지 않는 도구는 테스트 파일을 쓰는 등 워크스페이스를 바꿀 수 있어 실행 후 캐시를 비운다.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    tool: BaseTool
+    cache: ToolResultCache
+
+    def __init__(self, tool: BaseTool, cache: ToolResultCache, **kwargs: Any):
+        super().__init__(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            return_direct=tool.return_direct,
+            response_format=tool.response_format,
+            metadata=tool.metadata,
+            tags=tool.tags,
+            tool=tool,
+            cache=cache,
+            **kwargs,
+        )
+
+    def _run(
+        self, *args: Any, config: RunnableConfig, run_manager=None, **kwargs: Any
+    ) -> Any:
+        if not self.cache.is_cacheable(self.name):
+            try:
+                return _call_tool(self.tool._run, args, kwargs, config, run_manager)
+            finally:
+                self.cache.invalidate()
+
+        key = self.cache.make_key(self.name, args, kwargs)
+        found, value = self.cache.get(key)
+        if found:
+            return value
+        value = _call_tool(self.tool._run, args, kwargs, config, run_manager)
+        self.cache.set(key, value)
+        return value
+
+    async def _arun(
+        self, *args: Any, config: RunnableConfig, run_manager=None, **kwargs: Any
+    ) -> Any:
+        if not self.cache.is_cacheable(self.name):
+            try:
+                return await _call_tool(
+                    self.tool._arun, args, kwargs, config, run_manager
+                )
+            finally:
+                self.cache.invalidate()
+
+        key = self.cache.make_key(self.name, args, kwargs)
+        found, value = self.cache.get(key)
+        if found:
+            return value
+        value = await _call_tool(self.tool._arun, args, kwargs, config, run_manager)
+        self.cache.set(key, value)
+        return value
+
+
+def wrap_tools_with_cache(
+    tools: List[BaseTool], cache: ToolResultCache
+) -> List[BaseTool]:
+    return [
+        tool if isinstance(tool, CachedTool) else CachedTool(tool=tool, cache=cache)
+        for tool in tools
+    ]
+
+
+def _call_tool(method, args: tuple, kwargs: dict, config, run_manager):
+    parameters = signature(method).parameters
+    tool_kwargs = dict(kwargs)
+    if "config" in parameters:
+        tool_kwargs["config"] = config
+    if "run_manager" in parameters:
+        tool_kwargs["run_manager"] = run_manager
+    return method(*args, **tool_kwargs)
+
+
+def _canonicalize(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Self
+from typing import List, Optional, Tuple, Self
 
 from langchain_core.tools import BaseTool
 from langchain_mcp_adapters.tools import load_mcp_tools
@@ -8,8 +8,16 @@ from mcp.client.stdio import stdio_client
 from pydantic import BaseModel
 
 from app.core.setting import mcp_settings
+from app.mcp.cache import ToolResultCache, wrap_tools_with_cache
 from app.schemas.mcp import SseClientSchema, StdioClientSchema
 
+# 한 프로세스 안의 모든 에이전트가 공유하는 도구 결과 캐시
+tool_result_cache = ToolResultCache(
+    max_size=mcp_settings.TOOL_CACHE_MAX_SIZE,
+    ttl=mcp_settings.TOOL_CACHE_TTL,
+    excluded_tools=mcp_settings.TOOL_CACHE_EXCLUDED_TOOLS,
+)
+
 
 class McpClient:
     def __init__(self):
@@ -56,15 +64,21 @@ class McpClient:
 
 
 class McpManager:
-    def __init__(self) -> None:
+    def __init__(
+        self, tool_cache: Optional[ToolResultCache] = tool_result_cache
+    ) -> None:
         self.clients: List[McpClient] = []
         self.tools: List[BaseTool] = []
+        self.tool_cache = tool_cache
 
     async def init_mcp_settings(self):
         for setting in mcp_settings.SSE_CLIENTS + mcp_settings.STDIO_CLIENTS:
             client = await McpClient.from_setting(setting)
             self.clients.append(client)
-            self.tools.extend(await client.list_tools())
+            tools = await client.list_tools()
+            if self.tool_cache is not None:
+                tools = wrap_tools_with_cache(tools, self.tool_cache)
+            self.tools.extend(tools)
 
     async def close(self):
         for client in self.clients:
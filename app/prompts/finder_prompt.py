@@ -4,7 +4,7 @@ from langchain_core.messages import BaseMessage
 from pydantic import BaseModel
 
 from app.prompts.base import PromptABC
-from app.schemas.structured_output import TestFile
+from app.schemas.structured_output import TestFileReference
 
 
 class TestFinderPrompt(PromptABC):
@@ -28,7 +28,7 @@ class TestFinderPrompt(PromptABC):
 
     @override
     def get_output_model(self) -> Type[BaseModel]:
-        return TestFile
+        return TestFileReference
 
     @override
     def build(self) -> List[BaseMessage]:
@@ -43,8 +43,8 @@ class TestFinderPrompt(PromptABC):
 
             ## Steps
             1. Using the `test_finder` tool, find the test file that contains the tests for the source file.
-            2-1. If the test file exists, return the test file.
-            2-2. If the test file does not exist, generate a new test file.
+            2-1. If the test file exists, return its language, name and path with `content` set to null. Do not copy the content, it is loaded from the file.
+            2-2. If the test file does not exist, generate a new test file and return its full content.
 
             ## Source File
             Here is the source file that you will be writing tests against, called `{source_file_name}`.
@@ -77,9 +77,19 @@ class TestFinderPrompt(PromptABC):
         user_content += self._dedent(
             """
             ## Output Example
+            Here is an example of the output you should generate when the test file exists:
+            =========
+            TestFileReference(
+                language="typescript",
+                name="Button.test.tsx",
+                path="src/components/Button.test.tsx",
+                content=None,
+            )
+            =========
+
             Here is an example of the output you should generate when the test file does not exist:
             =========
-            TestFile(
+            TestFileReference(
                 language="python",
                 name="test_file.py",
                 content="\\n".join([
@@ -0,0 +1,46 @@
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+AgentEventType = Literal[
+    "node_start",
+    "node_end",
+    "token",
+    "tool_call_start",
+    "tool_call_end",
+    "output",
+]
+
+
+class AgentEvent(BaseModel):
+    """Model for an event streamed from an agent run.
+
+    Example:
+        ```python
+        event = AgentEvent(
+            type="token",
+            node="llm_node",
+            content="describe(",
+            elapsed=0.42,
+        )
+        ```
+    """
+
+    type: AgentEventType = Field(description="The kind of the event")
+    node: Optional[str] = Field(
+        default=None, description="The graph node that emitted the event"
+    )
+    content: Optional[str] = Field(
+        default=None, description="The streamed token text for token events"
+    )
+    tool_name: Optional[str] = Field(
+        default=None, description="The tool name for tool call events"
+    )
+    tool_input: Optional[Any] = Field(
+        default=None, description="The tool arguments for tool call start events"
+    )
+    output: Optional[Any] = Field(
+        default=None,
+        description="The structured response for output events, the tool result for tool call end events",
+    )
+    elapsed: float = Field(description="Seconds since the run started")
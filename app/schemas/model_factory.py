@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import ClassVar
+from typing import ClassVar, Dict, Literal, Optional
 
 from pydantic import BaseModel, SecretStr, Field
 
@@ -33,3 +33,57 @@ class LocalParams(BaseModel):
 
 
 ModelParams = GeminiParams | LocalParams
+
+
+AgentRole = Literal[
+    "supervisor",
+    "finder",
+    "analysis",
+    "validation",
+    "failure_analysis",
+    "improver",
+]
+NodeType = Literal["llm", "output"]
+
+
+class RoleModelParams(BaseModel):
+    llm: Optional[ModelParams] = Field(
+        default=None, description="The model for the reasoning node of the role"
+    )
+    output: Optional[ModelParams] = Field(
+        default=None, description="The model for the output-parsing node of the role"
+    )
+
+
+class ModelRoutingConfig(BaseModel):
+    """Model for assigning a model per agent role and node type.
+
+    Example:
+        ```python
+        flash = GeminiParams(api_key=key, temperature=0.0)
+        strong = GeminiParams(api_key=key, llm_name="gemini-2.5-pro", max_tokens=8192)
+        routing = ModelRoutingConfig(
+            default=flash,
+            roles={
+                "improver": RoleModelParams(llm=strong),
+                "failure_analysis": RoleModelParams(llm=strong),
+            },
+        )
+        ```
+    """
+
+    default: ModelParams = Field(description="The model for unrouted roles")
+    output: Optional[ModelParams] = Field(
+        default=None,
+        description="The model for output-parsing nodes of roles without their own",
+    )
+    roles: Dict[AgentRole, RoleModelParams] = Field(default={})
+
+    def params_for(self, role: AgentRole, node_type: NodeType = "llm") -> ModelParams:
+        role_params = self.roles.get(role, RoleModelParams())
+        if node_type == "output":
+            if role_params.output is not None:
+                return role_params.output
+            if self.output is not None:
+                return self.output
+        return role_params.llm or self.default
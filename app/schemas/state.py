@@ -1,9 +1,10 @@
 from collections import deque
-from typing import List, Optional
+from typing import Annotated, Dict, List, Optional
+from uuid import uuid4
 from langgraph.prebuilt.chat_agent_executor import (
     AgentStateWithStructuredResponsePydantic,
 )
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 from app.core.snapshot_editor import SnapshotEditor
 from app.schemas.structured_output import (
@@ -16,48 +17,175 @@ from app.schemas.structured_output import (
     TestFile,
     TestCoverage,
     TestFileAnalysis,
+    TestFileReference,
 )
 
 
-class TestImproverState(AgentStateWithStructuredResponsePydantic):
+class ToolCallStats(BaseModel):
+    """
+    노드가 반환한 증분을 리듀서로 누적하는 도구 호출 집계
+    """
+
+    successful_tool_calls: int = 0
+    errored_tool_calls: int = 0
+    turns: int = 0
+
+
+def add_tool_call_stats(left: ToolCallStats, right: ToolCallStats) -> ToolCallStats:
+    return ToolCallStats(
+        successful_tool_calls=left.successful_tool_calls + right.successful_tool_calls,
+        errored_tool_calls=left.errored_tool_calls + right.errored_tool_calls,
+        turns=left.turns + right.turns,
+    )
+
+
+class ModelTierStats(BaseModel):
+    """
+    모델 캐스케이드에서 단계별로 응답한 호출 수와 상위 단계로 넘어간 횟수
+    """
+
+    answered_by_tier: Dict[int, int] = {}
+    escalations: int = 0
+
+
+def add_model_tier_stats(left: ModelTierStats, right: ModelTierStats) -> ModelTierStats:
+    answered_by_tier = dict(left.answered_by_tier)
+    for tier, count in right.answered_by_tier.items():
+        answered_by_tier[tier] = answered_by_tier.get(tier, 0) + count
+    return ModelTierStats(
+        answered_by_tier=answered_by_tier,
+        escalations=left.escalations + right.escalations,
+    )
+
+
+class AgentStateWithToolCallStats(AgentStateWithStructuredResponsePydantic):
+    tool_call_stats: Annotated[ToolCallStats, add_tool_call_stats] = Field(
+        default_factory=ToolCallStats,
+        description="The incrementally maintained tool call counters",
+    )
+    model_tier_stats: Annotated[ModelTierStats, add_model_tier_stats] = Field(
+        default_factory=ModelTierStats,
+        description="Which model tier answered each model call of the run",
+    )
+
+
+class TestImproverState(AgentStateWithToolCallStats):
     structured_response: Optional[NewTests] = None
 
 
-class TestFinderState(AgentStateWithStructuredResponsePydantic):
-    structured_response: Optional[TestFile] = None
+class TestFinderState(AgentStateWithToolCallStats):
+    structured_response: Optional[TestFileReference] = None
 
 
-class TestValidationState(AgentStateWithStructuredResponsePydantic):
+class TestValidationState(AgentStateWithToolCallStats):
     structured_response: Optional[TestCoverage] = None
 
 
-class TestAnalysisState(AgentStateWithStructuredResponsePydantic):
+class TestAnalysisState(AgentStateWithToolCallStats):
     structured_response: Optional[TestFileAnalysis] = None
 
 
-class TestFailureAnalysisState(AgentStateWithStructuredResponsePydantic):
+class TestFailureAnalysisState(AgentStateWithToolCallStats):
     structured_response: Optional[TestFailureAnalysis] = None
 
 
+class CandidateValidation(BaseModel):
+    """
+    병렬 검증 브랜치 하나에 전달하는 후보 테스트와 분기된 스냅샷
+    """
+
+    wave: int = Field(description="The fan-out wave the candidate belongs to")
+    index: int = Field(description="The position of the candidate in the wave")
+    single_test: SingleTest = Field(description="The candidate test")
+    snapshot_editor: SnapshotEditor = Field(
+        description="The snapshot forked for this candidate"
+    )
+    source_file: SourceFile = Field(description="The source file to be tested")
+
+
+class CandidateResult(BaseModel):
+    wave: int = Field(description="The fan-out wave the candidate belongs to")
+    index: int = Field(description="The position of the candidate in the wave")
+    single_test: SingleTest = Field(description="The candidate test")
+    coverage: TestCoverage = Field(
+        description="The coverage of the snapshot with only this candidate added"
+    )
+    failed_test_report: Optional[FailedTestReport] = Field(
+        default=None, description="The failure report when the candidate failed"
+    )
+
+
+def merge_candidate_results(
+    left: Dict[str, CandidateResult], right: Dict[str, CandidateResult]
+) -> Dict[str, CandidateResult]:
+    # 같은 키를 다시 받아도 결과가 변하지 않도록 키 단위로 병합한다
+    return {**left, **right}
+
+
+class BatchTestOutcome(BaseModel):
+    single_test: SingleTest = Field(description="The candidate test")
+    passed: bool = Field(description="Whether the test passed in the batch run")
+    newly_covered_lines: List[int] = Field(
+        default=[],
+        description="The newly covered lines that fall in the test's lines_to_cover",
+    )
+
+
 class TestSupervisorState(AgentStateWithStructuredResponsePydantic):
     source_file: SourceFile = Field(description="The source file to be tested")
     base_test_file: Optional[TestFile] = Field(
-        description="The base test file to be improved"
+        default=None, description="The base test file to be improved"
     )
     snapshot_editor: Optional[SnapshotEditor] = Field(
-        description="The snapshot editor to be used"
+        default=None, description="The snapshot editor to be used"
     )
     test_coverage: Optional[TestCoverage] = Field(
-        description="The test coverage report"
+        default=None, description="The coverage report of the last accepted test file"
+    )
+    candidate_coverage: Optional[TestCoverage] = Field(
+        default=None, description="The coverage report of the test under validation"
     )
     test_failure_analysis: Optional[TestFailureAnalysis] = Field(
-        description="The test failure analysis"
+        default=None, description="The test failure analysis"
     )
     single_test_queue: deque[SingleTest] = Field(
         default_factory=lambda: deque([]),
         description="The queue of single tests to be improved",
     )
+    current_test: Optional[SingleTest] = Field(
+        default=None, description="The single test applied to the snapshot"
+    )
     failed_test_reports: List[FailedTestReport] = Field(
         default_factory=lambda: [], description="The failed test reports"
     )
+    pending_candidates: List[SingleTest] = Field(
+        default_factory=lambda: [],
+        description="The candidate tests dispatched in the current fan-out wave",
+    )
+    candidate_results: Annotated[
+        Dict[str, CandidateResult], merge_candidate_results
+    ] = Field(
+        default_factory=dict,
+        description="The validation results of the parallel branches by wave:index",
+    )
+    wave: int = Field(default=0, description="The number of fan-out waves")
+    batch_outcomes: List[BatchTestOutcome] = Field(
+        default_factory=lambda: [],
+        description="The per-test outcomes of the last batch validation",
+    )
+    pipeline_key: str = Field(
+        default_factory=lambda: uuid4().hex,
+        description="The key of the run's prefetched improver batch",
+    )
+    skip_batch_validation: bool = Field(
+        default=False,
+        description="Whether the rest of the round falls back to per-test validation",
+    )
+    iteration: int = Field(default=0, description="The number of improver rounds")
+    round_improved: bool = Field(
+        default=False, description="Whether the current round raised the coverage"
+    )
+    rounds_without_improvement: int = Field(
+        default=0, description="The number of consecutive rounds without improvement"
+    )
     structured_response: Optional[ImprovedResult] = None
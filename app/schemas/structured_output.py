@@ -94,6 +94,29 @@ class TestFile(BaseModel):
     path: str = Field(description="The path of the test file")
 
 
+class TestFileReference(BaseModel):
+    """Model for a located or newly generated test file.
+
+    Example:
+        ```python
+        existing_test_file = TestFileReference(
+            language="typescript",
+            name="Button.test.tsx",
+            path="src/components/Button.test.tsx",
+            content=None,
+        )
+        ```
+    """
+
+    language: str = Field(description="The programming language of the test file")
+    name: str = Field(description="The name of the test file")
+    path: str = Field(description="The path of the test file")
+    content: Optional[str] = Field(
+        default=None,
+        description="The content of the test file, only when generating a new test file. Leave it null when the test file already exists",
+    )
+
+
 class SourceFile(BaseModel):
     """Model for a source file.
 
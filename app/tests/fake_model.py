@@ -0,0 +1,120 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, List, Optional, Sequence
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import BaseModel, PrivateAttr
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    테스트와 벤치마크에서 사용하는 네트워크 없는 채팅 모델
+    """
+
+    responses: List[BaseMessage] = []
+    structured_responses: List[Any] = []
+    latency: float = 0.0
+
+    _response_index: int = PrivateAttr(default=0)
+    _structured_index: int = PrivateAttr(default=0)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    def _next_response(self) -> BaseMessage:
+        response = self.responses[self._response_index % len(self.responses)]
+        self._response_index += 1
+        return response.model_copy()
+
+    def _next_structured_response(self) -> Any:
+        response = self.structured_responses[
+            self._structured_index % len(self.structured_responses)
+        ]
+        self._structured_index += 1
+        return response
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=self._next_response())])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        # 응답을 공백 단위 토큰으로 나눠 보내고, 도구 호출은 마지막 청크에 싣는다
+        response = self._next_response()
+        tokens = str(response.content).split(" ")
+        for index, token in enumerate(tokens):
+            if self.latency:
+                await asyncio.sleep(self.latency / len(tokens))
+            text = token if index == len(tokens) - 1 else token + " "
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=text))
+            if run_manager:
+                await run_manager.on_llm_new_token(text, chunk=chunk)
+            yield chunk
+        if getattr(response, "tool_calls", None):
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {
+                            "name": tool_call["name"],
+                            "args": json.dumps(tool_call["args"]),
+                            "id": tool_call["id"],
+                            "index": index,
+                        }
+                        for index, tool_call in enumerate(response.tool_calls)
+                    ],
+                )
+            )
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        # 실제 모델과 같이 도구 스키마 변환 비용을 지불한다
+        formatted_tools = [convert_to_openai_tool(tool) for tool in tools]
+        return self.bind(tools=formatted_tools, **kwargs)
+
+    def with_structured_output(
+        self, schema: Any, include_raw: bool = False, **kwargs: Any
+    ):
+        async def parse(inputs: Any) -> Any:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            response = self._next_structured_response()
+            # 실제 모델처럼 응답을 요청한 스키마로 검증한다
+            if isinstance(response, BaseModel) and not isinstance(response, schema):
+                response = schema.model_validate(response.model_dump())
+            elif response is not None and not isinstance(response, BaseModel):
+                response = schema.model_validate(response)
+            if not include_raw:
+                return response
+            return {
+                "raw": AIMessage(content=""),
+                "parsed": response,
+                "parsing_error": None,
+            }
+
+        return RunnableLambda(lambda inputs: None, afunc=parse)
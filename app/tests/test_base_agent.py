@@ -0,0 +1,462 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import StructuredTool, Tool
+
+from app.llm.agent.analysis_agent import TestAnalysisAgent
+from app.core.deadline import TIMEOUT_EVENTS, remaining_time
+from app.core.metrics import metrics
+from app.exceptions.node_exception import (
+    DeadlineExceededException,
+    ModelCascadeExhaustedException,
+)
+from app.llm.agent.base import (
+    OUTPUT_NODE,
+    OUTPUT_PARSER_LOCAL_HIT,
+    OUTPUT_PARSER_LOCAL_MISS,
+    MODEL_CASCADE_ESCALATION,
+    TURN_LIMIT_REACHED,
+    bind_tools_cached,
+)
+from app.llm.agent.finder_agent import TestFinderAgent
+from app.llm.agent.validation_agent import TestValidationAgent
+from app.schemas.state import (
+    ModelTierStats,
+    TestAnalysisState,
+    TestFinderState,
+    ToolCallStats,
+)
+from app.schemas.structured_output import (
+    TestCoverage,
+    TestFile,
+    TestFileAnalysis,
+    TestFileReference,
+)
+from app.tests.fake_model import FakeChatModel
+
+
+def _fake_model():
+    return FakeChatModel(
+        responses=[AIMessage(content="analysis")],
+        structured_responses=[
+            TestFileAnalysis(
+                test_headers_indentation=2,
+                last_single_test_line_number=9,
+                last_import_line_number=1,
+            )
+        ],
+    )
+
+
+def _tool(name: str):
+    return Tool(name=name, description=f"{name} tool", func=lambda query: query)
+
+
+def test_get_agent_reuses_compiled_graph():
+    agent = TestAnalysisAgent(model=_fake_model())
+
+    assert agent.get_agent() is agent.get_agent()
+
+
+def test_get_agent_recompiles_when_model_changes():
+    agent = TestAnalysisAgent(model=_fake_model())
+    compiled = agent.get_agent()
+
+    agent.model = _fake_model()
+
+    assert agent.get_agent() is not compiled
+
+
+def test_get_agent_recompiles_when_tools_change():
+    tools = [_tool("test_finder")]
+    agent = TestFinderAgent(model=_fake_model(), tools=tools)
+    compiled = agent.get_agent()
+
+    tools.append(_tool("codebase_tool"))
+
+    assert agent.get_agent() is not compiled
+
+
+def test_invalidate_agent():
+    agent = TestAnalysisAgent(model=_fake_model())
+    compiled = agent.get_agent()
+
+    agent.invalidate_agent()
+
+    assert agent.get_agent() is not compiled
+
+
+@pytest.mark.asyncio
+async def test_analyze_vitest_with_cached_graph():
+    agent = TestAnalysisAgent(model=_fake_model())
+
+    first = await agent.analyze_vitest(test_file_content="test('a', () => {});")
+    second = await agent.analyze_vitest(test_file_content="test('b', () => {});")
+
+    assert first.last_single_test_line_number == 9
+    assert second.last_import_line_number == 1
+
+
+class NativeAnalysisAgent(TestAnalysisAgent):
+    structured_output_mode = "native"
+
+
+class NativeFinderAgent(TestFinderAgent):
+    structured_output_mode = "native"
+
+
+@pytest.mark.asyncio
+async def test_native_mode_skips_output_node():
+    model = _fake_model()
+    agent = NativeAnalysisAgent(model=model)
+
+    response = await agent.analyze_vitest(test_file_content="test('a', () => {});")
+
+    assert OUTPUT_NODE not in agent.get_agent().nodes
+    assert response.last_single_test_line_number == 9
+    assert model._response_index == 0
+    assert model._structured_index == 1
+
+
+@pytest.mark.asyncio
+async def test_native_mode_parses_output_tool_call():
+    test_file = {
+        "language": "typescript",
+        "name": "Button.test.tsx",
+        "content": "test('a', () => {});",
+        "path": "src/__tests__/Button.test.tsx",
+    }
+    model = FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": "test_finder", "args": {"query": "Button"}, "id": "1"}
+                ],
+            ),
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": "TestFileReference", "args": test_file, "id": "2"}
+                ],
+            ),
+        ],
+    )
+    agent = NativeFinderAgent(model=model, tools=[_tool("test_finder")])
+
+    response = await agent.find_or_generate_vitest_file(
+        source_file_name="Button.tsx",
+        source_file_content="export const Button = () => null;",
+        source_file_path="src/Button.tsx",
+    )
+
+    assert response.path == test_file["path"]
+    assert model._response_index == 2
+
+
+@pytest.mark.asyncio
+async def test_output_node_parses_tool_result_locally():
+    metrics.reset()
+    model = FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "coverage_tool",
+                        "args": {"test_file_content": "test('a', () => {});"},
+                        "id": "1",
+                    }
+                ],
+            )
+        ],
+    )
+    coverage_tool = StructuredTool.from_function(
+        name="coverage_tool",
+        description="coverage tool",
+        func=lambda test_file_content: TestCoverage(
+            stdout="", stderr="", coverage_percent=100, uncovered_lines=[]
+        ),
+    )
+    agent = TestValidationAgent(model=model, tools=[coverage_tool])
+
+    response = await agent.validate_vitest(
+        source_file_name="Button.tsx",
+        source_file_path="src/Button.tsx",
+        test_file_name="Button.test.tsx",
+        test_file_content="test('a', () => {});",
+    )
+
+    assert response.coverage_percent == 100
+    assert model._structured_index == 0
+    assert metrics.hit_ratio(OUTPUT_PARSER_LOCAL_HIT, OUTPUT_PARSER_LOCAL_MISS) == 1.0
+
+
+def test_bind_tools_cached_reuses_bound_model():
+    model = _fake_model()
+    tools = [_tool("test_finder"), _tool("codebase_tool")]
+
+    first = bind_tools_cached(model, tools)
+
+    assert bind_tools_cached(model, list(tools)) is first
+    assert bind_tools_cached(model, tools[:1]) is not first
+    assert bind_tools_cached(_fake_model(), tools) is not first
+
+
+def _slow_tool(name: str, delay: float):
+    async def run(query: str) -> str:
+        await asyncio.sleep(delay)
+        return f"{name}: {query}"
+
+    return StructuredTool.from_function(
+        name=name, description=f"{name} tool", coroutine=run
+    )
+
+
+def _tool_call_state(*names: str):
+    return TestFinderState(
+        messages=[
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": name, "args": {"query": "Button"}, "id": str(index)}
+                    for index, name in enumerate(names)
+                ],
+            )
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_tool_node_runs_tool_calls_concurrently():
+    tools = [_slow_tool("first", 0.2), _slow_tool("second", 0.2)]
+    agent = TestFinderAgent(model=_fake_model(), tools=tools)
+    tool_node = agent.create_tool_node()
+
+    started = time.perf_counter()
+    result = await tool_node(_tool_call_state("first", "second"))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.35
+    assert [message.content for message in result["messages"]] == [
+        "first: Button",
+        "second: Button",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tool_node_timeout_returns_error_message():
+    metrics.reset()
+    tools = [_slow_tool("slow", 1.0), _slow_tool("fast", 0.0)]
+    agent = TestFinderAgent(model=_fake_model(), tools=tools)
+    agent.tool_timeouts = {"slow": 0.05}
+    tool_node = agent.create_tool_node()
+
+    result = await tool_node(_tool_call_state("slow", "fast", "unknown"))
+
+    slow, fast, unknown = result["messages"]
+    assert slow.status == "error"
+    assert "timed out" in slow.content
+    assert fast.status == "success"
+    assert unknown.status == "error"
+    assert metrics.counter("tool.slow.timeout") == 1
+    assert metrics.timing("tool.fast").count == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_call_stats_accumulate_and_cap_turns():
+    metrics.reset()
+    reference = TestFileReference(
+        language="typescript",
+        name="Button.test.tsx",
+        path="src/__tests__/Button.test.tsx",
+    )
+    model = FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": "test_finder", "args": {"query": "Button"}, "id": "1"},
+                    {"name": "missing_tool", "args": {}, "id": "2"},
+                ],
+            )
+        ],
+        structured_responses=[reference],
+    )
+    agent = TestFinderAgent(model=model, tools=[_tool("test_finder")])
+    agent.max_turns = 3
+
+    state = await agent.get_agent().ainvoke(
+        TestFinderState(messages=[HumanMessage(content="find the test file")])
+    )
+
+    assert state["structured_response"] == reference
+    assert state["tool_call_stats"] == ToolCallStats(
+        successful_tool_calls=3, errored_tool_calls=3, turns=3
+    )
+    assert metrics.counter(TURN_LIMIT_REACHED) == 1
+
+
+@pytest.mark.asyncio
+async def test_agent_invocation_respects_node_timeout():
+    model = _fake_model()
+    model.latency = 1.0
+    agent = TestAnalysisAgent(model=model)
+    agent.node_timeout = 0.05
+
+    with pytest.raises(DeadlineExceededException):
+        await agent.analyze_vitest(test_file_content="test('a', () => {});")
+
+
+@pytest.mark.asyncio
+async def test_astream_agent_emits_tokens_nodes_and_output():
+    metrics.reset()
+    agent = TestAnalysisAgent(model=_fake_model())
+
+    events = [
+        event
+        async for event in agent.astream_analyze_vitest(
+            test_file_content="test('a', () => {});"
+        )
+    ]
+
+    types = [event.type for event in events]
+    assert "token" in types
+    assert ("node_start", "llm_node") in [(event.type, event.node) for event in events]
+    assert events[-1].type == "output"
+    assert events[-1].output.last_single_test_line_number == 9
+    assert metrics.timing("stream.TestAnalysisAgent.time_to_first_token").count == 1
+
+
+@pytest.mark.asyncio
+async def test_astream_agent_nodes_inherit_the_agent_deadline():
+    metrics.reset()
+    observed = []
+
+    class DeadlineRecordingModel(FakeChatModel):
+        async def _astream(self, *args, **kwargs):
+            observed.append(remaining_time())
+            async for chunk in super()._astream(*args, **kwargs):
+                yield chunk
+
+    model = DeadlineRecordingModel(
+        responses=[AIMessage(content="analysis")], latency=1.0
+    )
+    agent = TestAnalysisAgent(model=model)
+    agent.agent_timeout = 0.05
+
+    with pytest.raises(DeadlineExceededException):
+        async for _ in agent.astream_analyze_vitest(
+            test_file_content="test('a', () => {});"
+        ):
+            pass
+
+    assert observed and observed[0] <= 0.05
+    assert [event.scope for event in metrics.events(TIMEOUT_EVENTS)] == ["agent"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_mode_merges_tool_call_chunks():
+    test_file = TestFile(
+        language="typescript",
+        name="Button.test.tsx",
+        content="test('a', () => {});",
+        path="src/__tests__/Button.test.tsx",
+    )
+    model = FakeChatModel(
+        responses=[
+            AIMessage(
+                content="searching for the test file",
+                tool_calls=[
+                    {"name": "test_finder", "args": {"query": "Button"}, "id": "1"}
+                ],
+            ),
+            AIMessage(content="found it"),
+        ],
+        structured_responses=[
+            TestFileReference(
+                language="typescript",
+                name="Button.test.tsx",
+                path="src/__tests__/Button.test.tsx",
+            )
+        ],
+    )
+    test_finder = Tool(
+        name="test_finder",
+        description="test_finder tool",
+        func=lambda query: test_file.model_dump_json(),
+    )
+    agent = TestFinderAgent(model=model, tools=[test_finder])
+    agent.streaming = True
+
+    events = [
+        event
+        async for event in agent.astream_find_or_generate_vitest_file(
+            source_file_name="Button.tsx",
+            source_file_content="export const Button = () => null;",
+            source_file_path="src/Button.tsx",
+        )
+    ]
+
+    tool_starts = [event for event in events if event.type == "tool_call_start"]
+    assert [event.tool_name for event in tool_starts] == ["test_finder"]
+    assert "".join(event.content for event in events if event.type == "token")
+    assert events[-1].output == test_file
+
+
+@pytest.mark.asyncio
+async def test_model_cascade_escalates_on_empty_output():
+    metrics.reset()
+    cheap = FakeChatModel(
+        responses=[AIMessage(content="")], structured_responses=[None]
+    )
+    strong = _fake_model()
+    agent = NativeAnalysisAgent(model=cheap, fallback_models=[strong])
+
+    state = await agent.get_agent().ainvoke(
+        TestAnalysisState(messages=[HumanMessage(content="analyze the test file")])
+    )
+
+    assert state["structured_response"].last_single_test_line_number == 9
+    assert state["model_tier_stats"] == ModelTierStats(
+        answered_by_tier={1: 1}, escalations=1
+    )
+    assert cheap._structured_index == 1
+    assert strong._structured_index == 1
+    assert metrics.counter(MODEL_CASCADE_ESCALATION) == 1
+
+
+@pytest.mark.asyncio
+async def test_exhausted_model_cascade_is_not_retried_from_the_first_tier():
+    cheap = FakeChatModel(
+        responses=[AIMessage(content="")], structured_responses=[None]
+    )
+    strong = FakeChatModel(
+        responses=[AIMessage(content="")], structured_responses=[None]
+    )
+    agent = NativeAnalysisAgent(model=cheap, fallback_models=[strong])
+
+    with pytest.raises(ModelCascadeExhaustedException):
+        await agent.get_agent().ainvoke(
+            TestAnalysisState(messages=[HumanMessage(content="analyze the test file")])
+        )
+
+    assert cheap._structured_index == 1
+    assert strong._structured_index == 1
+
+
+@pytest.mark.asyncio
+async def test_model_cascade_stays_on_first_tier_when_it_answers():
+    cheap = _fake_model()
+    strong = _fake_model()
+    agent = TestAnalysisAgent(model=cheap, fallback_models=[strong])
+
+    state = await agent.get_agent().ainvoke(
+        TestAnalysisState(messages=[HumanMessage(content="analyze the test file")])
+    )
+
+    assert state["model_tier_stats"] == ModelTierStats(answered_by_tier={0: 2})
+    assert strong._response_index == 0
+    assert strong._structured_index == 0
@@ -0,0 +1,182 @@
+import asyncio
+
+import pytest
+
+from app.llm.batch_runner import BatchRunner, resolve_source_paths
+from app.schemas.structured_output import ImprovedResult, SourceFile, TestFile
+
+
+class FakeSupervisor:
+    """
+    파일 내용에 적힌 시간만큼 기다린 뒤 결과를 내고, 동시에 실행 중인 파이프라인 수를 기록한다
+    """
+
+    agent_timeout = None
+    deadline_scope = "run"
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def cover_test(
+        self, source_file_name: str, source_file_path: str, source_file_content: str
+    ) -> ImprovedResult:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(float(source_file_content))
+            if source_file_name.startswith("broken"):
+                raise ValueError("no test file found")
+            return ImprovedResult(
+                coverage_percent=100,
+                source_file=SourceFile(
+                    language="typescript",
+                    name=source_file_name,
+                    content=source_file_content,
+                    path=source_file_path,
+                ),
+                test_file=TestFile(
+                    language="typescript",
+                    name=f"{source_file_name}.test.tsx",
+                    content="",
+                    path="",
+                ),
+            )
+        finally:
+            self.running -= 1
+
+
+def _write_sources(tmp_path, delays: dict):
+    for name, delay in delays.items():
+        path = tmp_path / "src" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(str(delay), encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_batch_runner_streams_results_and_isolates_failures(tmp_path):
+    _write_sources(tmp_path, {"slow.tsx": 0.2, "broken.tsx": 0.0, "fast.tsx": 0.05})
+    supervisor = FakeSupervisor()
+    runner = BatchRunner(supervisor, concurrency=3)
+
+    results = await runner.run_all(resolve_source_paths(["src/*.tsx"], root=tmp_path))
+
+    assert [result.source_file_path.rsplit("/", 1)[-1] for result in results] == [
+        "broken.tsx",
+        "fast.tsx",
+        "slow.tsx",
+    ]
+    assert not results[0].succeeded
+    assert "no test file found" in results[0].error
+    assert results[2].result.coverage_percent == 100
+
+
+@pytest.mark.asyncio
+async def test_batch_runner_bounds_concurrency(tmp_path):
+    _write_sources(tmp_path, {f"file_{i}.tsx": 0.01 for i in range(10)})
+    supervisor = FakeSupervisor()
+    runner = BatchRunner(supervisor, concurrency=4)
+
+    results = await runner.run_all(resolve_source_paths(["src/*.tsx"], root=tmp_path))
+
+    assert len(results) == 10
+    assert all(result.succeeded for result in results)
+    assert supervisor.max_running == 4
+
+
+def test_resolve_source_paths_accepts_paths_and_globs(tmp_path):
+    _write_sources(tmp_path, {"a.tsx": 0, "b.tsx": 0, "c.ts": 0})
+
+    paths = resolve_source_paths(["src/c.ts", "src/*.tsx", "src/a.tsx"], root=tmp_path)
+
+    assert [path.name for path in paths] == ["c.ts", "a.tsx", "b.tsx"]
+
+
+class FakePipelinedSupervisor(FakeSupervisor):
+    """
+    prepare 와 improve 를 나눠 실행하고, 준비됐지만 아직 개선을 시작하지 않은 파일 수를 기록한다
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.preparing = 0
+        self.improving = 0
+        self.overlapped = False
+        self.prepared = 0
+        self.improve_started = 0
+        self.max_ahead = 0
+        self.prepare_latency = 0.02
+        self.checkpointed = set()
+
+    def build_state(self, source_file_name, source_file_path, source_file_content):
+        return (source_file_name, source_file_path, source_file_content)
+
+    async def has_checkpoint(self, state):
+        return state[0] in self.checkpointed
+
+    async def prepare(self, state):
+        self.preparing += 1
+        self.overlapped = self.overlapped or self.improving > 0
+        await asyncio.sleep(self.prepare_latency)
+        self.preparing -= 1
+        self.prepared += 1
+        self.max_ahead = max(self.max_ahead, self.prepared - self.improve_started)
+        return state
+
+    async def improve(self, state):
+        self.improve_started += 1
+        self.improving += 1
+        try:
+            return await self.cover_test(*state)
+        finally:
+            self.improving -= 1
+
+
+@pytest.mark.asyncio
+async def test_pipelined_batch_prepares_next_file_while_improving(tmp_path):
+    _write_sources(tmp_path, {f"file_{i}.tsx": 0.05 for i in range(6)})
+    supervisor = FakePipelinedSupervisor()
+    runner = BatchRunner(
+        supervisor, concurrency=1, pipelined=True, prepare_concurrency=1, queue_size=1
+    )
+
+    results = await runner.run_all(resolve_source_paths(["src/*.tsx"], root=tmp_path))
+
+    assert len(results) == 6
+    assert all(result.succeeded for result in results)
+    assert supervisor.overlapped
+    assert supervisor.max_running == 1
+    # 큐에 하나, 큐가 비기를 기다리는 prepare 워커에 하나
+    assert supervisor.max_ahead <= 2
+
+
+@pytest.mark.asyncio
+async def test_pipelined_batch_shares_the_run_timeout_across_stages(tmp_path):
+    _write_sources(tmp_path, {"slow.tsx": 0.2, "fast.tsx": 0.01})
+    supervisor = FakePipelinedSupervisor()
+    supervisor.agent_timeout = 0.3
+    supervisor.prepare_latency = 0.2
+    runner = BatchRunner(supervisor, concurrency=1, pipelined=True)
+
+    results = await runner.run_all(resolve_source_paths(["src/*.tsx"], root=tmp_path))
+
+    # prepare 0.2초 + improve 0.2초는 파일당 0.3초 제한을 넘는다
+    outcomes = {
+        result.source_file_path.rsplit("/", 1)[-1]: result.succeeded
+        for result in results
+    }
+    assert outcomes == {"slow.tsx": False, "fast.tsx": True}
+
+
+@pytest.mark.asyncio
+async def test_pipelined_batch_skips_prepare_for_checkpointed_files(tmp_path):
+    _write_sources(tmp_path, {"done.tsx": 0.01, "new.tsx": 0.01})
+    supervisor = FakePipelinedSupervisor()
+    supervisor.checkpointed = {"done.tsx"}
+    runner = BatchRunner(supervisor, concurrency=1, pipelined=True)
+
+    results = await runner.run_all(resolve_source_paths(["src/*.tsx"], root=tmp_path))
+
+    assert all(result.succeeded for result in results)
+    assert supervisor.prepared == 1
+    assert supervisor.improve_started == 2
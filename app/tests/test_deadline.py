@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from app.core.deadline import (
+    TIMEOUT_EVENTS,
+    remaining_time,
+    run_with_deadline,
+)
+from app.core.metrics import metrics
+from app.exceptions.node_exception import DeadlineExceededException
+
+
+@pytest.mark.asyncio
+async def test_run_with_deadline_returns_result():
+    async def work():
+        return "done"
+
+    assert await run_with_deadline(work(), 1.0, "node", "work") == "done"
+    assert await run_with_deadline(work(), None, "node", "work") == "done"
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_task_and_records_event():
+    metrics.reset()
+    cancelled = asyncio.Event()
+
+    async def stuck():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(DeadlineExceededException):
+        await run_with_deadline(stuck(), 0.05, "node", "llm_node")
+
+    assert cancelled.is_set()
+    [event] = metrics.events(TIMEOUT_EVENTS)
+    assert event.scope == "node"
+    assert event.name == "llm_node"
+    assert event.inherited is False
+
+
+@pytest.mark.asyncio
+async def test_nested_deadline_inherits_tighter_parent():
+    metrics.reset()
+    observed = []
+
+    async def node():
+        observed.append(remaining_time())
+        await asyncio.sleep(10)
+
+    async def agent():
+        return await run_with_deadline(node(), 60.0, "node", "llm_node")
+
+    with pytest.raises(DeadlineExceededException):
+        await run_with_deadline(agent(), 0.05, "run", "supervisor")
+
+    assert observed[0] <= 0.05
+    assert [event.scope for event in metrics.events(TIMEOUT_EVENTS)] == ["run"]
+    assert remaining_time() is None
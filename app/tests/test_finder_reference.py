@@ -0,0 +1,204 @@
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+
+from app.core.metrics import metrics
+from app.exceptions.node_exception import TestFileNotFoundException
+from app.llm.agent.finder_agent import (
+    FINDER_CONTENT_FROM_DISK,
+    FINDER_CONTENT_FROM_TOOL,
+    FINDER_CONTENT_GENERATED,
+    TestFinderAgent,
+)
+from app.schemas.structured_output import TestFile, TestFileReference
+from app.tests.fake_model import FakeChatModel
+
+TEST_FILE_PATH = "src/__tests__/Button.test.tsx"
+EXISTING_CONTENT = "describe('<Button/> Test', () => {\n  test('a', () => {});\n});"
+
+
+def _finder_model(tool_name: str, args: dict, reference: TestFileReference):
+    return FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[{"name": tool_name, "args": args, "id": "1"}],
+            ),
+            AIMessage(content=reference.model_dump_json()),
+        ]
+    )
+
+
+def _reference(content=None) -> TestFileReference:
+    return TestFileReference(
+        language="typescript",
+        name="Button.test.tsx",
+        path=TEST_FILE_PATH,
+        content=content,
+    )
+
+
+async def _find(agent: TestFinderAgent) -> TestFile:
+    return await agent.find_or_generate_vitest_file(
+        source_file_name="Button.tsx",
+        source_file_content="export const Button = () => null;",
+        source_file_path="src/Button.tsx",
+    )
+
+
+@pytest.mark.asyncio
+async def test_finder_loads_existing_content_from_the_tool_result():
+    metrics.reset()
+
+    def test_finder(source_file_path: str) -> str:
+        """Find the test file for the given source file"""
+        return TestFile(
+            language="typescript",
+            name="Button.test.tsx",
+            content=EXISTING_CONTENT,
+            path=TEST_FILE_PATH,
+        ).model_dump_json()
+
+    agent = TestFinderAgent(
+        model=_finder_model(
+            "test_finder", {"source_file_path": "src/Button.tsx"}, _reference()
+        ),
+        tools=[StructuredTool.from_function(test_finder)],
+    )
+
+    test_file = await _find(agent)
+
+    assert test_file.content == EXISTING_CONTENT
+    assert test_file.path == TEST_FILE_PATH
+    assert metrics.counter(FINDER_CONTENT_FROM_TOOL) == 1
+
+
+@pytest.mark.asyncio
+async def test_finder_loads_existing_content_from_disk(tmp_path):
+    metrics.reset()
+    (tmp_path / TEST_FILE_PATH).parent.mkdir(parents=True)
+    (tmp_path / TEST_FILE_PATH).write_text(EXISTING_CONTENT, encoding="utf-8")
+
+    def list_files(directory: str) -> str:
+        """List the files in a directory"""
+        return "Button.test.tsx"
+
+    agent = TestFinderAgent(
+        model=_finder_model("list_files", {"directory": "src/__tests__"}, _reference()),
+        tools=[StructuredTool.from_function(list_files)],
+    )
+    agent.test_root = str(tmp_path)
+
+    test_file = await _find(agent)
+
+    assert test_file.content == EXISTING_CONTENT
+    assert metrics.counter(FINDER_CONTENT_FROM_DISK) == 1
+
+
+@pytest.mark.asyncio
+async def test_finder_uses_generated_content_only_for_a_new_file(tmp_path):
+    metrics.reset()
+
+    def list_files(directory: str) -> str:
+        """List the files in a directory"""
+        return ""
+
+    generated = "describe('<Button/> Test', () => {});"
+    agent = TestFinderAgent(
+        model=_finder_model(
+            "list_files", {"directory": "src/__tests__"}, _reference(generated)
+        ),
+        tools=[StructuredTool.from_function(list_files)],
+    )
+    agent.test_root = str(tmp_path)
+
+    test_file = await _find(agent)
+
+    assert test_file.content == generated
+    assert metrics.counter(FINDER_CONTENT_GENERATED) == 1
+
+    agent.model = _finder_model("list_files", {"directory": "src"}, _reference())
+    with pytest.raises(TestFileNotFoundException):
+        await _find(agent)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "tool_output",
+    [
+        f"File not found: {TEST_FILE_PATH}",
+        TestFile(
+            language="typescript",
+            name="Button.test.tsx",
+            content="describe('other', () => {});",
+            path="legacy/src/__tests__/Button.test.tsx",
+        ).model_dump_json(),
+    ],
+)
+async def test_finder_ignores_tool_results_that_are_not_the_test_file(
+    tmp_path, tool_output
+):
+    metrics.reset()
+    (tmp_path / TEST_FILE_PATH).parent.mkdir(parents=True)
+    (tmp_path / TEST_FILE_PATH).write_text(EXISTING_CONTENT, encoding="utf-8")
+
+    def read_file(path: str) -> str:
+        """Read a file"""
+        return tool_output
+
+    agent = TestFinderAgent(
+        model=_finder_model("read_file", {"path": TEST_FILE_PATH}, _reference()),
+        tools=[StructuredTool.from_function(read_file)],
+    )
+    agent.test_root = str(tmp_path)
+
+    test_file = await _find(agent)
+
+    assert test_file.content == EXISTING_CONTENT
+    assert metrics.counter(FINDER_CONTENT_FROM_TOOL) == 0
+    assert metrics.counter(FINDER_CONTENT_FROM_DISK) == 1
+
+
+@pytest.mark.asyncio
+async def test_streaming_finder_outputs_the_loaded_test_file(tmp_path):
+    (tmp_path / TEST_FILE_PATH).parent.mkdir(parents=True)
+    (tmp_path / TEST_FILE_PATH).write_text(EXISTING_CONTENT, encoding="utf-8")
+
+    def list_files(directory: str) -> str:
+        """List the files in a directory"""
+        return "Button.test.tsx"
+
+    agent = TestFinderAgent(
+        model=_finder_model("list_files", {"directory": "src/__tests__"}, _reference()),
+        tools=[StructuredTool.from_function(list_files)],
+    )
+    agent.test_root = str(tmp_path)
+
+    events = [
+        event
+        async for event in agent.astream_find_or_generate_vitest_file(
+            source_file_name="Button.tsx",
+            source_file_content="export const Button = () => null;",
+            source_file_path="src/Button.tsx",
+        )
+    ]
+
+    assert events[-1].type == "output"
+    assert events[-1].output == TestFile(
+        language="typescript",
+        name="Button.test.tsx",
+        content=EXISTING_CONTENT,
+        path=TEST_FILE_PATH,
+    )
+
+    (tmp_path / TEST_FILE_PATH).unlink()
+    agent.model = _finder_model(
+        "list_files", {"directory": "src/__tests__"}, _reference()
+    )
+    with pytest.raises(TestFileNotFoundException):
+        async for _ in agent.astream_find_or_generate_vitest_file(
+            source_file_name="Button.tsx",
+            source_file_content="export const Button = () => null;",
+            source_file_path="src/Button.tsx",
+        ):
+            pass
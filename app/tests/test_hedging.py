@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from app.core.metrics import metrics
+from app.exceptions.node_exception import EmptyOutputException
+from app.llm.hedging import (
+    HEDGE_BUDGET_EXHAUSTED,
+    HEDGE_FIRED,
+    HEDGE_WON,
+    RequestHedger,
+)
+
+KEY = "analysis.llm.tier_0"
+
+
+def _prime_latency_histogram(seconds: float, samples: int = 20):
+    for _ in range(samples):
+        metrics.observe(f"hedge.{KEY}.latency", seconds)
+
+
+def _scripted_calls(*steps):
+    """
+    호출될 때마다 (대기 시간, 결과 또는 예외) 를 순서대로 꺼내 실행하는 call
+    """
+    steps = list(steps)
+    cancelled = []
+
+    async def call():
+        delay, outcome = steps.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(outcome)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return call, cancelled
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_enough_samples():
+    metrics.reset()
+    call, _ = _scripted_calls((0.05, "primary"), (0.0, "hedge"))
+    hedger = RequestHedger(min_samples=20, min_delay=0.0, budget_ratio=1.0)
+
+    assert await hedger.run(KEY, call) == "primary"
+    assert metrics.counter(HEDGE_FIRED) == 0
+    assert len(metrics.recent_timings(f"hedge.{KEY}.latency")) == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_wins_and_cancels_slow_primary():
+    metrics.reset()
+    _prime_latency_histogram(0.01)
+    call, cancelled = _scripted_calls((1.0, "primary"), (0.0, "hedge"))
+    hedger = RequestHedger(min_delay=0.0, budget_ratio=1.0)
+
+    assert await hedger.run(KEY, call) == "hedge"
+    await asyncio.sleep(0)
+    assert cancelled == ["primary"]
+    assert metrics.counter(HEDGE_FIRED) == 1
+    assert metrics.counter(HEDGE_WON) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_response_does_not_win():
+    metrics.reset()
+    _prime_latency_histogram(0.01)
+    call, _ = _scripted_calls((0.05, EmptyOutputException()), (0.1, "hedge"))
+    hedger = RequestHedger(min_delay=0.0, budget_ratio=1.0)
+
+    assert await hedger.run(KEY, call) == "hedge"
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_caps_duplicate_requests():
+    metrics.reset()
+    _prime_latency_histogram(0.01)
+    call, _ = _scripted_calls((0.05, "primary"), (0.0, "hedge"))
+    hedger = RequestHedger(min_delay=0.0, budget_ratio=0.0)
+
+    assert await hedger.run(KEY, call) == "primary"
+    assert metrics.counter(HEDGE_FIRED) == 0
+    assert metrics.counter(HEDGE_BUDGET_EXHAUSTED) == 1
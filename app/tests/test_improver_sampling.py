@@ -0,0 +1,132 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from app.core.metrics import metrics
+from app.llm.agent.improver_agent import (
+    IMPROVER_SAMPLE_DUPLICATES,
+    TestImproverAgent,
+    _select_diverse_tests,
+)
+from app.schemas.structured_output import NewTests, SingleTest
+from app.tests.fake_model import FakeChatModel
+
+
+def _single_test(name: str, lines_to_cover: str, test_code: Optional[str] = None):
+    return SingleTest(
+        test_behavior=f"{name} behavior",
+        lines_to_cover=lines_to_cover,
+        test_name=name,
+        test_code=test_code or f"test('{name}', () => {{ expect(true).toBe(true); }});",
+        new_imports_code="",
+        test_tags="happy path",
+    )
+
+
+class TemperatureFakeModel(FakeChatModel):
+    """
+    temperature 별로 미리 정한 NewTests 를 JSON 으로 응답하는 모델
+    """
+
+    temperature: float = 0.0
+    samples: Dict[float, List[SingleTest]] = {}
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        new_tests = NewTests(
+            language="typescript",
+            existing_test_function_signature="test('a', () => {",
+            new_tests=self.samples[self.temperature],
+        )
+        message = AIMessage(content=new_tests.model_dump_json())
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def test_select_diverse_tests_prefers_new_lines():
+    tests = [
+        _single_test("renders", "[1, 2, 3]"),
+        _single_test("renders_again", "[2, 3]"),
+        _single_test("disabled", "[7, 8]"),
+    ]
+
+    selected = _select_diverse_tests(tests, max_tests=2)
+
+    assert [test.test_name for test in selected] == ["renders", "disabled"]
+
+
+@pytest.mark.asyncio
+async def test_generate_vitest_test_merges_concurrent_samples():
+    metrics.reset()
+    shared = _single_test("renders", "[1, 2]")
+    model = TemperatureFakeModel(
+        samples={
+            0.2: [shared, _single_test("disabled", "[5]")],
+            0.6: [
+                _single_test(
+                    "renders",
+                    "[1, 2]",
+                    test_code="test('renders',  () => {\n expect(true).toBe(true); });",
+                ),
+                _single_test("on_click", "[8, 9]"),
+            ],
+        }
+    )
+    agent = TestImproverAgent(model=model)
+    agent.sample_temperatures = [0.2, 0.6]
+
+    improver_result = await agent.generate_vitest_test(
+        source_file_name="Button.tsx",
+        source_file_content="export const Button = () => null;",
+        test_file_name="Button.test.tsx",
+        test_file_content="test('a', () => {});",
+        num_samples=2,
+    )
+
+    assert [test.test_name for test in improver_result.new_tests] == [
+        "renders",
+        "on_click",
+        "disabled",
+    ]
+    assert metrics.counter(IMPROVER_SAMPLE_DUPLICATES) == 1
+
+
+def test_sampling_agents_keep_the_instance_configuration():
+    agent = TestImproverAgent(model=TemperatureFakeModel())
+    agent.max_tests = 3
+    agent.node_timeout = 5.0
+
+    sampling_agent = agent._sampling_agent(0.6)
+
+    assert sampling_agent.model.temperature == 0.6
+    assert sampling_agent.max_tests == 3
+    assert sampling_agent.node_timeout == 5.0
+    assert agent._sampling_agent(0.6) is sampling_agent
+
+    agent.model = TemperatureFakeModel()
+    assert agent._sampling_agent(0.6) is not sampling_agent
+
+
+@pytest.mark.asyncio
+async def test_cancelled_samples_are_not_swallowed():
+    class CancelledImproverAgent(TestImproverAgent):
+        async def ainvoke_agent(self, state, config=None) -> dict:
+            raise asyncio.CancelledError()
+
+    agent = CancelledImproverAgent(model=TemperatureFakeModel())
+
+    with pytest.raises(asyncio.CancelledError):
+        await agent.generate_vitest_test(
+            source_file_name="Button.tsx",
+            source_file_content="export const Button = () => null;",
+            test_file_name="Button.test.tsx",
+            test_file_content="test('a', () => {});",
+            num_samples=2,
+        )
@@ -0,0 +1,115 @@
+import os
+
+import pytest
+
+# TestLocatorIndex 를 모듈로 참조해 pytest 가 테스트 클래스로 수집하려 하지 않게 한다
+from app.core import locator_index
+from app.core.locator_index import TEST_LOCATOR_PARSED, TEST_LOCATOR_SCANNED
+from app.core.metrics import metrics
+from app.llm.agent.supervisor_agent import TestSupervisorAgent
+from app.tests.fake_model import FakeChatModel
+from app.tests.test_supervisor_agent import (
+    FakeAnalysisAgent,
+    FakeFailureAnalysisAgent,
+    FakeImproverAgent,
+    FakeValidationAgent,
+)
+
+
+def _write(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def project(tmp_path):
+    metrics.reset()
+    _write(tmp_path / "src/components/Button.tsx")
+    _write(tmp_path / "src/components/__tests__/Button.test.tsx")
+    _write(tmp_path / "src/hooks/useToggle.ts")
+    _write(
+        tmp_path / "tests/hooks/toggle.spec.ts",
+        "import { useToggle } from '../../src/hooks/useToggle';\n"
+        "vi.mock('../../src/components');\n",
+    )
+    _write(tmp_path / "src/components/index.ts")
+    _write(tmp_path / "src/Orphan.tsx")
+    _write(tmp_path / "node_modules/lib/lib.test.ts", "import '../../src/Orphan';")
+    return tmp_path
+
+
+def test_locate_by_convention_import_graph_and_reports_hit_rate(project):
+    locator = locator_index.TestLocatorIndex(root=str(project), index_path=None)
+
+    assert locator.locate(str(project / "src/components/Button.tsx")) == str(
+        project / "src/components/__tests__/Button.test.tsx"
+    )
+    assert locator.locate(str(project / "src/hooks/useToggle.ts")) == str(
+        project / "tests/hooks/toggle.spec.ts"
+    )
+    # vi.mock 만 하는 테스트는 그 모듈의 테스트가 아니다
+    assert locator.locate(str(project / "src/components/index.ts")) is None
+    # node_modules 의 테스트는 인덱스에 들어가지 않는다
+    assert locator.locate(str(project / "src/Orphan.tsx")) is None
+    assert metrics.counter("test_locator.hit.convention") == 1
+    assert metrics.counter("test_locator.hit.import") == 1
+    assert locator.hit_rate() == pytest.approx(2 / 4)
+
+
+def test_index_is_rebuilt_incrementally_from_mtimes(project):
+    # 인덱스 파일은 탐색에서 빠지는 디렉터리에 둔다
+    index_path = project / ".checkpoints/test_locator.json"
+    index_path.parent.mkdir()
+    locator_index.TestLocatorIndex(
+        root=str(project), index_path=str(index_path)
+    ).refresh()
+    assert index_path.is_file()
+    assert metrics.counter(TEST_LOCATOR_PARSED) == 2
+
+    metrics.reset()
+    spec = project / "tests/hooks/toggle.spec.ts"
+    spec.write_text("import '../../src/Orphan';", encoding="utf-8")
+    os.utime(spec, ns=(1, 1))
+    locator = locator_index.TestLocatorIndex(
+        root=str(project), index_path=str(index_path)
+    )
+
+    assert locator.locate(str(project / "src/Orphan.tsx")) == str(spec)
+    assert locator.locate(str(project / "src/hooks/useToggle.ts")) is None
+    # 바뀐 테스트 파일만 다시 읽고 디렉터리는 저장된 목록을 쓴다
+    assert metrics.counter(TEST_LOCATOR_PARSED) == 1
+    assert metrics.counter(TEST_LOCATOR_SCANNED) == 0
+
+
+@pytest.mark.asyncio
+async def test_supervisor_uses_the_locator_before_the_finder_agent(
+    project, monkeypatch
+):
+    class FailingFinderAgent:
+        async def find_or_generate_vitest_file(self, **kwargs):
+            raise AssertionError("finder agent should not be called")
+
+    _write(
+        project / "src/components/__tests__/Button.test.tsx",
+        "describe('<Button/> Test', () => {\n  test('a', () => {});\n});",
+    )
+    monkeypatch.chdir(project)
+    supervisor = TestSupervisorAgent(
+        model=FakeChatModel(),
+        finder_agent=FailingFinderAgent(),
+        analysis_agent=FakeAnalysisAgent(),
+        validation_agent=FakeValidationAgent({}),
+        failure_analysis_agent=FakeFailureAnalysisAgent(),
+        improver_agent=FakeImproverAgent([[]]),
+        test_locator=locator_index.TestLocatorIndex(root=str(project), index_path=None),
+    )
+
+    result = await supervisor.cover_test(
+        source_file_name="Button.tsx",
+        source_file_path="src/components/Button.tsx",
+        source_file_content="export const Button = () => null;",
+    )
+
+    assert result.test_file.path == "src/components/__tests__/Button.test.tsx"
+    assert result.test_file.name == "Button.test.tsx"
@@ -0,0 +1,63 @@
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from app.core.metrics import metrics
+from app.llm.message_compactor import TOKENS_SAVED, MessageCompactor, estimate_tokens
+
+
+def _conversation(exchanges: int, output_size: int):
+    messages = [
+        SystemMessage(content="system prompt"),
+        HumanMessage(content="find the test file"),
+    ]
+    for index in range(exchanges):
+        messages.append(
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "test_finder", "args": {}, "id": str(index)}],
+            )
+        )
+        messages.append(
+            ToolMessage(
+                content=f"{index}:" + "x" * output_size,
+                name="test_finder",
+                tool_call_id=str(index),
+            )
+        )
+    return messages
+
+
+def test_messages_within_budget_are_untouched():
+    messages = _conversation(exchanges=3, output_size=100)
+
+    assert MessageCompactor(max_tokens=10_000)(messages) == messages
+
+
+def test_old_tool_outputs_are_truncated_and_recent_exchanges_kept():
+    metrics.reset()
+    messages = _conversation(exchanges=5, output_size=4_000)
+    compactor = MessageCompactor(
+        max_tokens=3_000, keep_last_exchanges=2, truncated_tool_output_chars=200
+    )
+
+    compacted = compactor(messages)
+
+    assert compacted[:2] == messages[:2]
+    assert compacted[-4:] == messages[-4:]
+    assert "characters truncated" in compacted[3].content
+    assert compacted[3].tool_call_id == messages[3].tool_call_id
+    assert len(compacted) == len(messages)
+    assert sum(estimate_tokens(msg) for msg in compacted) <= 3_000
+    assert metrics.counter(TOKENS_SAVED) > 0
+    assert messages[3].content.endswith("x")
+
+
+def test_tool_outputs_are_summarized_when_truncation_is_not_enough():
+    messages = _conversation(exchanges=4, output_size=4_000)
+    compactor = MessageCompactor(
+        max_tokens=2_100, keep_last_exchanges=1, truncated_tool_output_chars=2_000
+    )
+
+    compacted = compactor(messages)
+
+    assert compacted[3].content.startswith("[Output of `test_finder` omitted")
+    assert compacted[-2:] == messages[-2:]
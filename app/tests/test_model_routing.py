@@ -0,0 +1,104 @@
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.core.metrics import metrics
+from app.llm.agent.analysis_agent import TestAnalysisAgent
+from app.llm.agent.supervisor_agent import TestSupervisorAgent
+from app.llm.model_factory import BaseModelLoader, ModelFactory
+from app.llm.model_usage import model_usage_report
+from app.schemas.model_factory import (
+    GeminiParams,
+    ModelRoutingConfig,
+    RoleModelParams,
+)
+from app.schemas.state import TestAnalysisState
+from app.schemas.structured_output import TestFileAnalysis
+from app.tests.fake_model import FakeChatModel
+
+FLASH = GeminiParams(api_key="key", temperature=0.0)
+STRONG = GeminiParams(api_key="key", llm_name="gemini-2.5-pro", max_tokens=8192)
+PARSER = GeminiParams(api_key="key", max_tokens=512)
+
+
+class FakeLoader(BaseModelLoader):
+    async def load_llm(self, parameters: GeminiParams) -> FakeChatModel:
+        return FakeChatModel(responses=[AIMessage(content=parameters.llm_name)])
+
+
+@pytest.fixture
+def model_factory(monkeypatch):
+    monkeypatch.setitem(ModelFactory._registry, GeminiParams.MODEL_TYPE, FakeLoader())
+    return ModelFactory()
+
+
+def test_params_for_falls_back_from_role_to_default():
+    routing = ModelRoutingConfig(
+        default=FLASH,
+        output=PARSER,
+        roles={
+            "improver": RoleModelParams(llm=STRONG),
+            "analysis": RoleModelParams(output=FLASH),
+        },
+    )
+
+    assert routing.params_for("improver") == STRONG
+    assert routing.params_for("improver", "output") == PARSER
+    assert routing.params_for("analysis", "output") == FLASH
+    assert routing.params_for("finder") == FLASH
+    assert ModelRoutingConfig(default=FLASH).params_for("finder", "output") == FLASH
+
+
+@pytest.mark.asyncio
+async def test_from_routing_config_shares_models_with_equal_params(model_factory):
+    routing = ModelRoutingConfig(
+        default=FLASH,
+        output=PARSER,
+        roles={
+            "improver": RoleModelParams(llm=STRONG),
+            "failure_analysis": RoleModelParams(llm=STRONG),
+        },
+    )
+
+    supervisor = await TestSupervisorAgent.from_routing_config(
+        routing,
+        finder_tools=[],
+        validation_tools=[],
+        failure_analysis_tools=[],
+        model_factory=model_factory,
+    )
+
+    improver = supervisor.improver_agent
+    assert improver.model is supervisor.failure_analysis_agent.model
+    assert improver.model is not supervisor.analysis_agent.model
+    assert improver.output_model is supervisor.analysis_agent.output_model
+    assert improver.output_models == [improver.output_model, improver.model]
+
+
+@pytest.mark.asyncio
+async def test_model_usage_report_per_role_and_node_type():
+    metrics.reset()
+    usage = {"input_tokens": 120, "output_tokens": 30, "total_tokens": 150}
+    model = FakeChatModel(
+        responses=[AIMessage(content="analysis", usage_metadata=usage)]
+    )
+    output_model = FakeChatModel(
+        structured_responses=[
+            TestFileAnalysis(
+                test_headers_indentation=2,
+                last_single_test_line_number=9,
+                last_import_line_number=1,
+            )
+        ],
+    )
+    agent = TestAnalysisAgent(model=model, output_model=output_model)
+
+    await agent.get_agent().ainvoke(
+        TestAnalysisState(messages=[HumanMessage(content="analyze the test file")])
+    )
+
+    report = {(usage.role, usage.node_type): usage for usage in model_usage_report()}
+    assert set(report) == {("analysis", "llm"), ("analysis", "output")}
+    assert report[("analysis", "llm")].input_tokens == 120
+    assert report[("analysis", "llm")].output_tokens == 30
+    assert report[("analysis", "output")].calls == 1
+    assert model._structured_index == 0
@@ -0,0 +1,78 @@
+from app.llm.output_parser import parse_output_locally
+from app.schemas.structured_output import TestCoverage, TestFileAnalysis
+
+
+def test_parse_plain_json():
+    content = '{"test_headers_indentation": 2, "last_single_test_line_number": 9, "last_import_line_number": 1}'
+
+    result = parse_output_locally(content, TestFileAnalysis)
+
+    assert result == TestFileAnalysis(
+        test_headers_indentation=2,
+        last_single_test_line_number=9,
+        last_import_line_number=1,
+    )
+
+
+def test_parse_fenced_code_block_with_trailing_comma():
+    content = """Here is the analysis:
+```json
+{
+  "test_headers_indentation": 2,
+  "last_single_test_line_number": 9,
+  "last_import_line_number": 1,
+}
+```"""
+
+    result = parse_output_locally(content, TestFileAnalysis)
+
+    assert result.last_single_test_line_number == 9
+
+
+def test_parse_embedded_object_with_python_literals():
+    content = 'Result: {"stdout": "", "stderr": None, "coverage_percent": 80, "uncovered_lines": [3, 4]} done'
+
+    result = parse_output_locally(content, TestCoverage)
+
+    assert result.stderr is None
+    assert result.uncovered_lines == [3, 4]
+
+
+def test_repair_keeps_python_literals_inside_strings():
+    content = '{"stdout": "expect(x).toBe(None) is True", "stderr": None, "coverage_percent": 80, "uncovered_lines": [3, 4],}'
+
+    result = parse_output_locally(content, TestCoverage)
+
+    assert result.stdout == "expect(x).toBe(None) is True"
+    assert result.stderr is None
+
+
+def test_parse_pydantic_repr_from_tool():
+    content = str(
+        TestCoverage(stdout="ok", stderr="", coverage_percent=100, uncovered_lines=[])
+    )
+
+    result = parse_output_locally(content, TestCoverage)
+
+    assert result.coverage_percent == 100
+    assert result.stdout == "ok"
+
+
+def test_parse_content_blocks():
+    content = [
+        {
+            "type": "text",
+            "text": '{"stdout": "", "stderr": "", "coverage_percent": 50, "uncovered_lines": [1]}',
+        }
+    ]
+
+    result = parse_output_locally(content, TestCoverage)
+
+    assert result.coverage_percent == 50
+
+
+def test_parse_returns_none_for_free_text():
+    assert (
+        parse_output_locally("The last import is on line 1.", TestFileAnalysis) is None
+    )
+    assert parse_output_locally('{"coverage_percent": 10}', TestCoverage) is None
@@ -0,0 +1,133 @@
+import pytest
+
+from app.core.metrics import metrics
+from app.exceptions.node_exception import (
+    EmptyOutputException,
+    InvalidReasoningException,
+)
+from app.llm.retry import (
+    RETRY_BUDGET_EXHAUSTED,
+    RETRY_SLEEP_SECONDS,
+    AdaptiveRetryPolicy,
+    RetryRule,
+    retry_after_seconds,
+    retry_budget_scope,
+)
+
+
+class RateLimitError(Exception):
+    code = 429
+
+    def __init__(self, retry_after: float):
+        super().__init__("rate limited")
+        self.retry_after = retry_after
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+
+    async def fake_sleep(seconds):
+        recorded.append(seconds)
+
+    monkeypatch.setattr("app.llm.retry.asyncio.sleep", fake_sleep)
+    return recorded
+
+
+def _flaky_node(errors):
+    calls = []
+
+    async def node(state):
+        calls.append(state)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return {"attempts": len(calls)}
+
+    return node, calls
+
+
+def _policy():
+    return AdaptiveRetryPolicy(
+        rules={
+            InvalidReasoningException: RetryRule(
+                max_attempts=3, base_delay=1.0, max_delay=1.5
+            ),
+            EmptyOutputException: RetryRule(max_attempts=1),
+        },
+        rate_limit_rule=RetryRule(max_attempts=2, base_delay=0.0),
+    )
+
+
+@pytest.mark.asyncio
+async def test_retries_with_full_jitter(sleeps):
+    metrics.reset()
+    node, _ = _flaky_node([InvalidReasoningException(), InvalidReasoningException()])
+
+    result = await _policy().wrap(node)({})
+
+    assert result == {"attempts": 3}
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1.0
+    assert 0 <= sleeps[1] <= 1.5
+    assert metrics.timing(RETRY_SLEEP_SECONDS).count == 2
+
+
+@pytest.mark.asyncio
+async def test_per_exception_rules(sleeps):
+    node, calls = _flaky_node([EmptyOutputException()])
+
+    with pytest.raises(EmptyOutputException):
+        await _policy().wrap(node)({})
+
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_unknown_exceptions_are_not_retried(sleeps):
+    node, calls = _flaky_node([ValueError()])
+
+    with pytest.raises(ValueError):
+        await _policy().wrap(node)({})
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_waits_for_retry_after(sleeps):
+    node, _ = _flaky_node([RateLimitError(retry_after=7)])
+
+    await _policy().wrap(node)({})
+
+    assert sleeps == [7.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_is_shared_within_scope(sleeps):
+    metrics.reset()
+    policy = _policy()
+    first, _ = _flaky_node([InvalidReasoningException()])
+    second, _ = _flaky_node([InvalidReasoningException()])
+
+    with retry_budget_scope(max_retries=1) as budget:
+        await policy.wrap(first)({})
+        with pytest.raises(InvalidReasoningException):
+            await policy.wrap(second)({})
+
+    assert budget.remaining == 0
+    assert metrics.counter(RETRY_BUDGET_EXHAUSTED) == 1
+
+
+def test_retry_after_from_headers_and_details():
+    class Response:
+        headers = {"retry-after": "12"}
+
+    class HeaderError(Exception):
+        response = Response()
+
+    class DetailError(Exception):
+        details = [{"@type": "RetryInfo", "retryDelay": "3.5s"}]
+
+    assert retry_after_seconds(HeaderError()) == 12.0
+    assert retry_after_seconds(DetailError()) == 3.5
+    assert retry_after_seconds(ValueError()) is None
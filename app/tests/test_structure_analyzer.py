@@ -0,0 +1,117 @@
+import pytest
+
+from app.core.metrics import metrics
+from app.core.structure_analyzer import analyze_test_structure
+from app.llm.agent.supervisor_agent import (
+    ANALYSIS_LLM,
+    ANALYSIS_LOCAL,
+    TestSupervisorAgent,
+)
+from app.schemas.structured_output import TestFile, TestFileAnalysis
+from app.tests.fake_model import FakeChatModel
+from app.tests.test_supervisor_agent import (
+    FakeAnalysisAgent,
+    FakeFailureAnalysisAgent,
+    FakeImproverAgent,
+    FakeValidationAgent,
+)
+
+TRICKY_TEST_FILE = """\
+import { describe, test, expect } from 'vitest';
+import {
+  render,
+  screen,
+} from 'shared-utils-test';
+import '@testing-library/jest-dom'
+
+vi.mock('../api', () => ({ fetch: vi.fn() }));
+
+describe('<Button/> Test', () => {
+  const pattern = /[)}]/g;
+  const label = `x ${flag ? '}' : `${name}`} )`;
+  test('renders', () => {
+    render(<Button onClick={handleClick} />); // )
+    expect(screen.getByText('button')).toBeInTheDocument();
+  });
+  it.each([1, 2])('case %s', (n) => {
+    /* } */
+    render(<Button>{n}</Button>);
+  });
+});
+"""
+
+
+def test_analyzer_skips_strings_comments_regexes_and_jsx():
+    structure = analyze_test_structure(TRICKY_TEST_FILE)
+
+    assert structure.confident
+    assert structure.analysis == TestFileAnalysis(
+        test_headers_indentation=2,
+        last_single_test_line_number=20,
+        last_import_line_number=6,
+    )
+
+
+@pytest.mark.parametrize(
+    "content, reason",
+    [
+        ("describe('x', () => {\n  test('a', () => {\n", "unclosed"),
+        ("import { a } from 'a';\nconst b = 1;\n", "no test"),
+        ("test('a', () => {});\n  test('b', () => {});\n", "mixed"),
+        ("test('it\\'s', () => {\n  const s = 'open;\n});\n", "unterminated"),
+    ],
+)
+def test_analyzer_is_not_confident_on_unusual_layouts(content, reason):
+    structure = analyze_test_structure(content)
+
+    assert not structure.confident
+    assert reason in structure.reasons[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content, uses_llm",
+    [
+        ("describe('<Button/> Test', () => {\n  test('a', () => {});\n});", False),
+        ("describe('<Button/> Test', () => {\n  test('a', () => {});\n", True),
+    ],
+)
+async def test_supervisor_calls_the_analysis_agent_only_when_not_confident(
+    content, uses_llm
+):
+    class CountingAnalysisAgent(FakeAnalysisAgent):
+        calls = 0
+
+        async def analyze_vitest(self, **kwargs) -> TestFileAnalysis:
+            self.calls += 1
+            return await super().analyze_vitest(**kwargs)
+
+    class FakeFinderAgent:
+        async def find_or_generate_vitest_file(self, **kwargs) -> TestFile:
+            return TestFile(
+                language="typescript",
+                name="Button.test.tsx",
+                content=content,
+                path="src/__tests__/Button.test.tsx",
+            )
+
+    metrics.reset()
+    analysis_agent = CountingAnalysisAgent()
+    supervisor = TestSupervisorAgent(
+        model=FakeChatModel(),
+        finder_agent=FakeFinderAgent(),
+        analysis_agent=analysis_agent,
+        validation_agent=FakeValidationAgent({}, baseline=100),
+        failure_analysis_agent=FakeFailureAnalysisAgent(),
+        improver_agent=FakeImproverAgent([[]]),
+    )
+
+    await supervisor.cover_test(
+        source_file_name="Button.tsx",
+        source_file_path="src/Button.tsx",
+        source_file_content="export const Button = () => null;",
+    )
+
+    assert analysis_agent.calls == int(uses_llm)
+    assert metrics.counter(ANALYSIS_LLM) == int(uses_llm)
+    assert metrics.counter(ANALYSIS_LOCAL) == int(not uses_llm)
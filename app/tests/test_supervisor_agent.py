@@ -0,0 +1,472 @@
+from typing import List
+
+import asyncio
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from app.core.metrics import metrics
+from app.core.utilization import LLM_STAGE, RUNNER_STAGE, utilization
+from app.llm.agent.supervisor_agent import PIPELINE_PREFETCH_USED, TestSupervisorAgent
+from app.llm.checkpoint import open_checkpointer
+from app.schemas.state import TestSupervisorState
+from app.schemas.structured_output import (
+    NewTests,
+    SingleTest,
+    SourceFile,
+    TestCoverage,
+    TestFailureAnalysis,
+    TestFile,
+    TestFileAnalysis,
+)
+from app.tests.fake_model import FakeChatModel
+
+BASE_TEST_FILE = "\n".join(
+    [
+        "import { render } from 'shared-utils-test';",
+        "describe('<Button/> Test', () => {",
+        "  test('a', () => {});",
+        "});",
+    ]
+)
+
+
+def _single_test(name: str, lines_to_cover: str = "[1]") -> SingleTest:
+    return SingleTest(
+        test_behavior=f"{name} behavior",
+        lines_to_cover=lines_to_cover,
+        test_name=name,
+        test_code=f"test('{name}', () => {{}});",
+        new_imports_code="",
+        test_tags="happy path",
+    )
+
+
+def _coverage(coverage_percent, failed_tests: List[str] = []):
+    return TestCoverage(
+        stdout="\n".join(f" × <Button/> Test > {name} 3ms" for name in failed_tests),
+        stderr="" if coverage_percent else "AssertionError",
+        coverage_percent=coverage_percent,
+        uncovered_lines=[5, 6],
+    )
+
+
+class FakeFinderAgent:
+    async def find_or_generate_vitest_file(self, **kwargs) -> TestFile:
+        return TestFile(
+            language="typescript",
+            name="Button.test.tsx",
+            content=BASE_TEST_FILE,
+            path="src/__tests__/Button.test.tsx",
+        )
+
+
+class FakeAnalysisAgent:
+    async def analyze_vitest(self, **kwargs) -> TestFileAnalysis:
+        return TestFileAnalysis(
+            test_headers_indentation=2,
+            last_single_test_line_number=3,
+            last_import_line_number=1,
+        )
+
+
+class FakeValidationAgent:
+    """
+    테스트 파일 내용에 포함된 테스트 이름으로 커버리지를 정한다
+    """
+
+    def __init__(
+        self,
+        coverage_by_test: dict,
+        baseline: int = 40,
+        latency=0.0,
+        reports_failed_tests=True,
+    ):
+        self.coverage_by_test = coverage_by_test
+        self.baseline = baseline
+        self.latency = latency
+        self.reports_failed_tests = reports_failed_tests
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+
+    async def validate_vitest(self, test_file_content: str, **kwargs) -> TestCoverage:
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        with utilization.track(RUNNER_STAGE):
+            await asyncio.sleep(self.latency)
+        self.running -= 1
+        coverage_percent = self.baseline
+        failed_tests = []
+        for test_name, coverage in self.coverage_by_test.items():
+            if f"test('{test_name}'" in test_file_content:
+                if coverage is None:
+                    failed_tests.append(test_name)
+                else:
+                    coverage_percent = max(coverage_percent, coverage)
+        if failed_tests:
+            return _coverage(None, failed_tests if self.reports_failed_tests else [])
+        return _coverage(coverage_percent)
+
+
+class FakeFailureAnalysisAgent:
+    def __init__(self):
+        self.calls = 0
+
+    async def analyze_vitest_failure(self, **kwargs) -> TestFailureAnalysis:
+        self.calls += 1
+        return TestFailureAnalysis(
+            failure_reason="AssertionError",
+            explanation="The assertion does not hold",
+            suggestions=["Fix the assertion"],
+        )
+
+
+class FakeImproverAgent:
+    def __init__(self, rounds: List[List[SingleTest]], latency=0.0):
+        self.rounds = rounds
+        self.latency = latency
+        self.calls = 0
+
+    async def generate_vitest_test(self, **kwargs) -> NewTests:
+        new_tests = self.rounds[min(self.calls, len(self.rounds) - 1)]
+        self.calls += 1
+        with utilization.track(LLM_STAGE):
+            await asyncio.sleep(self.latency)
+        return NewTests.model_construct(
+            language="typescript",
+            existing_test_function_signature="test('a', () => {});",
+            new_tests=new_tests,
+        )
+
+
+@pytest.fixture(params=["sequential", "parallel", "batch"])
+def validation_mode(request):
+    return request.param
+
+
+def _supervisor(
+    validation_agent, improver_agent, validation_mode="parallel"
+) -> TestSupervisorAgent:
+    supervisor = TestSupervisorAgent(
+        model=FakeChatModel(),
+        finder_agent=FakeFinderAgent(),
+        analysis_agent=FakeAnalysisAgent(),
+        validation_agent=validation_agent,
+        failure_analysis_agent=FakeFailureAnalysisAgent(),
+        improver_agent=improver_agent,
+    )
+    supervisor.validation_mode = validation_mode
+    return supervisor
+
+
+async def _cover_button(supervisor: TestSupervisorAgent):
+    return await supervisor.cover_test(
+        source_file_name="Button.tsx",
+        source_file_path="src/Button.tsx",
+        source_file_content="export const Button = () => null;",
+    )
+
+
+@pytest.mark.asyncio
+async def test_cover_test_keeps_improving_tests_until_target(validation_mode):
+    improver = FakeImproverAgent(
+        [[_single_test("renders"), _single_test("broken"), _single_test("disabled")]]
+    )
+    validation = FakeValidationAgent({"renders": 70, "broken": None, "disabled": 100})
+    supervisor = _supervisor(validation, improver, validation_mode)
+
+    result = await _cover_button(supervisor)
+
+    assert result.coverage_percent == 100
+    assert "test('renders'" in result.test_file.content
+    assert "test('disabled'" in result.test_file.content
+    assert "test('broken'" not in result.test_file.content
+    assert result.test_file.path == "src/__tests__/Button.test.tsx"
+    assert improver.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cover_test_records_failures_and_stops_on_plateau(validation_mode):
+    improver = FakeImproverAgent([[_single_test("broken"), _single_test("redundant")]])
+    validation = FakeValidationAgent({"broken": None, "redundant": 40})
+    supervisor = _supervisor(validation, improver, validation_mode)
+    supervisor.max_iterations = 10
+    supervisor.plateau_rounds = 2
+
+    state = await supervisor.get_agent().ainvoke(
+        TestSupervisorState(
+            messages=[],
+            source_file=SourceFile(
+                language="typescript",
+                name="Button.tsx",
+                content="export const Button = () => null;",
+                path="src/Button.tsx",
+            ),
+        )
+    )
+
+    assert improver.calls == 2
+    assert state["rounds_without_improvement"] == 2
+    assert [
+        report.failed_single_test.test_name for report in state["failed_test_reports"]
+    ] == ["broken", "broken"]
+    assert state["structured_response"].coverage_percent == 40
+    assert state["structured_response"].test_file.content == BASE_TEST_FILE
+
+
+@pytest.mark.asyncio
+async def test_cover_test_stops_at_max_iterations(validation_mode):
+    improver = FakeImproverAgent(
+        [[_single_test("first")], [_single_test("second")], [_single_test("third")]]
+    )
+    validation = FakeValidationAgent({"first": 50, "second": 60, "third": 70})
+    supervisor = _supervisor(validation, improver, validation_mode)
+    supervisor.max_iterations = 2
+
+    result = await _cover_button(supervisor)
+
+    assert improver.calls == 2
+    assert result.coverage_percent == 60
+
+
+@pytest.mark.asyncio
+async def test_parallel_validation_fans_out_up_to_the_limit():
+    improver = FakeImproverAgent([[_single_test(f"case_{i}") for i in range(5)]])
+    validation = FakeValidationAgent(
+        {f"case_{i}": 50 + i for i in range(5)}, latency=0.05
+    )
+    supervisor = _supervisor(validation, improver)
+    supervisor.validation_parallelism = 3
+    supervisor.max_iterations = 1
+
+    result = await _cover_button(supervisor)
+
+    assert validation.max_running == 3
+    assert result.coverage_percent == 54
+    assert all(f"test('case_{i}'" in result.test_file.content for i in range(5))
+
+
+@pytest.mark.asyncio
+async def test_parallel_merge_keeps_best_candidate_when_combination_fails():
+    class ConflictingValidationAgent(FakeValidationAgent):
+        async def validate_vitest(self, test_file_content: str, **kwargs):
+            if "test('renders'" in test_file_content and "test('disabled'" in (
+                test_file_content
+            ):
+                return _coverage(None)
+            return await super().validate_vitest(test_file_content, **kwargs)
+
+    improver = FakeImproverAgent([[_single_test("renders"), _single_test("disabled")]])
+    validation = ConflictingValidationAgent({"renders": 60, "disabled": 80})
+    supervisor = _supervisor(validation, improver)
+    supervisor.max_iterations = 1
+
+    result = await _cover_button(supervisor)
+
+    assert result.coverage_percent == 80
+    assert "test('disabled'" in result.test_file.content
+    assert "test('renders'" not in result.test_file.content
+
+
+@pytest.mark.asyncio
+async def test_batch_validation_runs_the_file_once_plus_one_reverification():
+    improver = FakeImproverAgent(
+        [
+            [_single_test(f"case_{i}") for i in range(5)]
+            + [_single_test("broken"), _single_test("flaky")]
+        ]
+    )
+    validation = FakeValidationAgent(
+        {**{f"case_{i}": 50 + i for i in range(5)}, "broken": None, "flaky": None}
+    )
+    supervisor = _supervisor(validation, improver, "batch")
+    supervisor.max_iterations = 1
+
+    state = await supervisor.get_agent().ainvoke(
+        TestSupervisorState(
+            messages=[],
+            source_file=SourceFile(
+                language="typescript",
+                name="Button.tsx",
+                content="export const Button = () => null;",
+                path="src/Button.tsx",
+            ),
+        )
+    )
+
+    # 기준 커버리지 1회 + 일괄 실행 1회 + 실패 테스트를 뺀 재확인 1회
+    assert validation.calls == 3
+    assert state["structured_response"].coverage_percent == 54
+    assert [
+        report.failed_single_test.test_name for report in state["failed_test_reports"]
+    ] == ["broken", "flaky"]
+    # 같은 일괄 실행 결과의 실패 분석은 한 번만 한다
+    assert supervisor.failure_analysis_agent.calls == 1
+    assert [
+        (outcome.single_test.test_name, outcome.passed)
+        for outcome in state["batch_outcomes"]
+    ] == [(f"case_{i}", True) for i in range(5)] + [
+        ("broken", False),
+        ("flaky", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_validation_rejects_passing_tests_that_cover_no_new_lines():
+    class LineCoverageValidationAgent(FakeValidationAgent):
+        """
+        테스트 이름마다 덮는 라인을 정해 uncovered_lines 와 커버리지를 계산한다
+        """
+
+        covered_by_test = {"renders": {1, 2}, "disabled": {3}, "noop": set()}
+
+        async def validate_vitest(self, test_file_content: str, **kwargs):
+            self.calls += 1
+            uncovered = set(range(1, 11))
+            for test_name, lines in self.covered_by_test.items():
+                if f"test('{test_name}'" in test_file_content:
+                    uncovered -= lines
+            return TestCoverage(
+                stdout="",
+                stderr="",
+                coverage_percent=100 - len(uncovered) * 10,
+                uncovered_lines=sorted(uncovered),
+            )
+
+    improver = FakeImproverAgent(
+        [
+            [
+                _single_test("renders", "[1, 2]"),
+                _single_test("noop", "[8]"),
+                _single_test("disabled", "[3]"),
+            ]
+        ]
+    )
+    validation = LineCoverageValidationAgent({})
+    supervisor = _supervisor(validation, improver, "batch")
+    supervisor.max_iterations = 1
+
+    result = await _cover_button(supervisor)
+
+    # 기준 커버리지 1회 + 일괄 실행 1회 + 새 라인을 덮지 못한 테스트를 뺀 재확인 1회
+    assert validation.calls == 3
+    assert result.coverage_percent == 30
+    assert "test('renders'" in result.test_file.content
+    assert "test('disabled'" in result.test_file.content
+    assert "test('noop'" not in result.test_file.content
+
+
+@pytest.mark.asyncio
+async def test_batch_validation_falls_back_when_failures_are_not_attributable():
+    improver = FakeImproverAgent([[_single_test("renders"), _single_test("broken")]])
+    validation = FakeValidationAgent(
+        {"renders": 70, "broken": None}, reports_failed_tests=False
+    )
+    supervisor = _supervisor(validation, improver, "batch")
+    supervisor.max_iterations = 1
+
+    result = await _cover_button(supervisor)
+
+    assert result.coverage_percent == 70
+    assert "test('renders'" in result.test_file.content
+    assert "test('broken'" not in result.test_file.content
+
+
+@pytest.mark.asyncio
+async def test_cover_test_resumes_from_checkpoint_after_a_crash(tmp_path):
+    class CountingFinderAgent(FakeFinderAgent):
+        calls = 0
+
+        async def find_or_generate_vitest_file(self, **kwargs) -> TestFile:
+            CountingFinderAgent.calls += 1
+            return await super().find_or_generate_vitest_file(**kwargs)
+
+    class CrashingImproverAgent(FakeImproverAgent):
+        async def generate_vitest_test(self, **kwargs) -> NewTests:
+            if self.calls == 0:
+                self.calls += 1
+                raise RuntimeError("process killed")
+            return await super().generate_vitest_test(**kwargs)
+
+    improver = CrashingImproverAgent([[_single_test("renders")]])
+    validation = FakeValidationAgent({"renders": 100})
+
+    async with open_checkpointer(str(tmp_path / "checkpoints.sqlite")) as saver:
+        supervisor = TestSupervisorAgent(
+            model=FakeChatModel(),
+            finder_agent=CountingFinderAgent(),
+            analysis_agent=FakeAnalysisAgent(),
+            validation_agent=validation,
+            failure_analysis_agent=FakeFailureAnalysisAgent(),
+            improver_agent=improver,
+            checkpointer=saver,
+        )
+        supervisor.checkpoint_keep_last = 2
+        state = supervisor.build_state(
+            "Button.tsx", "src/Button.tsx", "export const Button = () => null;"
+        )
+
+        assert not await supervisor.has_checkpoint(state)
+        with pytest.raises(RuntimeError):
+            await _cover_button(supervisor)
+        assert await supervisor.has_checkpoint(state)
+        result = await _cover_button(supervisor)
+        reused = await _cover_button(supervisor)
+
+        async with saver.conn.execute("SELECT COUNT(*) FROM checkpoints") as cursor:
+            (checkpoint_count,) = await cursor.fetchone()
+
+    # 재개한 실행은 finder 와 기준 커버리지 검증을 다시 하지 않는다
+    assert CountingFinderAgent.calls == 1
+    assert validation.calls == 2
+    assert result.coverage_percent == 100
+    assert reused == result
+    assert checkpoint_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cover_test_runs_with_a_non_sqlite_checkpointer():
+    supervisor = TestSupervisorAgent(
+        model=FakeChatModel(),
+        finder_agent=FakeFinderAgent(),
+        analysis_agent=FakeAnalysisAgent(),
+        validation_agent=FakeValidationAgent({"renders": 100}),
+        failure_analysis_agent=FakeFailureAnalysisAgent(),
+        improver_agent=FakeImproverAgent([[_single_test("renders")]]),
+        checkpointer=MemorySaver(),
+    )
+
+    result = await _cover_button(supervisor)
+
+    assert result.coverage_percent == 100
+
+
+@pytest.mark.asyncio
+async def test_pipelined_improver_generates_next_batch_during_validation():
+    metrics.reset()
+    utilization.reset()
+    improver = FakeImproverAgent(
+        [
+            [_single_test("first", "[5]")],
+            [_single_test("second", "[6]")],
+            [_single_test("third", "[6]")],
+        ],
+        latency=0.05,
+    )
+    validation = FakeValidationAgent(
+        {"first": 50, "second": 60, "third": 70}, latency=0.05
+    )
+    supervisor = _supervisor(validation, improver, "sequential")
+    supervisor.pipelined = True
+    supervisor.max_iterations = 3
+
+    result = await _cover_button(supervisor)
+    report = utilization.report()
+
+    assert result.coverage_percent == 70
+    assert improver.calls == 3
+    assert metrics.counter(PIPELINE_PREFETCH_USED) == 2
+    assert report.overlap_seconds > 0.05
+    assert supervisor._prefetched_tests == {}
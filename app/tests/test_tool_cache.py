@@ -0,0 +1,118 @@
+import time
+
+import pytest
+from langchain_core.tools import StructuredTool
+
+from app.mcp.cache import CachedTool, ToolResultCache, wrap_tools_with_cache
+from app.mcp.client import tool_result_cache
+
+
+def _counting_tool(name: str, calls: list, response_format: str = "content"):
+    async def run(query: str, limit: int = 10):
+        calls.append((query, limit))
+        content = f"{name}:{query}:{limit}"
+        if response_format == "content_and_artifact":
+            return content, {"calls": len(calls)}
+        return content
+
+    return StructuredTool.from_function(
+        name=name,
+        description=f"{name} tool",
+        coroutine=run,
+        response_format=response_format,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_tool_returns_cached_result_for_same_arguments():
+    calls = []
+    cache = ToolResultCache()
+    tool = CachedTool(tool=_counting_tool("test_finder", calls), cache=cache)
+
+    first = await tool.ainvoke({"query": "Button", "limit": 5})
+    second = await tool.ainvoke({"limit": 5, "query": "Button"})
+    third = await tool.ainvoke({"query": "Input", "limit": 5})
+
+    assert first == second == "test_finder:Button:5"
+    assert third == "test_finder:Input:5"
+    assert len(calls) == 2
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_tool_keeps_artifact_for_tool_calls():
+    calls = []
+    tool = CachedTool(
+        tool=_counting_tool("codebase_tool", calls, "content_and_artifact"),
+        cache=ToolResultCache(),
+    )
+    tool_call = {
+        "name": "codebase_tool",
+        "args": {"query": "Button"},
+        "id": "1",
+        "type": "tool_call",
+    }
+
+    first = await tool.ainvoke(tool_call)
+    second = await tool.ainvoke({**tool_call, "id": "2"})
+
+    assert first.artifact == second.artifact == {"calls": 1}
+    assert second.tool_call_id == "2"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_excluded_tools_are_not_cached():
+    calls = []
+    cache = ToolResultCache(excluded_tools=["coverage_tool"])
+    tool = CachedTool(tool=_counting_tool("coverage_tool", calls), cache=cache)
+
+    await tool.ainvoke({"query": "Button"})
+    await tool.ainvoke({"query": "Button"})
+
+    assert len(calls) == 2
+    assert cache.stats().size == 0
+
+
+@pytest.mark.asyncio
+async def test_excluded_tools_invalidate_cached_results():
+    calls = []
+    cache = ToolResultCache(excluded_tools=["coverage_tool"])
+    read_file, coverage_tool = wrap_tools_with_cache(
+        [_counting_tool("read_file", calls), _counting_tool("coverage_tool", calls)],
+        cache,
+    )
+
+    await read_file.ainvoke({"query": "Button.test.tsx"})
+    await coverage_tool.ainvoke({"query": "Button.test.tsx"})
+    await read_file.ainvoke({"query": "Button.test.tsx"})
+
+    # coverage_tool 이 테스트 파일을 썼을 수 있으므로 다시 읽는다
+    assert len(calls) == 3
+    assert cache.stats().hits == 0
+    assert cache.stats().size == 1
+
+
+def test_shared_cache_skips_the_coverage_tool_by_default():
+    assert not tool_result_cache.is_cacheable("coverage_tool")
+    assert tool_result_cache.is_cacheable("test_finder")
+
+
+@pytest.mark.asyncio
+async def test_cache_entries_expire_and_evict():
+    calls = []
+    cache = ToolResultCache(max_size=1, ttl=0.05)
+    tool, other = wrap_tools_with_cache(
+        [_counting_tool("a", calls), _counting_tool("b", calls)], cache
+    )
+
+    await tool.ainvoke({"query": "x"})
+    time.sleep(0.06)
+    await tool.ainvoke({"query": "x"})
+    await other.ainvoke({"query": "x"})
+    await tool.ainvoke({"query": "x"})
+
+    assert len(calls) == 4
+    assert cache.stats().size == 1
+    assert cache.stats().hits == 0
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from langchain_core.tools import StructuredTool
+
+from app.core.utilization import (
+    LLM_STAGE,
+    RUNNER_STAGE,
+    UtilizationTracker,
+    utilization,
+)
+from app.llm.agent.validation_agent import TestValidationAgent
+from app.tests.fake_model import FakeChatModel
+
+
+@pytest.mark.asyncio
+async def test_utilization_tracks_busy_time_concurrency_and_overlap():
+    tracker = UtilizationTracker()
+
+    async def call(stage: str, delay: float, seconds: float):
+        await asyncio.sleep(delay)
+        with tracker.track(stage):
+            await asyncio.sleep(seconds)
+
+    await asyncio.gather(
+        call(LLM_STAGE, 0.0, 0.2),
+        call(LLM_STAGE, 0.0, 0.2),
+        call(RUNNER_STAGE, 0.1, 0.2),
+    )
+    report = tracker.report()
+
+    assert report.wall_seconds == pytest.approx(0.3, abs=0.05)
+    assert report.overlap_seconds == pytest.approx(0.1, abs=0.05)
+    assert report.stages[LLM_STAGE].max_concurrency == 2
+    assert report.stages[RUNNER_STAGE].max_concurrency == 1
+    assert report.busy_ratio(LLM_STAGE) == pytest.approx(2 / 3, abs=0.1)
+    assert report.mean_concurrency(LLM_STAGE) == pytest.approx(4 / 3, abs=0.15)
+    assert report.capacity_ratio(LLM_STAGE, 4) == pytest.approx(1 / 3, abs=0.05)
+    assert "runner" in report.summary(capacity={LLM_STAGE: 4})
+
+
+@pytest.mark.asyncio
+async def test_only_runner_tools_count_towards_the_runner_stage():
+    def read_file(path: str) -> str:
+        """Read a file"""
+        return "content"
+
+    def coverage_tool(path: str) -> str:
+        """Run the tests with coverage"""
+        return "coverage"
+
+    tools = {
+        tool.name: tool
+        for tool in (
+            StructuredTool.from_function(read_file),
+            StructuredTool.from_function(coverage_tool),
+        )
+    }
+    agent = TestValidationAgent(model=FakeChatModel(), tools=list(tools.values()))
+
+    utilization.reset()
+    await agent._run_tool_call(
+        tools, {"name": "read_file", "args": {"path": "a"}, "id": "1"}
+    )
+    assert RUNNER_STAGE not in utilization.report().stages
+
+    await agent._run_tool_call(
+        tools, {"name": "coverage_tool", "args": {"path": "a"}, "id": "2"}
+    )
+    assert utilization.report().stages[RUNNER_STAGE].max_concurrency == 1
@@ -0,0 +1,104 @@
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+
+from app.core.metrics import metrics
+from app.exceptions.node_exception import DeadlineExceededException
+from app.llm.agent.validation_agent import VALIDATION_DIRECT, TestValidationAgent
+from app.schemas.structured_output import TestCoverage
+from app.tests.fake_model import FakeChatModel
+
+TEST_FILE_CONTENT = "\n".join(
+    [
+        "describe('<Button/> Test', () => {",
+        "  test('renders', () => {});",
+        "});",
+    ]
+)
+
+
+def _coverage_tool(output: str, received: list) -> StructuredTool:
+    def coverage_tool(
+        source_file_name: str,
+        source_file_path: str,
+        test_file_name: str,
+        test_file_content: str,
+    ) -> str:
+        """Tool to get test coverage report for a source file and its test file"""
+        received.append(test_file_content)
+        return output
+
+    return StructuredTool.from_function(coverage_tool)
+
+
+async def _validate(agent: TestValidationAgent) -> TestCoverage:
+    return await agent.validate_vitest(
+        source_file_name="Button.tsx",
+        source_file_path="src/Button.tsx",
+        test_file_name="Button.test.tsx",
+        test_file_content=TEST_FILE_CONTENT,
+    )
+
+
+@pytest.mark.asyncio
+async def test_validation_calls_coverage_tool_without_the_model():
+    metrics.reset()
+    received = []
+    coverage = TestCoverage(
+        stdout="", stderr="", coverage_percent=80, uncovered_lines=[7]
+    )
+    model = FakeChatModel(responses=[AIMessage(content="should not be called")])
+    agent = TestValidationAgent(
+        model=model, tools=[_coverage_tool(coverage.model_dump_json(), received)]
+    )
+
+    response = await _validate(agent)
+
+    assert response == coverage
+    assert received == [TEST_FILE_CONTENT]
+    assert model._response_index == 0
+    assert model._structured_index == 0
+    assert metrics.timing(VALIDATION_DIRECT).count == 1
+
+
+@pytest.mark.asyncio
+async def test_validation_uses_the_model_only_to_interpret_raw_output():
+    received = []
+    coverage = TestCoverage(
+        stdout="", stderr="", coverage_percent=60, uncovered_lines=[3, 4]
+    )
+    model = FakeChatModel(
+        responses=[AIMessage(content="should not be called")],
+        structured_responses=[coverage],
+    )
+    agent = TestValidationAgent(
+        model=model,
+        tools=[_coverage_tool(" % Stmts | 60 | Uncovered Line #s | 3-4", received)],
+    )
+
+    response = await _validate(agent)
+
+    assert response == coverage
+    assert received == [TEST_FILE_CONTENT]
+    assert model._response_index == 0
+    assert model._structured_index == 1
+
+
+@pytest.mark.asyncio
+async def test_direct_interpretation_respects_the_node_timeout():
+    received = []
+    model = FakeChatModel(
+        responses=[AIMessage(content="should not be called")],
+        structured_responses=[None],
+        latency=1.0,
+    )
+    agent = TestValidationAgent(
+        model=model,
+        tools=[_coverage_tool(" % Stmts | 60 | Uncovered Line #s | 3-4", received)],
+    )
+    agent.node_timeout = 0.05
+
+    with pytest.raises(DeadlineExceededException):
+        await _validate(agent)
+    # 재시도와 제한 시간을 두른 파싱 노드는 한 번만 만든다
+    assert agent._output_node() is agent._output_node()
@@ -0,0 +1,27 @@
+from app.core.vitest_report import extract_test_title, parse_failed_test_titles
+
+VITEST_OUTPUT = """
+ ❯ src/__tests__/Button.test.tsx (3 tests | 2 failed) 12ms
+   ✓ <Button/> Test > Should render in DOM 4ms
+   × <Button/> Test > Should be disabled 3ms
+   × <Button/> Test > Should call the callback function on click 2ms
+
+ FAIL  src/__tests__/Button.test.tsx > <Button/> Test > Should be disabled
+AssertionError: expected <button> to be disabled
+"""
+
+
+def test_extract_test_title():
+    assert extract_test_title("test('Should render', () => {});") == "Should render"
+    assert extract_test_title("it.only(\"with 'quotes'\", async () => {})") == (
+        "with 'quotes'"
+    )
+    assert extract_test_title("const value = 1;") is None
+
+
+def test_parse_failed_test_titles():
+    assert parse_failed_test_titles(VITEST_OUTPUT) == {
+        "Should be disabled",
+        "Should call the callback function on click",
+    }
+    assert parse_failed_test_titles("") == set()
@@ -0,0 +1,107 @@
+"""
+배치 실행 동시성(1, 8, 32) 에 따른 처리량 벤치마크
+
+실행: python -m benchmarks.batch_concurrency
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+
+from app.llm.agent.analysis_agent import TestAnalysisAgent
+from app.llm.agent.failure_analysis_agent import TestFailureAnalysisAgent
+from app.llm.agent.finder_agent import TestFinderAgent
+from app.llm.agent.improver_agent import TestImproverAgent
+from app.llm.agent.supervisor_agent import TestSupervisorAgent
+from app.llm.agent.validation_agent import TestValidationAgent
+from app.llm.batch_runner import BatchRunner, resolve_source_paths
+from app.schemas.structured_output import TestCoverage, TestFile, TestFileAnalysis
+from app.tests.fake_model import FakeChatModel
+
+FILE_COUNT = 32
+CONCURRENCY_LEVELS = [1, 8, 32]
+MODEL_LATENCY = 0.05
+
+
+def _fake_model(content: str = "", tool_calls=()) -> FakeChatModel:
+    return FakeChatModel(
+        responses=[AIMessage(content=content, tool_calls=list(tool_calls))],
+        latency=MODEL_LATENCY,
+    )
+
+
+def run_vitest(test_file_name: str) -> str:
+    """Run vitest for the test file and report the coverage"""
+    return TestCoverage(
+        stdout="", stderr="", coverage_percent=100, uncovered_lines=[]
+    ).model_dump_json()
+
+
+def _supervisor() -> TestSupervisorAgent:
+    # 기준 커버리지가 100% 이므로 finder, analysis, validation 만 실행된다
+    test_file = TestFile(
+        language="typescript",
+        name="Button.test.tsx",
+        content="test('a', () => {});",
+        path="src/__tests__/Button.test.tsx",
+    )
+    analysis = TestFileAnalysis(
+        test_headers_indentation=2,
+        last_single_test_line_number=1,
+        last_import_line_number=0,
+    )
+    validation_tool = StructuredTool.from_function(run_vitest)
+    return TestSupervisorAgent(
+        model=_fake_model(),
+        finder_agent=TestFinderAgent(model=_fake_model(test_file.model_dump_json())),
+        analysis_agent=TestAnalysisAgent(model=_fake_model(analysis.model_dump_json())),
+        validation_agent=TestValidationAgent(
+            model=_fake_model(
+                tool_calls=[
+                    {
+                        "name": "run_vitest",
+                        "args": {"test_file_name": test_file.name},
+                        "id": "1",
+                    }
+                ]
+            ),
+            tools=[validation_tool],
+        ),
+        failure_analysis_agent=TestFailureAnalysisAgent(model=_fake_model(), tools=[]),
+        improver_agent=TestImproverAgent(model=_fake_model()),
+    )
+
+
+async def main():
+    logging.disable(logging.INFO)
+    supervisor = _supervisor()
+    with tempfile.TemporaryDirectory() as root:
+        for i in range(FILE_COUNT):
+            Path(root, f"Component{i}.tsx").write_text(
+                f"export const Component{i} = () => null;", encoding="utf-8"
+            )
+        source_paths = resolve_source_paths(["*.tsx"], root=root)
+
+        print(f"파일 {FILE_COUNT}개, 모델 호출당 지연 {MODEL_LATENCY * 1000:.0f} ms")
+        baseline = None
+        for concurrency in CONCURRENCY_LEVELS:
+            runner = BatchRunner(supervisor, concurrency=concurrency)
+            started = time.perf_counter()
+            results = await runner.run_all(source_paths)
+            elapsed = time.perf_counter() - started
+            failed = sum(not result.succeeded for result in results)
+            baseline = baseline or elapsed
+            print(
+                f"concurrency={concurrency:<3} {elapsed:7.2f} s"
+                f"  {FILE_COUNT / elapsed:6.1f} files/s"
+                f"  x{baseline / elapsed:5.1f}  failed={failed}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
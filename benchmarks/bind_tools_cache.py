@@ -0,0 +1,58 @@
+"""
+llm_node 턴마다 bind_tools 를 호출할 때와 캐싱된 결과를 재사용할 때의 비용 비교 벤치마크
+
+실행: python -m benchmarks.bind_tools_cache
+"""
+
+import time
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel, Field
+
+from app.llm.agent.base import bind_tools_cached
+from app.tests.fake_model import FakeChatModel
+
+TOOL_COUNT = 60
+TURNS = 200
+
+
+class _ToolInput(BaseModel):
+    path: str = Field(description="The path of the file")
+    query: str = Field(description="The natural language query")
+    limit: int = Field(default=10, description="The maximum number of results")
+
+
+def _make_tools():
+    return [
+        StructuredTool.from_function(
+            name=f"mcp_tool_{index}",
+            description=f"MCP tool number {index}",
+            func=lambda path, query, limit=10: "",
+            args_schema=_ToolInput,
+        )
+        for index in range(TOOL_COUNT)
+    ]
+
+
+def _measure(label: str, bind) -> float:
+    started = time.perf_counter()
+    for _ in range(TURNS):
+        bind()
+    elapsed = (time.perf_counter() - started) / TURNS * 1000
+    print(f"{label:<28} {elapsed:8.3f} ms/turn")
+    return elapsed
+
+
+def main():
+    model = FakeChatModel(responses=[AIMessage(content="")])
+    tools = _make_tools()
+    print(f"도구 수: {TOOL_COUNT}")
+    bind_tools_cached(model, tools)
+    uncached = _measure("model.bind_tools()", lambda: model.bind_tools(tools))
+    cached = _measure("bind_tools_cached()", lambda: bind_tools_cached(model, tools))
+    print(f"턴당 절감: {uncached - cached:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
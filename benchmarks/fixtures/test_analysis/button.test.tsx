@@ -0,0 +1,24 @@
+import { render, renderWithSetup, screen } from 'shared-utils-test';
+
+import Button from '../Button';
+
+describe('<Button/> Test', () => {
+  test('Should render in DOM', () => {
+    render(<Button>button</Button>);
+    const button = screen.getByRole('button', {
+      name: 'button',
+    });
+    expect(button).toBeInTheDocument();
+  });
+
+  test('Should call the callback function on click', async () => {
+    const handleClick = vitest.fn((event) => event);
+    const { user } = renderWithSetup(
+      <Button onClick={handleClick}>button</Button>,
+    );
+
+    await user.click(screen.getByRole('button', { name: 'button' }));
+
+    expect(handleClick).toHaveBeenCalledOnce();
+  });
+});
@@ -0,0 +1,18 @@
+import { parse } from '../parse';
+// test('commented out', () => {});
+
+describe('parse', () => {
+  const fixture = "it('is not a test')";
+  /*
+   * test('also not a test', () => {
+   * });
+   */
+  test('parses a call', () => {
+    expect(parse(fixture)).toEqual({ callee: 'it', args: ["'is not a test'"] });
+  });
+
+  test('keeps the ratio', () => {
+    const ratio = 10 / 2 / 5;
+    expect(ratio).toBe(1);
+  });
+});
@@ -0,0 +1,19 @@
+import { clamp } from '../clamp';
+
+describe('clamp', () => {
+  test.each([
+    [0, 1, 5, 1],
+    [3, 1, 5, 3],
+    [9, 1, 5, 5],
+  ])('clamp(%i, %i, %i) -> %i', (value, min, max, expected) => {
+    expect(clamp(value, min, max)).toBe(expected);
+  });
+
+  test.each`
+    value | expected
+    ${-1} | ${0}
+    ${11} | ${10}
+  `('clamps $value to $expected', ({ value, expected }) => {
+    expect(clamp(value, 0, 10)).toBe(expected);
+  });
+});
@@ -0,0 +1,13 @@
+import { render, screen } from 'shared-utils-test';
+import EmptyState from '../EmptyState';
+
+describe('<EmptyState/> Test', () => {
+  test('renders the message', () => {
+    render(
+      <EmptyState>
+        <p>There's nothing here yet</p>
+      </EmptyState>,
+    );
+    expect(screen.getByText(/nothing here/)).toBeInTheDocument();
+  });
+});
@@ -0,0 +1,25 @@
+import {
+  render,
+  screen,
+  waitFor,
+} from 'shared-utils-test';
+import { vi } from 'vitest';
+import type { User } from '../types';
+import UserCard from '../UserCard';
+
+vi.mock('../api', () => ({
+  fetchUser: vi.fn(() => Promise.resolve({ name: 'Kim' })),
+}));
+
+const user: User = { id: 1, name: 'Kim' };
+
+describe('<UserCard/> Test', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it('renders the user name', async () => {
+    render(<UserCard user={user} />);
+    await waitFor(() => expect(screen.getByText('Kim')).toBeInTheDocument());
+  });
+});
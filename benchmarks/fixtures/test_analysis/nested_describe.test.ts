@@ -0,0 +1,20 @@
+import { describe, expect, it } from 'vitest';
+import { formatPrice } from '../formatPrice';
+
+describe('formatPrice', () => {
+  describe('with KRW', () => {
+    it('adds a thousands separator', () => {
+      expect(formatPrice(1000, 'KRW')).toBe('1,000원');
+    });
+
+    it('rounds fractions', () => {
+      expect(formatPrice(999.5, 'KRW')).toBe('1,000원');
+    });
+  });
+
+  describe('with USD', () => {
+    it('prefixes the currency sign', () => {
+      expect(formatPrice(5, 'USD')).toBe('$5.00');
+    });
+  });
+});
@@ -0,0 +1,16 @@
+import '@testing-library/jest-dom'
+import { renderHook, act } from '@testing-library/react'
+import { useCounter } from '../useCounter'
+
+describe('useCounter', () => {
+  it('starts at zero', () => {
+    const { result } = renderHook(() => useCounter())
+    expect(result.current.count).toBe(0)
+  })
+
+  it('increments', () => {
+    const { result } = renderHook(() => useCounter())
+    act(() => result.current.increment())
+    expect(result.current.count).toBe(1)
+  })
+})
@@ -0,0 +1,10 @@
+import { expect, test } from 'vitest';
+import { slugify } from '../slugify';
+
+test('lowercases', () => {
+  expect(slugify('Hello')).toBe('hello');
+});
+
+test('replaces spaces', () => {
+  expect(slugify('a b')).toBe('a-b');
+});
@@ -0,0 +1,43 @@
+"""
+에이전트 그래프 컴파일 캐싱 벤치마크
+
+실행: python -m benchmarks.graph_cache
+"""
+
+import time
+
+from langchain_core.messages import AIMessage
+
+from app.llm.agent.analysis_agent import TestAnalysisAgent
+from app.llm.agent.finder_agent import TestFinderAgent
+from app.llm.agent.improver_agent import TestImproverAgent
+from app.tests.fake_model import FakeChatModel
+
+ITERATIONS = 200
+
+
+def _measure(label: str, get_graph) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        get_graph()
+    elapsed = (time.perf_counter() - started) / ITERATIONS * 1000
+    print(f"{label:<40} {elapsed:8.3f} ms/call")
+    return elapsed
+
+
+def main():
+    model = FakeChatModel(responses=[AIMessage(content="")])
+    agents = [
+        TestFinderAgent(model=model),
+        TestAnalysisAgent(model=model),
+        TestImproverAgent(model=model),
+    ]
+    for agent in agents:
+        name = type(agent).__name__
+        rebuild = _measure(f"{name} build()", agent.build)
+        cached = _measure(f"{name} get_agent()", agent.get_agent)
+        print(f"{name} 호출당 절감: {rebuild - cached:.3f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
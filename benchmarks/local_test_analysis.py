@@ -0,0 +1,98 @@
+"""
+로컬 구조 분석기와 TestAnalysisAgent 의 테스트 파일 분석 정확도, 지연 비교
+
+fixtures/test_analysis 의 테스트 파일과 expected.json 의 정답으로 비교한다.
+에이전트는 네트워크 없는 모델이 정답을 돌려주도록 해 LLM 호출 두 번(llm, output)의 지연만 흉내 낸다.
+hybrid 는 supervisor 와 같이 로컬 분석을 확신할 수 없을 때만 에이전트를 호출한다.
+
+실행: python -m benchmarks.local_test_analysis
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from langchain_core.messages import AIMessage
+
+from app.core.structure_analyzer import analyze_test_structure
+from app.llm.agent.analysis_agent import TestAnalysisAgent
+from app.schemas.structured_output import TestFileAnalysis
+from app.tests.fake_model import FakeChatModel
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "test_analysis"
+ITERATIONS = 200
+MODEL_LATENCY = 0.05
+
+
+def _corpus():
+    expected = json.loads((FIXTURE_DIR / "expected.json").read_text(encoding="utf-8"))
+    return [
+        (
+            name,
+            (FIXTURE_DIR / name).read_text(encoding="utf-8"),
+            TestFileAnalysis.model_validate(analysis),
+        )
+        for name, analysis in expected.items()
+    ]
+
+
+def _agent(expected: TestFileAnalysis) -> TestAnalysisAgent:
+    return TestAnalysisAgent(
+        model=FakeChatModel(
+            responses=[AIMessage(content=expected.model_dump_json())],
+            structured_responses=[expected],
+            latency=MODEL_LATENCY,
+        )
+    )
+
+
+async def main():
+    corpus = _corpus()
+    print(
+        f"테스트 파일 {len(corpus)}개, 모델 호출당 지연 {MODEL_LATENCY * 1000:.0f} ms"
+    )
+
+    local_correct = confident_count = confident_wrong = 0
+    local_ms = agent_ms = hybrid_ms = 0.0
+    for name, content, expected in corpus:
+        started = time.perf_counter()
+        for _ in range(ITERATIONS):
+            structure = analyze_test_structure(content)
+        elapsed_local = (time.perf_counter() - started) / ITERATIONS * 1000
+
+        agent = _agent(expected)
+        started = time.perf_counter()
+        agent_analysis = await agent.analyze_vitest(test_file_content=content)
+        elapsed_agent = (time.perf_counter() - started) * 1000
+
+        correct = structure.analysis == expected
+        local_correct += correct
+        confident_count += structure.confident
+        confident_wrong += structure.confident and not correct
+        local_ms += elapsed_local
+        agent_ms += elapsed_agent
+        hybrid_ms += elapsed_local + (0 if structure.confident else elapsed_agent)
+        assert agent_analysis == expected
+        print(
+            f"{name:<28} local {elapsed_local:6.3f} ms"
+            f" {'confident' if structure.confident else 'fallback ':<9}"
+            f" {'correct' if correct else 'wrong' if structure.analysis else '-':<7}"
+            f" agent {elapsed_agent:7.2f} ms"
+            f"  {'; '.join(structure.reasons)}"
+        )
+
+    count = len(corpus)
+    print(
+        f"local  정확도 {local_correct}/{count},"
+        f" 확신 {confident_count}/{count}, 확신했지만 틀림 {confident_wrong}"
+    )
+    print(f"local  {local_ms / count:8.3f} ms/file")
+    print(f"agent  {agent_ms / count:8.3f} ms/file")
+    print(
+        f"hybrid {hybrid_ms / count:8.3f} ms/file (정확도 {count - confident_wrong}/{count})"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
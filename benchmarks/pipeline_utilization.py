@@ -0,0 +1,148 @@
+"""
+단계를 차례로 실행할 때와 파이프라인으로 겹쳐 실행할 때의 처리 시간과 LLM, runner 사용률 비교
+
+실행: python -m benchmarks.pipeline_utilization
+"""
+
+import asyncio
+import itertools
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+
+from app.core.utilization import utilization
+from app.llm.agent.analysis_agent import TestAnalysisAgent
+from app.llm.agent.failure_analysis_agent import TestFailureAnalysisAgent
+from app.llm.agent.finder_agent import TestFinderAgent
+from app.llm.agent.improver_agent import TestImproverAgent
+from app.llm.agent.supervisor_agent import TestSupervisorAgent
+from app.llm.agent.validation_agent import TestValidationAgent
+from app.llm.batch_runner import BatchRunner, resolve_source_paths
+from app.schemas.structured_output import (
+    NewTests,
+    SingleTest,
+    TestCoverage,
+    TestFile,
+    TestFileAnalysis,
+)
+from app.tests.fake_model import FakeChatModel
+
+FILE_COUNT = 8
+MAX_ITERATIONS = 3
+MODEL_LATENCY = 0.05
+RUNNER_LATENCY = 0.15
+
+_coverage_runs = itertools.count()
+
+
+def _fake_model(*contents: str, tool_calls=()) -> FakeChatModel:
+    return FakeChatModel(
+        responses=[
+            AIMessage(content=content, tool_calls=list(tool_calls))
+            for content in contents or [""]
+        ],
+        latency=MODEL_LATENCY,
+    )
+
+
+async def run_vitest(test_file_name: str) -> str:
+    """Run vitest for the test file and report the coverage"""
+    await asyncio.sleep(RUNNER_LATENCY)
+    # 실행할 때마다 커버리지가 조금씩 올라 모든 후보가 채택되고 목표에는 닿지 않는다
+    return TestCoverage(
+        stdout="",
+        stderr="",
+        coverage_percent=min(99, 40 + next(_coverage_runs)),
+        uncovered_lines=[5, 6, 7],
+    ).model_dump_json()
+
+
+def _new_tests(round_index: int) -> str:
+    return NewTests(
+        language="typescript",
+        existing_test_function_signature="test('a', () => {});",
+        new_tests=[
+            SingleTest(
+                test_behavior=f"case {round_index}",
+                lines_to_cover="[5, 6, 7]",
+                test_name=f"case_{round_index}",
+                test_code=f"test('case_{round_index}', () => {{}});",
+                new_imports_code="",
+                test_tags="happy path",
+            )
+        ],
+    ).model_dump_json()
+
+
+def _supervisor(pipelined: bool) -> TestSupervisorAgent:
+    test_file = TestFile(
+        language="typescript",
+        name="Button.test.tsx",
+        content="test('a', () => {});",
+        path="src/__tests__/Button.test.tsx",
+    )
+    analysis = TestFileAnalysis(
+        test_headers_indentation=2,
+        last_single_test_line_number=1,
+        last_import_line_number=0,
+    )
+    supervisor = TestSupervisorAgent(
+        model=_fake_model(),
+        finder_agent=TestFinderAgent(model=_fake_model(test_file.model_dump_json())),
+        analysis_agent=TestAnalysisAgent(model=_fake_model(analysis.model_dump_json())),
+        validation_agent=TestValidationAgent(
+            model=_fake_model(
+                tool_calls=[
+                    {
+                        "name": "run_vitest",
+                        "args": {"test_file_name": test_file.name},
+                        "id": "1",
+                    }
+                ]
+            ),
+            tools=[StructuredTool.from_function(coroutine=run_vitest)],
+        ),
+        failure_analysis_agent=TestFailureAnalysisAgent(model=_fake_model(), tools=[]),
+        improver_agent=TestImproverAgent(
+            model=_fake_model(*(_new_tests(i) for i in range(64)))
+        ),
+    )
+    supervisor.validation_mode = "sequential"
+    supervisor.max_iterations = MAX_ITERATIONS
+    supervisor.pipelined = pipelined
+    return supervisor
+
+
+async def main():
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as root:
+        for i in range(FILE_COUNT):
+            Path(root, f"Component{i}.tsx").write_text(
+                f"export const Component{i} = () => null;", encoding="utf-8"
+            )
+        source_paths = resolve_source_paths(["*.tsx"], root=root)
+
+        print(
+            f"파일 {FILE_COUNT}개, 반복 {MAX_ITERATIONS}회,"
+            f" 모델 지연 {MODEL_LATENCY * 1000:.0f} ms,"
+            f" runner 지연 {RUNNER_LATENCY * 1000:.0f} ms"
+        )
+        for pipelined in (False, True):
+            runner = BatchRunner(
+                _supervisor(pipelined), concurrency=2, pipelined=pipelined
+            )
+            utilization.reset()
+            started = time.perf_counter()
+            results = await runner.run_all(source_paths)
+            elapsed = time.perf_counter() - started
+            failed = sum(not result.succeeded for result in results)
+            print(f"\npipelined={pipelined!s:<5} {elapsed:6.2f} s  failed={failed}")
+            print(utilization.report().summary(capacity={"llm": 2, "runner": 2}))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
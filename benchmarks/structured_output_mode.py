@@ -0,0 +1,56 @@
+"""
+구조화 출력 모드(parse: 2회 호출, native: 1회 호출) 종단 지연 비교 벤치마크
+
+실행: python -m benchmarks.structured_output_mode
+"""
+
+import asyncio
+import time
+
+from langchain_core.messages import AIMessage
+
+from app.llm.agent.analysis_agent import TestAnalysisAgent
+from app.schemas.structured_output import TestFileAnalysis
+from app.tests.fake_model import FakeChatModel
+
+ITERATIONS = 20
+MODEL_LATENCY = 0.05
+
+
+class NativeTestAnalysisAgent(TestAnalysisAgent):
+    structured_output_mode = "native"
+
+
+def _fake_model() -> FakeChatModel:
+    return FakeChatModel(
+        responses=[AIMessage(content="last import line is 1, last test line is 9")],
+        structured_responses=[
+            TestFileAnalysis(
+                test_headers_indentation=2,
+                last_single_test_line_number=9,
+                last_import_line_number=1,
+            )
+        ],
+        latency=MODEL_LATENCY,
+    )
+
+
+async def _measure(agent: TestAnalysisAgent) -> float:
+    await agent.analyze_vitest(test_file_content="test('warmup', () => {});")
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await agent.analyze_vitest(test_file_content="test('a', () => {});")
+    return (time.perf_counter() - started) / ITERATIONS * 1000
+
+
+async def main():
+    print(f"모델 호출당 지연: {MODEL_LATENCY * 1000:.0f} ms")
+    parse = await _measure(TestAnalysisAgent(model=_fake_model()))
+    native = await _measure(NativeTestAnalysisAgent(model=_fake_model()))
+    print(f"{'parse (two-call)':<24} {parse:8.2f} ms/run")
+    print(f"{'native (one-call)':<24} {native:8.2f} ms/run")
+    print(f"절감: {parse - native:.2f} ms/run ({(1 - native / parse) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
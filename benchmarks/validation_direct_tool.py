@@ -0,0 +1,119 @@
+"""
+커버리지 도구를 LLM 도구 호출로 실행할 때와 직접 호출할 때의 검증 지연, 출력 토큰 비교
+
+LLM 이 테스트 파일 전체를 도구 인자로 다시 출력하는 비용은 출력 토큰 수에 비례한 디코딩 시간으로 흉내 낸다.
+토큰 수는 4글자당 1토큰으로 어림한다.
+
+실행: python -m benchmarks.validation_direct_tool
+"""
+
+import asyncio
+import json
+import time
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+
+from app.core.metrics import metrics
+from app.llm.agent.validation_agent import TestValidationAgent
+from app.llm.model_usage import model_usage_report
+from app.schemas.structured_output import TestCoverage
+from app.tests.fake_model import FakeChatModel
+
+ITERATIONS = 10
+TEST_COUNTS = [5, 20, 80]
+MODEL_BASE_LATENCY = 0.05
+# 출력 토큰당 디코딩 시간
+MODEL_TOKEN_LATENCY = 0.0005
+
+
+def coverage_tool(
+    source_file_name: str,
+    source_file_path: str,
+    test_file_name: str,
+    test_file_content: str,
+) -> str:
+    """Tool to get test coverage report for a source file and its test file"""
+    return TestCoverage(
+        stdout="", stderr="", coverage_percent=90, uncovered_lines=[12]
+    ).model_dump_json()
+
+
+def _test_file(test_count: int) -> str:
+    tests = [
+        "\n".join(
+            [
+                f"  test('case {i}', async () => {{",
+                f"    const {{ user }} = renderWithSetup(<Button>case {i}</Button>);",
+                "    await user.click(screen.getByRole('button'));",
+                "    expect(screen.getByRole('button')).toBeInTheDocument();",
+                "  });",
+            ]
+        )
+        for i in range(test_count)
+    ]
+    return "describe('<Button/> Test', () => {\n" + "\n\n".join(tests) + "\n});"
+
+
+def _tool_calling_model(test_file_content: str) -> FakeChatModel:
+    args = {
+        "source_file_name": "Button.tsx",
+        "source_file_path": "src/Button.tsx",
+        "test_file_name": "Button.test.tsx",
+        "test_file_content": test_file_content,
+    }
+    output_tokens = len(json.dumps(args)) // 4
+    return FakeChatModel(
+        responses=[
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "coverage_tool", "args": args, "id": "1"}],
+                usage_metadata={
+                    "input_tokens": output_tokens,
+                    "output_tokens": output_tokens,
+                    "total_tokens": output_tokens * 2,
+                },
+            )
+        ],
+        latency=MODEL_BASE_LATENCY + output_tokens * MODEL_TOKEN_LATENCY,
+    )
+
+
+async def _measure(direct: bool, test_file_content: str):
+    agent = TestValidationAgent(
+        model=_tool_calling_model(test_file_content),
+        tools=[StructuredTool.from_function(coverage_tool)],
+    )
+    agent.direct_tool_call = direct
+    metrics.reset()
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await agent.validate_vitest(
+            source_file_name="Button.tsx",
+            source_file_path="src/Button.tsx",
+            test_file_name="Button.test.tsx",
+            test_file_content=test_file_content,
+        )
+    elapsed = (time.perf_counter() - started) / ITERATIONS * 1000
+    output_tokens = sum(usage.output_tokens for usage in model_usage_report())
+    return elapsed, output_tokens / ITERATIONS
+
+
+async def main():
+    print(
+        f"모델 기본 지연 {MODEL_BASE_LATENCY * 1000:.0f} ms"
+        f" + 출력 토큰당 {MODEL_TOKEN_LATENCY * 1000:.1f} ms"
+    )
+    for test_count in TEST_COUNTS:
+        test_file_content = _test_file(test_count)
+        agent_ms, agent_tokens = await _measure(False, test_file_content)
+        direct_ms, direct_tokens = await _measure(True, test_file_content)
+        print(
+            f"tests={test_count:<3} ({len(test_file_content):>6} chars)"
+            f"  llm tool call {agent_ms:7.2f} ms/run {agent_tokens:6.0f} tokens"
+            f"  direct {direct_ms:6.2f} ms/run {direct_tokens:4.0f} tokens"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())